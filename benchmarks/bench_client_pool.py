@@ -0,0 +1,55 @@
+"""
+Benchmark: per-call setup overhead of the old generate_text_with_ai path
+(genai.configure + new GenerativeModel on every call) against the shared GeminiClientPool.
+
+The network call is replaced by a stub transport that returns a canned response immediately,
+so the numbers show client setup cost only. Run from the repository root:
+
+    python benchmarks/bench_client_pool.py [--calls 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator import llm
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+
+STUB_RESPONSE = glm.GenerateContentResponse(candidates=[
+    glm.Candidate(content=glm.Content(parts=[glm.Part(text="Stub resume text")]), finish_reason=1)
+])
+
+def stub_generate_content(self, request=None, **kwargs):
+    return STUB_RESPONSE
+
+def legacy_generate(prompt, api_key):
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel(llm.DEFAULT_MODEL_NAME)
+    return model.generate_content(prompt).text.strip()
+
+def time_calls(fn, calls, api_keys):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn("Write a resume.", api_keys[i % len(api_keys)])
+    return (time.perf_counter() - start) / calls
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--keys', type=int, default=3, help="Number of distinct API keys to rotate through")
+    args = parser.parse_args()
+
+    glm.GenerativeServiceClient.generate_content = stub_generate_content
+    api_keys = [f"bench-key-{i}" for i in range(args.keys)]
+    pool = llm.GeminiClientPool(api_keys=api_keys)
+
+    legacy = time_calls(legacy_generate, args.calls, api_keys)
+    pooled = time_calls(pool.generate, args.calls, api_keys)
+
+    print(f"calls={args.calls} keys={args.keys}")
+    print(f"legacy configure-per-call: {legacy * 1e3:8.3f} ms/call")
+    print(f"client pool:               {pooled * 1e3:8.3f} ms/call")
+    print(f"saved per call:            {(legacy - pooled) * 1e3:8.3f} ms ({legacy / pooled:.1f}x faster)")
@@ -0,0 +1,203 @@
+"""
+End-to-end benchmark suite: throughput, latency percentiles and peak memory for parsing, rendering and
+the full per-candidate pipeline, across candidates with 1 to 50 experiences.
+
+Inputs come from the fixtures (see fake_llm.py): the synthetic user_data corpus and the recorded outputs,
+replayed by RecordedGeminiClient with a configurable latency. Results are compared with the stored
+baseline (e2e_baseline.json); the process exits non-zero if throughput, p95 latency or peak memory
+regress beyond the tolerances. Throughput counts documents for parse/render and candidates (a resume plus
+a cover letter) for the pipeline, whose latency is per candidate with `--iterations` candidates submitted
+at once. Peak memory is the median of `--memory-runs` runs, for the pipeline of one candidate at a time,
+as the peak of several at once varies with how their renders happen to overlap. Baselines are
+machine-specific, so record them on the machine that checks them.
+Run from the repository root:
+
+    python benchmarks/bench_e2e.py [--stages parse,render,pipeline] [--sizes 1,10,25,50] [--iterations 50]
+                                   [--latency 0.05] [--concurrency 8] [--memory-runs 7] [--update-baseline]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from fake_llm import RecordedGeminiClient, load_corpus, load_recorded_responses
+
+from resume_generator.document import parse_document
+from resume_generator.pdf import PDFRenderer
+from resume_generator.pipeline import run_candidate_pipeline
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.sinks import OutputSink
+from resume_generator.user_input import build_output_filenames
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'e2e_baseline.json')
+
+class NullSink(OutputSink):
+    """
+    Discards documents, so the pipeline benchmark measures generation and rendering only.
+    """
+    def write(self, name, data):
+        return name
+
+def percentile(sorted_samples, q):
+    return sorted_samples[max(0, math.ceil(q * len(sorted_samples) / 100) - 1)]
+
+def summarize(latencies, elapsed, documents):
+    samples = sorted(latencies)
+    return {'throughput': round(documents / elapsed, 2),
+            **{f'p{q}_ms': round(percentile(samples, q) * 1000, 3) for q in (50, 95, 99)}}
+
+def peak_memory_kib(func, runs):
+    """
+    Median peak traced memory (KiB) of `runs` calls of func.
+    """
+    peaks = []
+    for _ in range(runs):
+        tracemalloc.start()
+        try:
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return round(statistics.median(peaks) / 1024, 1)
+
+# --- Stages ---
+
+def bench_parse(user_data, texts, iterations, memory_runs):
+    def run_once():
+        for kind, text in texts.items():
+            parse_document(text, user_data['your_name'], kind == 'cover_letter')
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t = time.perf_counter()
+        run_once()
+        latencies.append(time.perf_counter() - t)
+    result = summarize(latencies, time.perf_counter() - started, iterations * len(texts))
+    result['peak_kib'] = peak_memory_kib(run_once, memory_runs)
+    return result
+
+def bench_render(user_data, texts, iterations, renderer, memory_runs):
+    sizes = []
+
+    def run_once():
+        for kind, text in texts.items():
+            sizes.append(len(renderer.render_bytes(text, user_data, kind == 'cover_letter')))
+
+    run_once()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t = time.perf_counter()
+        run_once()
+        latencies.append(time.perf_counter() - t)
+    result = summarize(latencies, time.perf_counter() - started, iterations * len(texts))
+    result['peak_kib'] = peak_memory_kib(run_once, memory_runs)
+    result['pdf_kib'] = round(sum(sizes) / len(sizes) / 1024, 1)
+    return result
+
+def bench_pipeline(user_data, iterations, client, concurrency, memory_runs):
+    pdf_names = dict(zip(('resume', 'cover_letter'), build_output_filenames(user_data)))
+
+    async def run(candidates):
+        scheduler = GenerationScheduler(client=client, max_in_flight=concurrency, max_retries=0)
+        try:
+            sink = NullSink()
+            results = await asyncio.gather(*(run_candidate_pipeline(user_data, scheduler, pdf_names, sink=sink)
+                                             for _ in range(candidates)))
+        finally:
+            scheduler.close()
+        return [r['timings']['total'] for r in results]
+
+    started = time.perf_counter()
+    latencies = asyncio.run(run(iterations))
+    result = summarize(latencies, time.perf_counter() - started, iterations)
+    # One candidate at a time: with several in flight the peak depends on how their renders happen to overlap.
+    result['peak_kib'] = peak_memory_kib(lambda: asyncio.run(run(1)), memory_runs)
+    return result
+
+# --- Baseline Comparison ---
+
+def compare(results, baseline, tolerance, memory_tolerance, slack_ms):
+    failures = []
+    for key, current in results.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+        if current['throughput'] < expected['throughput'] / tolerance:
+            failures.append(f"{key}: throughput {current['throughput']}/s, baseline {expected['throughput']}/s")
+        if current['p95_ms'] > expected['p95_ms'] * tolerance + slack_ms:
+            failures.append(f"{key}: p95 {current['p95_ms']} ms, baseline {expected['p95_ms']} ms")
+        if current['peak_kib'] > expected['peak_kib'] * memory_tolerance:
+            failures.append(f"{key}: peak memory {current['peak_kib']} KiB, baseline {expected['peak_kib']} KiB")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stages', default='parse,render,pipeline')
+    parser.add_argument('--sizes', default='1,10,25,50', help="Experience counts to benchmark (corpus records)")
+    parser.add_argument('--iterations', type=int, default=50, help="Documents (parse/render) or candidates per size")
+    parser.add_argument('--latency', type=float, default=0.05, help="Fake AI latency in seconds (pipeline stage)")
+    parser.add_argument('--chars-per-second', type=float, default=None, help="Extra fake latency per output character")
+    parser.add_argument('--concurrency', type=int, default=8, help="AI requests in flight (pipeline stage)")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Allowed throughput/latency regression factor")
+    parser.add_argument('--memory-tolerance', type=float, default=1.25, help="Allowed peak memory growth factor")
+    parser.add_argument('--memory-runs', type=int, default=7, help="Runs whose median peak memory is reported")
+    parser.add_argument('--slack-ms', type=float, default=2.0, help="Absolute p95 allowance for timer noise")
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to this file")
+    args = parser.parse_args()
+
+    stages = [s.strip() for s in args.stages.split(',') if s.strip()]
+    corpus = {len(u['experiences']): u for u in load_corpus()}
+    responses = load_recorded_responses()
+    renderer = PDFRenderer()
+    client = RecordedGeminiClient(responses, latency=args.latency, chars_per_second=args.chars_per_second)
+
+    results = {}
+    print(f"{'benchmark':<18} {'items/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KiB':>9}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        user_data = corpus[size]
+        texts = {kind: responses[(kind, user_data['your_name'])] for kind in ('resume', 'cover_letter')}
+        for stage in stages:
+            if stage == 'parse':
+                result = bench_parse(user_data, texts, args.iterations, args.memory_runs)
+            elif stage == 'render':
+                result = bench_render(user_data, texts, args.iterations, renderer, args.memory_runs)
+            elif stage == 'pipeline':
+                result = bench_pipeline(user_data, args.iterations, client, args.concurrency, args.memory_runs)
+            else:
+                raise SystemExit(f"Unknown stage: {stage}")
+            key = f"{stage}/{size}"
+            results[key] = result
+            print(f"{key:<18} {result['throughput']:>9} {result['p50_ms']:>9} {result['p95_ms']:>9} "
+                  f"{result['p99_ms']:>9} {result['peak_kib']:>9}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    if args.update_baseline:
+        baseline.update(results)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline written to {BASELINE_PATH}")
+        return 0
+
+    failures = compare(results, baseline, args.tolerance, args.memory_tolerance, args.slack_ms)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Benchmark: multi-format export from one parse.
+
+For candidates with 1 to 50 experiences, the recorded resume is rendered to every output format. Reported
+per size: the parse, each format's render time from that one parse, the total for all formats against
+parsing the text again for every format, and, through the full per-candidate pipeline, how long after
+generation ends the HTML and Markdown previews are written compared with the PDF. DOCX is included when
+python-docx is installed. Run from the repository root:
+
+    python benchmarks/bench_export.py [--sizes 1,10,25,50] [--iterations 20]
+"""
+import argparse
+import asyncio
+import importlib.util
+import statistics
+import time
+
+from fake_llm import RecordedGeminiClient, load_corpus, load_recorded_responses
+from bench_e2e import NullSink
+
+from resume_generator.document import parse_document
+from resume_generator.pipeline import run_candidate_pipeline
+from resume_generator.renderers import get_renderer
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.user_input import build_output_filenames
+
+def median_ms(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+def bench_formats(user_data, text, formats, iterations):
+    """
+    Returns ({'parse' or format: median ms}, ms for all formats from one parse, ms parsing once per format).
+    """
+    name = user_data['your_name']
+    document = parse_document(text, name)
+    row = {'parse': median_ms(lambda: parse_document(text, name), iterations)}
+    for format_name in formats:
+        renderer = get_renderer(format_name)
+        renderer.render(document, user_data)
+        row[format_name] = median_ms(lambda: renderer.render(document, user_data), iterations)
+
+    def parse_once():
+        document = parse_document(text, name)
+        for format_name in formats:
+            get_renderer(format_name).render(document, user_data)
+
+    def parse_each():
+        for format_name in formats:
+            get_renderer(format_name).render(parse_document(text, name), user_data)
+
+    return row, median_ms(parse_once, iterations), median_ms(parse_each, iterations)
+
+def bench_preview(user_data, responses, formats, iterations):
+    """
+    Returns the median delay (ms) from the end of resume generation to each format being written.
+    """
+    client = RecordedGeminiClient(responses, latency=0)
+    pdf_names = dict(zip(('resume', 'cover_letter'), build_output_filenames(user_data)))
+    exports = [f for f in formats if f != 'pdf']
+
+    async def run():
+        scheduler = GenerationScheduler(client=client, max_in_flight=2, max_retries=0)
+        try:
+            return await run_candidate_pipeline(user_data, scheduler, pdf_names, sink=NullSink(), exports=exports)
+        finally:
+            scheduler.close()
+
+    samples = {f: [] for f in formats}
+    for _ in range(iterations):
+        timings = asyncio.run(run())['timings']
+        for format_name in formats:
+            samples[format_name].append(timings['resume_render' if format_name == 'pdf' else f'resume_{format_name}'])
+    return {f: statistics.median(s) * 1000 for f, s in samples.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1,10,25,50', help="Experience counts of the corpus records to render")
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    formats = ['pdf', 'html', 'markdown']
+    if importlib.util.find_spec('docx') is not None:
+        formats.append('docx')
+    else:
+        print("python-docx is not installed; skipping the docx format.")
+
+    corpus = {len(u['experiences']): u for u in load_corpus()}
+    responses = load_recorded_responses()
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    columns = ['parse'] + formats
+    print("Render time from one parse (median ms):")
+    print(f"{'exp':>4} " + " ".join(f"{c:>9}" for c in columns) + f" {'one parse':>10} {'per format':>11}")
+    for size in sizes:
+        user_data = corpus[size]
+        text = responses[('resume', user_data['your_name'])]
+        row, once, each = bench_formats(user_data, text, formats, args.iterations)
+        print(f"{size:>4} " + " ".join(f"{row[c]:>9.2f}" for c in columns) + f" {once:>10.2f} {each:>11.2f}")
+
+    print("\nPipeline: resume file written, ms after generation ended (median):")
+    print(f"{'exp':>4} " + " ".join(f"{f:>9}" for f in formats))
+    for size in sizes:
+        delays = bench_preview(corpus[size], responses, formats, max(1, args.iterations // 4))
+        print(f"{size:>4} " + " ".join(f"{delays[f]:>9.2f}" for f in formats))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: import-time regression check for the CLI and worker entry points.
+
+Each entry module is imported in a fresh interpreter with `python -X importtime`; the cumulative time of the
+top-level import is compared with the stored baseline, and heavy optional dependencies that must stay lazy
+are reported if they get pulled in. The package is byte-compiled first, so timings match an installed
+package rather than including source compilation. Exits non-zero on a regression.
+
+Run from the repository root:
+
+    python benchmarks/bench_import_time.py [--runs 5] [--tolerance 1.5] [--slack-ms 10] [--update-baseline]
+"""
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_time_baseline.json')
+
+# Entry module -> top-level packages it must not import.
+ENTRY_POINTS = {
+    'resume_generator': ['reportlab', 'google.generativeai', 'IPython', 'google.colab'],
+    'resume_generator.cli': ['reportlab', 'google.generativeai', 'IPython', 'google.colab'],
+    'resume_generator.document': ['reportlab', 'google.generativeai', 'IPython', 'google.colab'],
+    'resume_generator.scheduler': ['reportlab', 'google.generativeai', 'IPython', 'google.colab'],
+    'resume_generator.pdf': ['google.generativeai', 'IPython', 'google.colab'],
+}
+
+def measure(module):
+    """
+    Imports `module` in a fresh interpreter and returns (cumulative microseconds, set of imported modules).
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    cumulative = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        # "import time:  <self us> | <cumulative us> | <indented module name>"
+        _, cumulative_us, name = line.split('|')
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative, imported
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per entry point; the fastest run counts")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Allowed slowdown factor over the baseline")
+    parser.add_argument('--slack-ms', type=float, default=10, help="Absolute allowance on top, for timer noise on fast imports")
+    parser.add_argument('--update-baseline', action='store_true', help="Store the current timings as the new baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    compileall.compile_dir(os.path.join(ROOT, 'resume_generator'), quiet=1)
+
+    failures = []
+    current = {}
+    print(f"{'module':<28} {'import ms':>10} {'baseline':>10}")
+    for module, forbidden in ENTRY_POINTS.items():
+        timings = []
+        for _ in range(args.runs):
+            cumulative, imported = measure(module)
+            timings.append(cumulative)
+        best = min(timings) / 1000
+        current[module] = round(best, 2)
+        expected = baseline.get(module)
+        print(f"{module:<28} {best:>10.2f} {expected if expected is not None else '-':>10}")
+
+        leaked = sorted(name for name in forbidden if name in imported)
+        if leaked:
+            failures.append(f"{module} imports {', '.join(leaked)}")
+        if expected is not None and not args.update_baseline and best > expected * args.tolerance + args.slack_ms:
+            failures.append(f"{module} took {best:.2f} ms, baseline {expected} ms "
+                            f"(x{args.tolerance} + {args.slack_ms} ms allowed)")
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline written to {BASELINE_PATH}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Benchmark: one candidate tailored to many jobs.
+
+Compares building the prompts by string concatenation (the original builder, kept here as reference) with
+the precompiled templates reusing one CandidateProfile, then runs the multi-job pipeline in each tailoring
+mode against RecordedGeminiClient and reports AI requests, prompt tokens sent, prompt tokens billed as new
+input (the shared prefix is served from context caching when it is long enough) and wall time.
+Run from the repository root:
+
+    python benchmarks/bench_multi_job.py [--jobs 50] [--experiences 25] [--latency 0.2] [--jobs-per-request 4]
+"""
+import argparse
+import asyncio
+import time
+
+from fake_llm import RecordedGeminiClient, load_corpus, load_recorded_responses
+
+from resume_generator.llm import MIN_CONTEXT_CACHE_TOKENS, estimate_tokens
+from resume_generator.multi_job import TAILOR_MODES, job_user_data, run_multi_job_pipeline
+from resume_generator.prompts import CandidateProfile, PrefixedPrompt, build_cover_letter_prompt, build_resume_prompt
+from resume_generator.scheduler import GenerationScheduler
+from bench_e2e import NullSink
+
+def legacy_resume_prompt(user_data):
+    resume_prompt = f"""
+    Generate a professional resume for {user_data['your_name']} applying for a {user_data['job_title']} position at {user_data['company_name']}.
+
+    Contact Information:
+    Name: {user_data['your_name']}
+    Email: {user_data['your_email']}
+    Phone: {user_data['your_phone']}
+    LinkedIn: {user_data['your_linkedin']}
+
+    Summary/Objective: Write a concise professional summary highlighting key skills and career goals relevant to the {user_data['job_title']} role.
+
+    Work Experience:
+    Provide detailed bullet points for each experience, focusing on achievements and quantifiable results.
+    """
+    for exp in user_data['experiences']:
+        resume_prompt += f"\n- Job Title: {exp['title']}"
+        resume_prompt += f"\n  Company: {exp['company']}"
+        resume_prompt += f"\n  Dates: {exp['dates']}"
+        for resp in exp['responsibilities']:
+            resume_prompt += f"\n  - {resp}"
+
+    resume_prompt += "\n\nEducation:"
+    for edu in user_data['education']:
+        resume_prompt += f"\n- Degree: {edu['degree']}"
+        resume_prompt += f"\n  Institution: {edu['institution']}"
+        resume_prompt += f"\n  Graduation Date: {edu['dates']}"
+
+    resume_prompt += f"\n\nSkills: {', '.join(user_data['skills'])}"
+    resume_prompt += "\n\nFormat the resume clearly with sections like 'Contact Information', 'Summary', 'Work Experience', 'Education', and 'Skills'. Use bullet points for responsibilities and achievements."
+    return resume_prompt
+
+def make_jobs(corpus, count):
+    # The job fields of the other corpus records make varied targets.
+    return [(f"job-{i + 1:02d}", {field: corpus[i % len(corpus)][field]
+                                   for field in ('job_title', 'company_name', 'hiring_manager_name', 'how_heard',
+                                                 'additional_cover_letter_points')})
+            for i in range(count)]
+
+def bench_prompt_build(user_data, jobs, rounds):
+    targets = [job_user_data(user_data, job) for _, job in jobs]
+
+    def legacy():
+        for target in targets:
+            legacy_resume_prompt(target)
+            build_cover_letter_prompt(target)
+
+    def precompiled():
+        profile = CandidateProfile(user_data)
+        for target in targets:
+            build_resume_prompt(target, profile)
+            build_cover_letter_prompt(target, profile)
+
+    assert all(legacy_resume_prompt(t) == build_resume_prompt(t) for t in targets)
+    results = {}
+    for name, func in (('concatenation', legacy), ('precompiled', precompiled)):
+        best = None
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best / len(jobs) * 1e6
+    return results
+
+class CountingClient(RecordedGeminiClient):
+    """
+    RecordedGeminiClient that keeps every prompt it was sent.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prompts = []
+
+    def reply(self, prompt):
+        self.prompts.append(prompt)
+        return super().reply(prompt)
+
+def billed_tokens(prompts):
+    # A PrefixedPrompt's prefix is billed in full once per distinct prefix and then read from the context cache.
+    total, cached = 0, set()
+    for prompt in prompts:
+        if isinstance(prompt, PrefixedPrompt) and estimate_tokens(prompt.prefix) >= MIN_CONTEXT_CACHE_TOKENS:
+            total += estimate_tokens(prompt.suffix) + (0 if prompt.prefix in cached else estimate_tokens(prompt.prefix))
+            cached.add(prompt.prefix)
+        else:
+            total += estimate_tokens(prompt)
+    return total
+
+def bench_mode(user_data, jobs, mode, responses, latency, concurrency, jobs_per_request):
+    client = CountingClient(responses, latency=latency)
+
+    async def run():
+        scheduler = GenerationScheduler(client=client, max_in_flight=concurrency, max_retries=0)
+        try:
+            return await run_multi_job_pipeline(user_data, jobs, scheduler, sink=NullSink(), mode=mode,
+                                                jobs_per_request=jobs_per_request)
+        finally:
+            scheduler.close()
+
+    started = time.perf_counter()
+    entries = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for entry in entries if entry['status'] != 'ok')
+    return {'requests': len(client.prompts), 'sent': sum(estimate_tokens(p) for p in client.prompts),
+            'billed': billed_tokens(client.prompts), 'seconds': elapsed, 'failed': failed}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=50)
+    parser.add_argument('--experiences', type=int, default=25, help="Corpus record (1-50) used as the candidate")
+    parser.add_argument('--latency', type=float, default=0.2, help="Fake AI latency per request in seconds")
+    parser.add_argument('--concurrency', type=int, default=8, help="AI requests in flight")
+    parser.add_argument('--jobs-per-request', type=int, default=4)
+    parser.add_argument('--rounds', type=int, default=20, help="Repetitions of the prompt build timing")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    user_data = {len(u['experiences']): u for u in corpus}[args.experiences]
+    jobs = make_jobs(corpus, args.jobs)
+    responses = load_recorded_responses()
+
+    build = bench_prompt_build(user_data, jobs, args.rounds)
+    print(f"Prompt build for {args.jobs} jobs ({args.experiences} experiences), both documents per job:")
+    for name, micros in build.items():
+        print(f"  {name:<14} {micros:8.1f} us/job")
+
+    print(f"\n{'mode':<10} {'requests':>9} {'tokens sent':>12} {'tokens billed':>14} {'seconds':>8} {'failed':>7}")
+    for mode in TAILOR_MODES:
+        result = bench_mode(user_data, jobs, mode, responses, args.latency, args.concurrency, args.jobs_per_request)
+        print(f"{mode:<10} {result['requests']:>9} {result['sent']:>12} {result['billed']:>14} "
+              f"{result['seconds']:>8.2f} {result['failed']:>7}")
+
+if __name__ == '__main__':
+    main()
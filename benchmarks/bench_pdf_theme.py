@@ -0,0 +1,56 @@
+"""
+Microbenchmark: per-document PDF render time when the stylesheet is rebuilt for every document
+(the old create_pdf behaviour) against rendering with one shared PDFTheme.
+
+Run from the repository root:
+
+    python benchmarks/bench_pdf_theme.py [--documents 200] [--experiences 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator import pdf
+from bench_streaming import USER_DATA, sample_resume
+
+def render_rebuilding_styles(path, text):
+    styles = pdf.build_pdf_styles()
+    builder = pdf.make_story_builder(styles, USER_DATA)
+    builder.feed(text)
+    return pdf.build_pdf(path, builder.close(), styles)
+
+def time_per_document(render, documents, path, text):
+    start = time.perf_counter()
+    for _ in range(documents):
+        render(path, text)
+    return (time.perf_counter() - start) / documents
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--experiences', type=int, default=3)
+    parser.add_argument('--rounds', type=int, default=5, help="Alternating timing rounds; the best of each is reported")
+    args = parser.parse_args()
+
+    text = sample_resume(args.experiences)
+    renderer = pdf.PDFRenderer(pdf.PDFTheme())
+    shared = lambda path, content: renderer.render(path, content, USER_DATA)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "resume.pdf")
+        # Warm up ReportLab's font and module caches before timing either variant.
+        shared(path, text)
+        rebuilt = reused = float('inf')
+        for _ in range(args.rounds):
+            rebuilt = min(rebuilt, time_per_document(render_rebuilding_styles, args.documents, path, text))
+            reused = min(reused, time_per_document(shared, args.documents, path, text))
+
+    setup = min(time_per_document(lambda p, t: pdf.build_pdf_styles(), args.documents, None, None) for _ in range(args.rounds))
+    print(f"documents={args.documents} experiences={args.experiences}")
+    print(f"stylesheet setup alone:      {setup * 1e3:8.3f} ms/document")
+    print(f"rebuild styles per document: {rebuilt * 1e3:8.3f} ms/document")
+    print(f"shared PDFTheme:             {reused * 1e3:8.3f} ms/document (saves {(rebuilt - reused) * 1e3:.3f} ms, {(rebuilt - reused) / rebuilt:.1%})")
@@ -0,0 +1,109 @@
+"""
+Benchmark: peak RSS while rendering 1, 10 and 100-page resumes.
+
+Each measurement runs in a fresh interpreter, so the peak resident set size (ru_maxrss) reflects only that
+render. ReportLab and the theme are warmed up first and the growth beyond that is reported, for three paths:
+
+    story   the whole text parsed into a full story list, then laid out (how create_pdf used to work)
+    render  PDFRenderer.render on the complete text (parse, flowables and layout run as one pipeline)
+    stream  create_pdf_from_stream on text produced chunk by chunk, as from a streamed response
+
+The PDF is written to a temporary file. With --max-growth the process exits non-zero if the render or
+stream path's RSS growth at the largest size exceeds that many MiB. Run from the repository root:
+
+    python benchmarks/bench_render_memory.py [--pages 1,10,100] [--max-growth 4]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+USER_DATA = {'your_name': 'Jane Doe'}
+MODES = ('story', 'render', 'stream')
+# One experience (heading, dates and six bullets) takes roughly a third of a letter page.
+EXPERIENCES_PER_PAGE = 3
+
+def resume_chunks(experiences):
+    """
+    Yields a resume with `experiences` positions in small pieces, one line at a time.
+    """
+    yield "Jane Doe | jane@example.com | 555-0100 | linkedin.com/in/janedoe\n\nSummary\n"
+    yield "Engineer with a track record of shipping reliable systems at scale.\n\nWork Experience\n"
+    for i in range(experiences):
+        yield f"Software Engineer | Company {i} | Jan {1990 + i % 30} - Dec {1990 + i % 30}\n"
+        for j in range(6):
+            yield (f"* Delivered improvement {i}.{j}, cutting p95 latency by {10 + j}% for a service handling "
+                   f"{i + j} million requests a day across three regions.\n")
+        yield "\n"
+    yield "Education\nBSc Computer Science | State University\nGraduated: 1989\n\n"
+    yield "Skills\nLanguages: Python, Go, SQL\nTools & Platforms\nDocker, Kubernetes\n"
+
+def count_pages(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return data.count(b'/Type /Page\n') or data.count(b'/Type /Page ') or data.count(b'/Type /Page/')
+
+def measure(mode, experiences):
+    # Runs in the child interpreter.
+    from resume_generator import pdf
+
+    theme = pdf.get_default_theme()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resume.pdf')
+        pdf.PDFRenderer(theme).render(path, "".join(resume_chunks(1)), USER_DATA)
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if mode == 'story':
+            text = "".join(resume_chunks(experiences))
+            builder = pdf.make_story_builder(theme, USER_DATA)
+            builder.feed(text)
+            ok = pdf.build_pdf(path, builder.close(), theme)
+        elif mode == 'render':
+            ok = pdf.PDFRenderer(theme).render(path, "".join(resume_chunks(experiences)), USER_DATA)
+        else:
+            ok = pdf.PDFRenderer(theme).render_stream(path, resume_chunks(experiences), USER_DATA)
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {'ok': ok, 'pages': count_pages(path), 'growth_kib': after - before, 'peak_kib': after}
+
+def run_child(mode, experiences):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, str(experiences)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', default='1,10,100', help="Target document lengths in pages")
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument('--max-growth', type=float, default=None, help="Fail if render/stream grow RSS by more MiB")
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'EXPERIENCES'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], int(args.child[1]))))
+        return 0
+
+    sizes = [int(p) for p in args.pages.split(',')]
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    print(f"{'target':>7} {'mode':<8} {'pages':>6} {'RSS growth MiB':>15} {'peak RSS MiB':>13}")
+    failures = []
+    for target in sizes:
+        experiences = max(1, target * EXPERIENCES_PER_PAGE - 2)
+        for mode in modes:
+            result = run_child(mode, experiences)
+            growth = result['growth_kib'] / 1024
+            print(f"{target:>7} {mode:<8} {result['pages']:>6} {growth:>15.1f} {result['peak_kib'] / 1024:>13.1f}")
+            if not result['ok']:
+                failures.append(f"{mode} failed to render {target} page(s)")
+            if (args.max_growth is not None and target == max(sizes) and mode != 'story'
+                    and growth > args.max_growth):
+                failures.append(f"{mode}: RSS grew {growth:.1f} MiB at {target} pages (limit {args.max_growth} MiB)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
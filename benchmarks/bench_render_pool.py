@@ -0,0 +1,51 @@
+"""
+Benchmark: PDF rendering throughput with PDFRenderPool at increasing worker counts,
+compared with rendering in the calling process.
+
+Run from the repository root:
+
+    python benchmarks/bench_render_pool.py [--documents 200] [--experiences 5] [--workers 1,2,4]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator import pdf
+from resume_generator.render_pool import PDFRenderPool
+from bench_streaming import USER_DATA, sample_resume
+
+def serial_throughput(text, documents):
+    renderer = pdf.PDFRenderer()
+    start = time.perf_counter()
+    for _ in range(documents):
+        renderer.render(io.BytesIO(), text, USER_DATA)
+    return documents / (time.perf_counter() - start)
+
+def pool_throughput(text, documents, workers):
+    with PDFRenderPool(workers) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(None, text, USER_DATA) for _ in range(documents)]
+        sizes = [len(f.result()) for f in futures]
+        elapsed = time.perf_counter() - start
+    assert all(sizes), "a render job failed"
+    return documents / elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--experiences', type=int, default=5)
+    cpus = os.cpu_count() or 1
+    parser.add_argument('--workers', default=",".join(str(n) for n in sorted({1, 2, 4, cpus}) if n <= cpus))
+    args = parser.parse_args()
+
+    text = sample_resume(args.experiences)
+    baseline = serial_throughput(text, args.documents)
+    print(f"documents={args.documents} experiences={args.experiences} cpus={cpus}")
+    print(f"in-process:        {baseline:8.1f} docs/s")
+    for workers in (int(n) for n in args.workers.split(',')):
+        rate = pool_throughput(text, args.documents, workers)
+        print(f"pool, {workers:2d} worker(s): {rate:8.1f} docs/s  ({rate / baseline:.2f}x)")
@@ -0,0 +1,129 @@
+"""
+Benchmark: edit-and-preview loop with whole-resume versus section-level generation.
+
+A candidate's resume is generated once, then edited repeatedly (one experience's responsibilities, an added
+skill, a new target company). After every edit the resume is regenerated and re-rendered to PDF, either with
+the single resume prompt or with SectionedResumeGenerator, which only requests the sections whose inputs
+changed. The fake AI replays the recorded fixtures with a fixed per-request latency plus a per-character
+generation time, so latency follows the amount of text generated. Run from the repository root:
+
+    python benchmarks/bench_sections.py [--experiences 10] [--latency 0.3] [--chars-per-second 400]
+"""
+import argparse
+import asyncio
+import copy
+import re
+import time
+
+from fake_llm import RecordedGeminiClient, load_corpus, load_recorded_responses
+
+from resume_generator.llm import estimate_tokens
+from resume_generator.pdf import render_pdf_bytes
+from resume_generator.prompts import build_resume_prompt
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.sections import SectionedResumeGenerator
+
+POSITION = re.compile(r"^Position: (.+) at (.+) \((.+)\)$", re.MULTILINE)
+SUMMARY_TARGET = re.compile(r"summary of a resume for a (.+) position at (.+)\.")
+SKILLS_LIST = re.compile(r"skills section of a resume: (.*)$", re.MULTILINE)
+
+class SectionReplayClient(RecordedGeminiClient):
+    """
+    RecordedGeminiClient that also answers the section prompts: experiences with the bullets recorded for
+    that position, the summary and skills sections with text of a realistic length. Every prompt and
+    reply is kept for token accounting.
+    """
+    def __init__(self, responses, **kwargs):
+        super().__init__(responses, **kwargs)
+        self.exchanges = []
+        self.bullets = {}
+        for (kind, _), text in responses.items():
+            if kind != 'resume':
+                continue
+            heading = None
+            for line in text.split('\n'):
+                if line.count(' | ') == 2:
+                    heading = tuple(line.split(' | '))
+                    self.bullets[heading] = []
+                elif heading and line.startswith('* '):
+                    self.bullets[heading].append(line)
+                elif not line.strip():
+                    heading = None
+
+    def reply(self, prompt):
+        position = POSITION.search(prompt)
+        summary = SUMMARY_TARGET.search(prompt)
+        skills = SKILLS_LIST.search(prompt)
+        if position:
+            text = "\n".join(self.bullets.get(position.groups()) or
+                             [f"* {line[2:]}" for line in prompt.split('\n') if line.startswith('- ')])
+        elif summary:
+            text = (f"{summary.group(1)} with a record of shipping reliable, measurable improvements across "
+                    f"analytics, platform and product work. Known for turning ambiguous problems into clear plans, "
+                    f"mentoring teammates and delivering results that matter to {summary.group(2)}.")
+        elif skills:
+            names = skills.group(1).split(', ')
+            text = f"Languages: {', '.join(names[:3])}\nTools & Platforms: {', '.join(names[3:]) or 'Git'}"
+        else:
+            text = super().reply(prompt)
+        self.exchanges.append((prompt, text))
+        return text
+
+def edits(user_data):
+    # (label, edited user_data) pairs applied one after another.
+    steps = []
+    edited = copy.deepcopy(user_data)
+    edited['experiences'][len(edited['experiences']) // 2]['responsibilities'].append("Ran the on-call rotation")
+    steps.append(("edit one experience", edited))
+    edited = copy.deepcopy(edited)
+    edited['skills'] = edited['skills'] + ["Rust"]
+    steps.append(("add a skill", edited))
+    edited = copy.deepcopy(edited)
+    edited['company_name'] = "Initrode"
+    steps.append(("change company", edited))
+    return steps
+
+def run_loop(user_data, responses, sectioned, latency, chars_per_second):
+    client = SectionReplayClient(responses, latency=latency, chars_per_second=chars_per_second)
+    generator = SectionedResumeGenerator() if sectioned else None
+    rows = []
+
+    async def generate(candidate):
+        scheduler = GenerationScheduler(client=client, max_in_flight=16, max_retries=0)
+        try:
+            if generator is not None:
+                text, _ = await generator.generate(candidate, scheduler)
+                return text
+            # The fixtures only hold the original candidate's resume, so edits replay the same text.
+            return await scheduler.generate(build_resume_prompt(candidate), candidate['api_key'])
+        finally:
+            scheduler.close()
+
+    for label, candidate in [("first generation", user_data)] + edits(user_data):
+        before = len(client.exchanges)
+        started = time.perf_counter()
+        text = asyncio.run(generate(candidate))
+        render_pdf_bytes(text, candidate)
+        elapsed = time.perf_counter() - started
+        exchanges = client.exchanges[before:]
+        rows.append((label, len(exchanges), sum(estimate_tokens(p) for p, _ in exchanges),
+                     sum(estimate_tokens(r) for _, r in exchanges), elapsed))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--experiences', type=int, default=10, help="Corpus record (1-50) used as the candidate")
+    parser.add_argument('--latency', type=float, default=0.3, help="Fake AI latency per request in seconds")
+    parser.add_argument('--chars-per-second', type=float, default=400, help="Fake AI generation speed")
+    args = parser.parse_args()
+
+    user_data = {len(u['experiences']): u for u in load_corpus()}[args.experiences]
+    responses = load_recorded_responses()
+    print(f"{'mode':<10} {'step':<20} {'requests':>9} {'prompt tok':>11} {'output tok':>11} {'seconds':>8}")
+    for mode, sectioned in (('whole', False), ('sectioned', True)):
+        for label, requests, prompt_tokens, output_tokens, seconds in run_loop(user_data, responses, sectioned,
+                                                                                 args.latency, args.chars_per_second):
+            print(f"{mode:<10} {label:<20} {requests:>9} {prompt_tokens:>11} {output_tokens:>11} {seconds:>8.2f}")
+
+if __name__ == '__main__':
+    main()
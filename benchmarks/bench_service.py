@@ -0,0 +1,145 @@
+"""
+Load test: submits jobs to the HTTP service and reports throughput, rejected submissions and the
+service's own queue depth and p50/p95/p99 job latency.
+
+By default the ASGI app is driven in-process against StubGeminiClient, so no server, network or API key
+is needed. With --url the same load is sent to a running service (e.g. `resume-generator --serve --stub-llm`).
+Run from the repository root:
+
+    python benchmarks/bench_service.py [--jobs 200] [--clients 50] [--latency 0.5] [--workers 8]
+    python benchmarks/bench_service.py --url http://127.0.0.1:8000 [--jobs 200] [--clients 50]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.service import create_app
+from resume_generator.sinks import LocalDirectorySink
+from resume_generator.stub import StubGeminiClient
+from bench_streaming import sample_resume
+
+JOB = {'your_name': 'Jane Doe', 'job_title': 'Engineer', 'company_name': 'Acme', 'your_email': 'jane@example.com',
+       'skills': 'Python, SQL'}
+
+async def asgi_request(app, method, path, payload=None):
+    """
+    Sends one request straight to the ASGI app and returns (status, decoded JSON body).
+    """
+    body = json.dumps(payload).encode() if payload is not None else b''
+    scope = {'type': 'http', 'method': method, 'path': path, 'headers': []}
+    response = {'body': b''}
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            response['status'] = message['status']
+        else:
+            response['body'] += message.get('body', b'')
+
+    await app(scope, receive, send)
+    return response['status'], json.loads(response['body'])
+
+async def run_in_process(args):
+    scheduler = GenerationScheduler(client=StubGeminiClient(latency=args.latency, response_text=sample_resume(5)),
+                                    max_in_flight=args.concurrency, max_retries=0)
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app(scheduler, sink=LocalDirectorySink(directory), workers=args.workers,
+                         max_queue=args.queue_size, default_api_keys=['stub'])
+        submitted = asyncio.Queue()
+
+        async def client():
+            while True:
+                try:
+                    submitted.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                while True:
+                    status, reply = await asgi_request(app, 'POST', '/jobs', JOB)
+                    if status != 503:
+                        break
+                    rejected[0] += 1
+                    await asyncio.sleep(0.05)
+                while reply.get('status') not in ('ok', 'error'):
+                    await asyncio.sleep(0.05)
+                    _, reply = await asgi_request(app, 'GET', f"/jobs/{reply['job_id']}")
+                results[reply['status']] = results.get(reply['status'], 0) + 1
+
+        for i in range(args.jobs):
+            submitted.put_nowait(i)
+        rejected = [0]
+        results = {}
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(args.clients)))
+        elapsed = time.perf_counter() - started
+        _, stats = await asgi_request(app, 'GET', '/stats')
+        await app.service.stop()
+    scheduler.close()
+    return elapsed, results, rejected[0], stats
+
+def http_json(url, payload=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=300) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+def run_against_url(args):
+    rejected = [0]
+
+    def one_job(_):
+        while True:
+            status, reply = http_json(f"{args.url}/jobs", JOB)
+            if status != 503:
+                break
+            rejected[0] += 1
+            time.sleep(0.05)
+        while reply.get('status') not in ('ok', 'error'):
+            time.sleep(0.05)
+            _, reply = http_json(f"{args.url}/jobs/{reply['job_id']}")
+        return reply['status']
+
+    results = {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.clients) as executor:
+        for status in executor.map(one_job, range(args.jobs)):
+            results[status] = results.get(status, 0) + 1
+    elapsed = time.perf_counter() - started
+    return elapsed, results, rejected[0], http_json(f"{args.url}/stats")[1]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help="Load-test a running service instead of the in-process app")
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--clients', type=int, default=50, help="Concurrent submitting clients")
+    parser.add_argument('--latency', type=float, default=0.5, help="Stub AI latency in seconds (in-process only)")
+    parser.add_argument('--workers', type=int, default=8, help="Service worker pool size (in-process only)")
+    parser.add_argument('--queue-size', type=int, default=100, help="Service queue capacity (in-process only)")
+    parser.add_argument('--concurrency', type=int, default=16, help="AI requests in flight (in-process only)")
+    args = parser.parse_args()
+
+    if args.url:
+        elapsed, results, rejected, stats = run_against_url(args)
+    else:
+        elapsed, results, rejected, stats = asyncio.run(run_in_process(args))
+
+    print(f"jobs:        {args.jobs} in {elapsed:.2f}s ({args.jobs / elapsed:.1f} jobs/s)")
+    print(f"outcomes:    {results}, {rejected} submission(s) retried after 503")
+    print(f"latency ms:  {stats['latency_ms']}")
+    print(f"service:     queue depth {stats['queue_depth']}/{stats['queue_capacity']}, {stats['workers']} workers")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: blocking generation followed by create_pdf against streamed generation with
+create_pdf_from_stream, using StubGeminiClient to simulate API latency.
+
+Reports time to first flowable (when the first section becomes renderable) and end-to-end time
+to a finished PDF. Run from the repository root:
+
+    python benchmarks/bench_streaming.py [--latency 3] [--experiences 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator import pdf
+from resume_generator.stub import StubGeminiClient
+
+USER_DATA = {'your_name': 'Jane Doe'}
+
+def sample_resume(experiences):
+    lines = ["Jane Doe | jane@example.com | 555-0100 | linkedin.com/in/janedoe", "", "Summary",
+             "Engineer with a track record of shipping reliable systems.", "", "Work Experience"]
+    for i in range(experiences):
+        lines.append(f"Software Engineer | Company {i} | 20{10 + i} - 20{11 + i}")
+        lines.extend(f"* Delivered improvement {j} that cut latency by {10 + j}%" for j in range(5))
+        lines.append("")
+    lines += ["Education", "BSc Computer Science | State University", "Graduated: 2010", "",
+              "Skills", "Languages: Python, Go, SQL", "Tools & Platforms", "Docker, Kubernetes"]
+    return "\n".join(lines)
+
+def run_blocking(stub, path):
+    started = time.perf_counter()
+    text = stub("resume prompt", "key")
+    first = None
+
+    def mark(flowables):
+        nonlocal first
+        first = first or time.perf_counter()
+
+    theme = pdf.get_default_theme()
+    builder = pdf.make_story_builder(theme, USER_DATA, on_flowables=mark)
+    builder.feed(text)
+    pdf.build_pdf(path, builder.close(), theme)
+    return first - started, time.perf_counter() - started
+
+def run_streaming(stub, path):
+    started = time.perf_counter()
+    first = None
+
+    def mark(flowables):
+        nonlocal first
+        first = first or time.perf_counter()
+
+    pdf.create_pdf_from_stream(path, stub.generate_stream("resume prompt", "key"), USER_DATA, on_flowables=mark)
+    return first - started, time.perf_counter() - started
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency', type=float, default=3.0, help="Simulated generation time in seconds")
+    parser.add_argument('--experiences', type=int, default=8)
+    args = parser.parse_args()
+
+    stub = StubGeminiClient(latency=args.latency, response_text=sample_resume(args.experiences))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "resume.pdf")
+        blocking_first, blocking_total = run_blocking(stub, path)
+        streaming_first, streaming_total = run_streaming(stub, path)
+
+    print(f"latency={args.latency}s experiences={args.experiences}")
+    print(f"blocking:  first flowable {blocking_first:6.3f}s  finished PDF {blocking_total:6.3f}s")
+    print(f"streaming: first flowable {streaming_first:6.3f}s  finished PDF {streaming_total:6.3f}s")
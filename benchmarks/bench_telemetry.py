@@ -0,0 +1,64 @@
+"""
+Benchmark: cost of the telemetry hooks, disabled and enabled.
+
+Measures the per-call cost of span()/count()/observe() with no exporters installed and with a
+PrometheusExporter, and the end-to-end effect on rendering a PDF in memory. Run from the repository root:
+
+    python benchmarks/bench_telemetry.py [--calls 200000] [--documents 200] [--experiences 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator import pdf, telemetry
+from bench_streaming import USER_DATA, sample_resume
+
+def hook_cost(calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        with telemetry.span('bench', kind='resume'):
+            pass
+        telemetry.count('bench_calls')
+        telemetry.observe('bench_bytes', 1024, kind='resume')
+    return (time.perf_counter() - started) / calls * 1e9
+
+def render_cost(text, documents, rounds=3):
+    renderer = pdf.PDFRenderer()
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(documents):
+            renderer.render_bytes(text, USER_DATA)
+        elapsed = (time.perf_counter() - started) / documents * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--experiences', type=int, default=5)
+    args = parser.parse_args()
+    text = sample_resume(args.experiences)
+
+    telemetry.configure()
+    render_cost(text, 5)
+    disabled_hooks = hook_cost(args.calls)
+    disabled_render = render_cost(text, args.documents)
+
+    telemetry.configure(telemetry.PrometheusExporter())
+    enabled_hooks = hook_cost(args.calls // 10)
+    enabled_render = render_cost(text, args.documents)
+    telemetry.configure()
+
+    print(f"span+count+observe, disabled:   {disabled_hooks:8.0f} ns/iteration")
+    print(f"span+count+observe, prometheus: {enabled_hooks:8.0f} ns/iteration")
+    print(f"render, disabled:               {disabled_render:8.3f} ms/document")
+    print(f"render, prometheus:             {enabled_render:8.3f} ms/document "
+          f"({(enabled_render / disabled_render - 1) * 100:+.1f}%)")
+
+if __name__ == '__main__':
+    main()
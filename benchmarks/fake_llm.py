@@ -0,0 +1,75 @@
+"""
+Deterministic fake Gemini backend and fixtures for the benchmark suite.
+
+fixtures/user_data_corpus.jsonl holds synthetic user_data records with 1 to 50 experiences, and
+fixtures/recorded_responses.jsonl.gz the resume and cover letter outputs recorded for each of them
+(see make_fixtures.py to regenerate or re-record them). RecordedGeminiClient replays those outputs.
+"""
+import gzip
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator.stub import StubGeminiClient
+from resume_generator.user_input import normalize_user_data
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CORPUS_PATH = os.path.join(FIXTURES_DIR, 'user_data_corpus.jsonl')
+RESPONSES_PATH = os.path.join(FIXTURES_DIR, 'recorded_responses.jsonl.gz')
+
+# Both prompts name the candidate as "... resume for <name> applying" / "... cover letter for <name> applying".
+PROMPT_CANDIDATE = re.compile(r"professional (resume|cover letter) for (.+?) applying")
+# Shared-prefix prompts (see resume_generator.prompts) name the candidate in the profile and the documents
+# in the suffix; multi-job prompts list the jobs as "Job <n>: ...".
+PROFILE_CANDIDATE = re.compile(r"^Name: (.+)$", re.MULTILINE)
+PREFIXED_KIND = re.compile(r"Write the candidate's (resume|cover letter) for this job")
+MULTI_JOB_LINE = re.compile(r"^Job (\d+): ", re.MULTILINE)
+
+def load_corpus(path=CORPUS_PATH, api_key='fake'):
+    """
+    Returns the corpus as normalized user_data dicts, in file order (ascending experience count).
+    """
+    with open(path, encoding='utf-8') as f:
+        return [normalize_user_data(json.loads(line), api_key) for line in f if line.strip()]
+
+def load_recorded_responses(path=RESPONSES_PATH):
+    """
+    Returns {(kind, your_name): text} with kind 'resume' or 'cover_letter'.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        records = (json.loads(line) for line in f if line.strip())
+        return {(r['kind'], r['your_name']): r['text'] for r in records}
+
+class RecordedGeminiClient(StubGeminiClient):
+    """
+    StubGeminiClient that answers with the recorded output for the candidate and document kind named in
+    the prompt, so replies have realistic, size-dependent lengths. Multi-job prompts get a JSON array with the
+    recorded pair of documents for every listed job. `latency`, `jitter`, `chars_per_second` and `error_rate`
+    work as in StubGeminiClient; with a fixed `seed` runs are reproducible.
+    Prompts for unknown candidates raise KeyError.
+    """
+    def __init__(self, responses=None, latency=0.05, jitter=0.0, chars_per_second=None, error_rate=0.0, seed=0):
+        super().__init__(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed,
+                         chars_per_second=chars_per_second)
+        self.responses = responses if responses is not None else load_recorded_responses()
+
+    def reply(self, prompt):
+        match = PROMPT_CANDIDATE.search(prompt)
+        if match is not None:
+            kind = 'cover_letter' if match.group(1) == 'cover letter' else 'resume'
+            return self.responses[(kind, match.group(2))]
+        match = PROFILE_CANDIDATE.search(prompt)
+        if match is None:
+            raise KeyError("Prompt does not name a candidate")
+        name = match.group(1)
+        job_numbers = [int(n) for n in MULTI_JOB_LINE.findall(prompt)]
+        if job_numbers:
+            return json.dumps([{'job': n, 'resume': self.responses[('resume', name)],
+                                'cover_letter': self.responses[('cover_letter', name)]} for n in job_numbers])
+        kind = PREFIXED_KIND.search(prompt)
+        if kind is None:
+            raise KeyError("Prompt does not name a document")
+        return self.responses[('cover_letter' if kind.group(1) == 'cover letter' else 'resume', name)]
@@ -0,0 +1,143 @@
+"""
+Regenerates the benchmark fixtures: a synthetic user_data corpus with 1 to 50 experiences and the
+resume/cover letter output for every record.
+
+By default the outputs are synthesized deterministically in the layout Gemini produces for these prompts,
+so the fixtures are identical on every run. With --record-api-key the real model is called once per
+document instead and its replies are stored. Run from the repository root:
+
+    python benchmarks/make_fixtures.py [--records 50] [--seed 7] [--record-api-key KEY]
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+
+from fake_llm import CORPUS_PATH, FIXTURES_DIR, RESPONSES_PATH
+
+from resume_generator.prompts import build_resume_prompt, build_cover_letter_prompt
+from resume_generator.user_input import normalize_user_data
+
+FIRST_NAMES = ["Jane", "Arjun", "Mei", "Carlos", "Amara", "Liam", "Sofia", "Kenji", "Nadia", "Omar"]
+LAST_NAMES = ["Doe", "Sharma", "Chen", "Rivera", "Okafor", "Walsh", "Rossi", "Tanaka", "Haddad", "Novak"]
+JOB_TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Backend Developer", "Marketing Strategist",
+              "Machine Learning Engineer", "Business Analyst", "Platform Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Analytics", "Hooli",
+             "Vandelay Imports", "Soylent Systems", "Tyrell Data"]
+VERBS = ["Led", "Built", "Designed", "Automated", "Migrated", "Optimized", "Launched", "Reduced", "Scaled", "Mentored"]
+OBJECTS = ["the billing pipeline", "a real-time analytics dashboard", "the customer onboarding flow",
+           "CI/CD for 40 services", "the search ranking model", "an internal API gateway", "the data warehouse",
+           "quarterly planning reports", "a churn prediction model", "the mobile checkout"]
+OUTCOMES = ["cutting latency by {n}%", "saving ${n}k per year", "raising conversion by {n}%",
+            "serving {n}M requests a day", "reducing incidents by {n}%", "for a team of {n} engineers"]
+SKILLS = ["Python", "SQL", "Go", "TypeScript", "Docker", "Kubernetes", "AWS", "GCP", "Spark", "Airflow", "React",
+          "PostgreSQL", "Terraform", "TensorFlow", "Tableau", "Kafka"]
+CONCEPTS = ["Distributed Systems", "A/B Testing", "Data Modeling", "Agile", "Observability", "Statistics"]
+
+def make_record(index, experiences, rng):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {index:02d}"
+    job_title = rng.choice(JOB_TITLES)
+    year = 2024 - experiences
+    exps = []
+    for i in range(experiences):
+        start = year + i
+        exps.append({
+            'title': rng.choice(JOB_TITLES),
+            'company': rng.choice(COMPANIES),
+            'dates': f"Jan {start} - Dec {start}",
+            'responsibilities': [f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}" for _ in range(rng.randint(2, 5))],
+        })
+    return {
+        'record_id': f"bench-{index:02d}",
+        'job_title': job_title,
+        'company_name': rng.choice(COMPANIES),
+        'your_name': name,
+        'your_email': f"{name.split()[0].lower()}{index}@example.com",
+        'your_phone': f"555-01{index:02d}",
+        'your_linkedin': f"linkedin.com/in/{name.replace(' ', '').lower()}",
+        'experiences': exps,
+        'education': [{'degree': "BSc Computer Science", 'institution': "State University", 'dates': f"May {year - 1}"}]
+                     + ([{'degree': "MSc Data Science", 'institution': "Tech Institute", 'dates': f"May {year + 1}"}]
+                        if experiences > 10 else []),
+        'skills': rng.sample(SKILLS, min(len(SKILLS), 4 + experiences // 5)),
+        'hiring_manager_name': rng.choice(["", "Alex Morgan", "Priya Patel"]),
+        'how_heard': rng.choice(["", "LinkedIn", "a referral"]),
+        'additional_cover_letter_points': rng.choice(["", "Passionate about developer tooling."]),
+    }
+
+def bullet(rng):
+    return f"* {rng.choice(VERBS)} {rng.choice(OBJECTS)}, {rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}."
+
+def synthesize_resume(user_data, rng):
+    lines = [f"{user_data['your_name']} | {user_data['your_email']} | {user_data['your_phone']} | "
+             f"{user_data['your_linkedin']}", "", "Summary",
+             f"{user_data['job_title']} with {len(user_data['experiences'])} years of experience "
+             f"delivering {rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}, known for "
+             f"{rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}.", "", "Work Experience"]
+    for exp in reversed(user_data['experiences']):
+        lines.append(f"{exp['title']} | {exp['company']} | {exp['dates']}")
+        lines.extend(f"* {r}, {rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}." for r in exp['responsibilities'])
+        lines.extend(bullet(rng) for _ in range(rng.randint(1, 3)))
+        lines.append("")
+    lines.append("Education")
+    for edu in user_data['education']:
+        lines += [f"{edu['degree']} | {edu['institution']}", f"Graduated: {edu['dates']}"]
+    lines += ["", "Skills", "Programming/Technical",
+              f"Languages: {', '.join(s for s in user_data['skills'] if s in SKILLS[:4]) or 'Python'}",
+              "Tools & Platforms", ", ".join(user_data['skills']), "", "Concepts",
+              ", ".join(rng.sample(CONCEPTS, 3))]
+    return "\n".join(lines)
+
+def synthesize_cover_letter(user_data, rng):
+    manager = user_data['hiring_manager_name'] or "Hiring Manager"
+    exps = user_data['experiences']
+    paragraphs = [f"Dear {manager},",
+                  f"I am excited to apply for the {user_data['job_title']} position at {user_data['company_name']}, "
+                  f"which I learned about through {user_data['how_heard'] or 'an online posting'}."]
+    for exp in exps[-min(len(exps), 6):]:
+        paragraphs.append(f"As {exp['title']} at {exp['company']}, I {rng.choice(VERBS).lower()} "
+                          f"{rng.choice(OBJECTS)}, {rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}. "
+                          f"That work taught me to balance speed with reliability.")
+    paragraphs += [f"My skills in {', '.join(user_data['skills'][:4])} match what {user_data['company_name']} "
+                   f"needs. {user_data['additional_cover_letter_points']}".strip(),
+                   "Thank you for your consideration. I look forward to discussing how I can contribute.",
+                   "Sincerely,", user_data['your_name']]
+    return "\n\n".join(paragraphs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=50, help="Corpus size; record i has i experiences")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--record-api-key', help="Record real Gemini output with this key instead of synthesizing")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = [make_record(i, i, rng) for i in range(1, args.records + 1)]
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(CORPUS_PATH, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+    if args.record_api_key:
+        from resume_generator.llm import GeminiClientPool
+        pool = GeminiClientPool(api_keys=[args.record_api_key])
+        generate = {'resume': lambda u: pool.generate(build_resume_prompt(u)),
+                    'cover_letter': lambda u: pool.generate(build_cover_letter_prompt(u))}
+    else:
+        generate = {'resume': lambda u: synthesize_resume(u, rng),
+                    'cover_letter': lambda u: synthesize_cover_letter(u, rng)}
+
+    # mtime=0 keeps the gzip bytes identical across runs.
+    with open(RESPONSES_PATH, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+        for record in records:
+            user_data = normalize_user_data(record, 'fake')
+            for kind in ('resume', 'cover_letter'):
+                text = generate[kind](user_data)
+                gz.write((json.dumps({'your_name': user_data['your_name'], 'kind': kind, 'text': text}) + "\n")
+                         .encode('utf-8'))
+            print(f"{record['record_id']}: {len(record['experiences'])} experience(s)")
+    print(f"Wrote {CORPUS_PATH} and {RESPONSES_PATH}")
+
+if __name__ == '__main__':
+    main()
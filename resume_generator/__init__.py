@@ -0,0 +1,63 @@
+"""
+AI Resume & Cover Letter Generator.
+
+The package namespace is lazy: `from resume_generator import create_pdf` only imports the module that
+defines it (and ReportLab) on first use, so importing the package or running the CLI stays fast.
+"""
+import importlib
+
+__version__ = "0.1.0"
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    'get_user_input': 'user_input',
+    'build_output_filenames': 'user_input',
+    'normalize_user_data': 'user_input',
+    'build_resume_prompt': 'prompts',
+    'build_cover_letter_prompt': 'prompts',
+    'CandidateProfile': 'prompts',
+    'PrefixedPrompt': 'prompts',
+    'AIGenerationError': 'llm',
+    'GeminiClientPool': 'llm',
+    'generate_text_with_ai': 'llm',
+    'generate_resume_content': 'llm',
+    'generate_cover_letter_content': 'llm',
+    'ResponseCache': 'cache',
+    'GenerationScheduler': 'scheduler',
+    'StubGeminiClient': 'stub',
+    'ResumeDocument': 'document',
+    'CoverLetterDocument': 'document',
+    'parse_document': 'document',
+    'PDFTheme': 'pdf',
+    'PDFRenderer': 'pdf',
+    'create_pdf': 'pdf',
+    'render_pdf_bytes': 'pdf',
+    'create_pdf_from_stream': 'pdf',
+    'DocumentRenderer': 'renderers',
+    'get_renderer': 'renderers',
+    'render_formats': 'renderers',
+    'LocalDirectorySink': 'sinks',
+    'ZipArchiveSink': 'sinks',
+    'ObjectStoreSink': 'sinks',
+    'HTTPResponseSink': 'sinks',
+    'PDFRenderPool': 'render_pool',
+    'run_candidate_pipeline': 'pipeline',
+    'run_batch': 'batch',
+    'SectionedResumeGenerator': 'sections',
+    'run_multi_job_pipeline': 'multi_job',
+    'run_tailoring': 'multi_job',
+    'get_display': 'display',
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
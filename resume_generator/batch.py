@@ -0,0 +1,195 @@
+"""Restartable headless batch generation from JSONL/CSV job files."""
+import asyncio
+import csv
+import hashlib
+import itertools
+import json
+import os
+from datetime import datetime, timezone
+
+from . import telemetry
+from .llm import AIGenerationError
+from .pipeline import run_candidate_pipeline, run_coroutine_sync
+from .scheduler import GenerationScheduler
+from .sinks import LocalDirectorySink
+from .user_input import build_output_filenames, normalize_user_data
+
+# --- Batch Generation ---
+
+BATCH_MANIFEST_NAME = "manifest.jsonl"
+
+def read_batch_records(job_file, default_api_keys=None):
+    """
+    Streams (record_id, user_data) pairs from a JSONL or CSV job file without loading it all into memory.
+    The record_id comes from a 'record_id' field when present, otherwise from the record's position in the file,
+    so it stays stable across reruns of the same file. Records that cannot be parsed are yielded with the
+    exception in place of user_data so the caller can log them in the manifest.
+    Records without their own api_key are assigned the default_api_keys in turn to spread the load.
+    """
+    key_cycle = itertools.cycle(default_api_keys) if default_api_keys else itertools.repeat(None)
+    is_csv = job_file.lower().endswith('.csv')
+    with open(job_file, newline='', encoding='utf-8') as f:
+        rows = csv.DictReader(f) if is_csv else (line for line in f if line.strip())
+        for position, record in enumerate(rows, start=1):
+            try:
+                if not is_csv:
+                    record = json.loads(record)
+                record_id = str(record.get('record_id') or position)
+            except (ValueError, AttributeError) as e:
+                yield str(position), e
+                continue
+
+            try:
+                yield record_id, normalize_user_data(record, next(key_cycle))
+            except (ValueError, AttributeError, TypeError) as e:
+                yield record_id, e
+
+def user_data_hash(user_data):
+    """
+    Returns a hash of a normalized user_data record, leaving out the api_key, so reruns can tell edited records.
+    """
+    fields = {key: value for key, value in user_data.items() if key != 'api_key'}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode('utf-8')).hexdigest()
+
+def load_batch_manifest(manifest_path, sink=None):
+    """
+    Reads an existing manifest and returns {record_id: input_hash} for the records that already completed
+    successfully; input_hash is None for entries written before hashes were recorded. A truncated last line
+    (e.g. from a crash mid-write) is ignored. With a `sink`, records whose PDFs the sink no longer holds
+    (e.g. lost with an archive that was never closed) are left out so they are generated again.
+    """
+    completed = {}
+    if not os.path.exists(manifest_path):
+        return completed
+
+    with open(manifest_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get('status') == 'ok' and (sink is None or all(
+                    sink.contains(entry[key]) for key in ('resume_pdf', 'cover_letter_pdf'))):
+                completed[entry['record_id']] = entry.get('input_hash')
+            else:
+                completed.pop(entry['record_id'], None)
+    return completed
+
+def _batch_entry(record_id, error=None):
+    return {'record_id': record_id, 'status': 'error', 'resume_pdf': None, 'cover_letter_pdf': None, 'error': error}
+
+async def process_batch_record(record_id, user_data, sink, scheduler, stream=False, render_pool=None, on_chunk=None,
+                               sections=None, exports=(), on_export=None):
+    """
+    Generates the resume and cover letter for one record through the per-candidate pipeline and writes
+    both PDFs to the sink. Returns the manifest entry describing the outcome, including stage timings.
+    `on_chunk`, `sections`, `exports` and `on_export` are passed on to run_candidate_pipeline.
+    """
+    entry = _batch_entry(record_id)
+    if not user_data['api_key']:
+        entry['error'] = "No API key in record and no default API key given."
+        return entry
+
+    entry['input_hash'] = user_data_hash(user_data)
+    resume_filename_pdf, cover_letter_filename_pdf = build_output_filenames(user_data, prefix=record_id)
+    pdf_names = {'resume': resume_filename_pdf, 'cover_letter': cover_letter_filename_pdf}
+
+    try:
+        result = await run_candidate_pipeline(user_data, scheduler, pdf_names, stream=stream, on_chunk=on_chunk,
+                                              render_pool=render_pool, sink=sink, sections=sections,
+                                              exports=exports, on_export=on_export)
+    except AIGenerationError as e:
+        entry.update(e.to_dict())
+        return entry
+
+    entry['timings'] = {stage: round(seconds, 4) for stage, seconds in result['timings'].items()}
+    if 'sections' in result:
+        entry['sections'] = result['sections']
+    if 'exports' in result:
+        entry['exports'] = result['exports']
+    failed = [name for kind, name in pdf_names.items() if result['pdfs'][kind] is None]
+    if failed:
+        entry['error'] = f"Failed to create '{failed[0]}'."
+        return entry
+
+    entry.update(status='ok', resume_pdf=result['pdfs']['resume'], cover_letter_pdf=result['pdfs']['cover_letter'])
+    return entry
+
+async def _run_batch_async(job_file, output_dir, default_api_keys, scheduler, max_pending_records, stream, render_pool,
+                           sink, sections, exports):
+    manifest_path = os.path.join(output_dir, BATCH_MANIFEST_NAME)
+    completed = load_batch_manifest(manifest_path, sink)
+    counts = {'ok': 0, 'error': 0, 'skipped': 0}
+
+    print(f"--- Batch Generation: {job_file} -> {output_dir} ---")
+    if completed:
+        print(f"Resuming: {len(completed)} record(s) already completed will be skipped unless edited.")
+
+    async def run_record(record_id, user_data):
+        if isinstance(user_data, Exception):
+            return _batch_entry(record_id, f"Invalid record: {user_data}")
+        try:
+            return await process_batch_record(record_id, user_data, sink, scheduler, stream, render_pool,
+                                              sections=sections, exports=exports)
+        except Exception as e:
+            return _batch_entry(record_id, f"Unexpected error: {e}")
+
+    def record_finished(entry):
+        entry['finished_at'] = datetime.now(timezone.utc).isoformat()
+        manifest.write(json.dumps(entry) + "\n")
+        manifest.flush()
+        os.fsync(manifest.fileno())
+        counts[entry['status']] += 1
+        telemetry.count('batch_records', status=entry['status'])
+        if entry['error']:
+            print(f"Record {entry['record_id']} failed: {entry['error']}")
+        else:
+            print(f"Record {entry['record_id']} done.")
+
+    with open(manifest_path, 'a', encoding='utf-8') as manifest:
+        pending = set()
+        for record_id, user_data in read_batch_records(job_file, default_api_keys):
+            # Records edited since they completed are generated again (section by section with `sections`).
+            if record_id in completed and not isinstance(user_data, Exception) and (
+                    completed[record_id] in (None, user_data_hash(user_data))):
+                counts['skipped'] += 1
+                continue
+
+            # Only read further into the job file once there is room, so huge batches stay bounded in memory.
+            if len(pending) >= max_pending_records:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    record_finished(task.result())
+            pending.add(asyncio.create_task(run_record(record_id, user_data)))
+
+        for task in asyncio.as_completed(pending):
+            record_finished(await task)
+
+    print(f"\nBatch complete: {counts['ok']} succeeded, {counts['error']} failed, {counts['skipped']} skipped.")
+    return counts
+
+def run_batch(job_file, output_dir, default_api_keys=None, scheduler=None, max_pending_records=None, stream=False,
+              render_pool=None, sink=None, sections=None, exports=()):
+    """
+    Runs every record of a JSONL/CSV job file through generation and PDF rendering without prompting.
+    AI requests for several records are kept in flight at once through a GenerationScheduler, and with a
+    PDFRenderPool the PDFs are rendered in worker processes. PDFs go to `sink` (an OutputSink), by default
+    files in output_dir. The manifest is always kept in output_dir.
+    Each outcome is appended to the manifest as soon as the record finishes. Records already marked 'ok' in the
+    manifest are skipped unless the record was edited since, so an interrupted batch can simply be rerun.
+    With `sections` (a SectionedResumeGenerator) edited records are generated section by section, so rerunning
+    an edited job file only regenerates the sections whose inputs changed.
+    `exports` names further output formats ('html', 'markdown', 'docx') written next to each PDF from the
+    same parse; their locations are recorded under 'exports' in the manifest.
+    Returns a dict with counts of processed, skipped and failed records.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    scheduler = scheduler or GenerationScheduler()
+    # Enough records in flight to fill every default key's slots, with as many again waiting.
+    max_pending_records = max_pending_records or scheduler.capacity(len(default_api_keys or ())) * 2
+    try:
+        return run_coroutine_sync(_run_batch_async(job_file, output_dir, default_api_keys, scheduler,
+                                                     max_pending_records, stream, render_pool,
+                                                     sink or LocalDirectorySink(output_dir), sections, exports))
+    finally:
+        scheduler.close()
@@ -0,0 +1,101 @@
+"""Persistent SQLite cache of AI responses."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+# --- Response Cache ---
+
+DEFAULT_CACHE_PATH = ".ai_response_cache.sqlite"
+
+class ResponseCache:
+    """
+    Persistent, content-addressed cache of AI responses stored in SQLite.
+    Entries are keyed by a SHA-256 of the model name, prompt text and generation parameters, so a retried batch
+    or a candidate re-running with the same inputs gets the earlier text back without an API call.
+
+    Entries older than `max_age` seconds are treated as misses, and once more than `max_entries` are stored the
+    least recently used ones are evicted. Hit/miss counters are kept for the lifetime of the object.
+    Safe to share across threads.
+    """
+    PRUNE_EVERY = 100
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=50000, max_age=30 * 24 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_prune = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                                  key TEXT PRIMARY KEY,
+                                  model TEXT,
+                                  response TEXT NOT NULL,
+                                  created_at REAL NOT NULL,
+                                  last_access REAL NOT NULL)""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+
+    @staticmethod
+    def make_key(model_name, prompt, params=None):
+        payload = json.dumps([model_name, prompt, params or {}], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key, count_miss=True):
+        """
+        Returns the cached response text for `key`, or None on a miss or an expired entry.
+        With count_miss=False a miss is not counted, for callers that look the key up again on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.max_age and now - row[1] > self.max_age):
+                if count_miss:
+                    self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, response, model_name=None):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, model, response, created_at, last_access) "
+                               "VALUES (?, ?, ?, ?, ?)", (key, model_name, response, now, now))
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= self.PRUNE_EVERY:
+                self._prune(now)
+
+    def _prune(self, now):
+        self._puts_since_prune = 0
+        if self.max_age:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.max_age,))
+        if self.max_entries:
+            self._conn.execute("DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                               "ORDER BY last_access DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def prune(self):
+        """
+        Applies the age and size eviction policy immediately.
+        """
+        with self._lock:
+            self._prune(time.time())
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries,
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
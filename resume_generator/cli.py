@@ -0,0 +1,245 @@
+"""
+Command line entry point (`resume-generator` / `python -m resume_generator`).
+
+Only argparse and the lightweight modules are imported at startup; the scheduler, ReportLab and the
+Gemini SDK are loaded by the code paths that use them.
+"""
+import argparse
+import os
+
+from .cache import DEFAULT_CACHE_PATH, ResponseCache
+from .display import DISPLAY_BACKENDS, get_display
+from .user_input import get_user_input, build_output_filenames
+
+# --- Main Execution Block ---
+
+def run_interactive(cache=None, stream=False, display=None, sections=None, exports=()):
+    """
+    Runs the original interactive flow: prompt for details, generate both documents in parallel,
+    preview the output, then hand both PDFs to the user through `display` (see get_display).
+    With stream=True the resume is printed as it is generated; with `sections` (a SectionedResumeGenerator)
+    it is generated section by section instead. Files in the `exports` formats are announced as soon as
+    they are written and handed over after the PDFs.
+    """
+    from .llm import AIGenerationError
+    from .pipeline import run_candidate_pipeline, run_coroutine_sync, format_stage_timings
+    from .scheduler import GenerationScheduler
+
+    display = display or get_display()
+    user_details = get_user_input()
+    if not user_details:
+        return
+
+    resume_filename_pdf, cover_letter_filename_pdf = build_output_filenames(user_details)
+    pdf_names = {'resume': resume_filename_pdf, 'cover_letter': cover_letter_filename_pdf}
+
+    print("\nGenerating Resume and Cover Letter...")
+    on_chunk = None
+    if stream and sections is None:
+        print("\n--- Generated Resume (Streaming) ---")
+        on_chunk = lambda kind, chunk: print(chunk, end='', flush=True) if kind == 'resume' else None
+    on_export = lambda kind, format_name, location: print(f"\n{format_name} {kind} ready: {location}")
+    scheduler = GenerationScheduler(cache=cache)
+    try:
+        result = run_coroutine_sync(run_candidate_pipeline(user_details, scheduler, pdf_names,
+                                                           stream=stream, on_chunk=on_chunk, sections=sections,
+                                                           exports=exports, on_export=on_export))
+    except AIGenerationError as e:
+        print(f"\n{e}")
+        return
+    finally:
+        scheduler.close()
+    print(f"\nStage timings: {format_stage_timings(result['timings'])}")
+    if 'sections' in result:
+        print(f"Resume sections: {len(result['sections']['generated'])} generated, "
+              f"{len(result['sections']['reused'])} reused.")
+
+    display.show_markdown("Generated Resume (Preview)", result['texts']['resume'])
+    display.show_markdown("Generated Cover Letter (Preview)", result['texts']['cover_letter'])
+
+    for kind, label in (('resume', "resume"), ('cover_letter', "cover letter")):
+        filename = pdf_names[kind]
+        if result['pdfs'][kind]:
+            try:
+                display.deliver_file(filename)
+            except Exception as e:
+                print(f"Error downloading {label} PDF: {e}")
+        else:
+            print(f"Failed to create '{filename}'.")
+        for format_name, location in result.get('exports', {}).get(kind, {}).items():
+            if location:
+                try:
+                    display.deliver_file(location)
+                except Exception as e:
+                    print(f"Error downloading {label} {format_name}: {e}")
+
+    print("\nGeneration and download complete!")
+
+def run_service(args, scheduler, sink, api_keys, render_pool=None, sections=None, exports=()):
+    """
+    Serves the generation API (see resume_generator.service) with uvicorn until interrupted.
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        print("HTTP service mode needs uvicorn: pip install uvicorn (or resume-generator[service]).")
+        return
+    from .service import create_app
+
+    app = create_app(scheduler, sink=sink, workers=args.service_workers, max_queue=args.queue_size,
+                     default_api_keys=api_keys, stream=args.stream, render_pool=render_pool, sections=sections,
+                     exports=exports)
+    print(f"--- Serving on http://{args.host}:{args.port} ({args.service_workers} workers, queue {args.queue_size}) ---")
+    try:
+        uvicorn.run(app, host=args.host, port=args.port, log_level='warning')
+    finally:
+        scheduler.close()
+
+def configure_telemetry(names, log_path=None):
+    """
+    Installs the telemetry exporters named in the comma-separated `names` (see resume_generator.telemetry).
+    Returns the Telemetry object, or None when no exporters were asked for.
+    """
+    if not names:
+        return None
+    from . import telemetry
+
+    exporters = []
+    for name in (n.strip() for n in names.split(',') if n.strip()):
+        if name not in telemetry.EXPORTERS:
+            raise SystemExit(f"Unknown telemetry exporter: {name!r} (choose from {', '.join(telemetry.EXPORTERS)})")
+        if name == 'json':
+            exporters.append(telemetry.JSONLogExporter(log_path))
+        elif name == 'otel':
+            try:
+                exporters.append(telemetry.OpenTelemetryExporter())
+            except ImportError:
+                raise SystemExit("The otel exporter needs opentelemetry-api: pip install opentelemetry-api") from None
+        else:
+            exporters.append(telemetry.EXPORTERS[name]())
+    return telemetry.configure(*exporters)
+
+def parse_export_formats(names):
+    """
+    Returns the output formats named in the comma-separated `names` besides the PDF (see
+    resume_generator.renderers), checking that their optional libraries are installed.
+    """
+    if not names:
+        return ()
+    from .renderers import check_formats
+
+    formats = tuple(dict.fromkeys(n.strip() for n in names.split(',') if n.strip() and n.strip() != 'pdf'))
+    try:
+        check_formats(formats)
+    except (ValueError, ImportError) as e:
+        raise SystemExit(str(e)) from None
+    return formats
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog='resume-generator', description="AI Resume & Cover Letter Generator")
+    parser.add_argument('--batch', metavar='JOB_FILE', help="JSONL or CSV file of user_data records to generate without prompting")
+    parser.add_argument('--tailor', metavar='JOBS_FILE', help="JSONL or CSV file of target jobs to tailor the --profile candidate to")
+    parser.add_argument('--profile', metavar='PROFILE_JSON', help="JSON user_data record of the candidate for --tailor")
+    parser.add_argument('--tailor-mode', choices=['cached', 'batched', 'separate'], default='cached', help="How --tailor shares the profile: cached prefix per request (full prompts for profiles too short to cache), several jobs per request, or full prompts")
+    parser.add_argument('--jobs-per-request', type=int, default=4, help="Jobs per AI request with --tailor-mode batched")
+    parser.add_argument('--output-dir', default='batch_output', help="Directory for batch, tailored or service PDFs (and the batch status manifest)")
+    parser.add_argument('--api-key', default=os.environ.get('GEMINI_API_KEY'), help="Default API key(s), comma-separated, for records without one; load is spread across them (defaults to $GEMINI_API_KEY)")
+    parser.add_argument('--concurrency', type=int, default=4, help="AI requests kept in flight per API key")
+    parser.add_argument('--rpm', type=int, default=None, help="Requests-per-minute limit per API key")
+    parser.add_argument('--tpm', type=int, default=None, help="Tokens-per-minute limit per API key")
+    parser.add_argument('--timeout', type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument('--max-retries', type=int, default=5, help="Retries for rate-limited or failed AI requests")
+    parser.add_argument('--stub-llm', action='store_true', help="Use a local stub instead of the Gemini API (for load testing)")
+    parser.add_argument('--stream', action='store_true', help="Stream AI responses and build PDFs while the text arrives")
+    parser.add_argument('--sectioned', action='store_true', help="Generate resumes one section at a time, reusing unchanged sections from the response cache")
+    parser.add_argument('--formats', metavar='FORMATS', help="Also write each document in these formats, comma-separated: html, markdown, docx (needs python-docx)")
+    parser.add_argument('--archive', metavar='ZIP_FILE', help="Write batch PDFs into this zip archive instead of separate files")
+    parser.add_argument('--render-workers', type=int, default=0, help="Render batch PDFs in this many worker processes (0 = render in threads)")
+    parser.add_argument('--serve', action='store_true', help="Run the HTTP service (needs uvicorn) instead of the interactive flow")
+    parser.add_argument('--host', default='127.0.0.1', help="Address the HTTP service listens on")
+    parser.add_argument('--port', type=int, default=8000, help="Port the HTTP service listens on")
+    parser.add_argument('--service-workers', type=int, default=8, help="Jobs the HTTP service runs at the same time")
+    parser.add_argument('--queue-size', type=int, default=100, help="Jobs the HTTP service queues before answering 503")
+    parser.add_argument('--telemetry', metavar='EXPORTERS', help="Record per-stage timings and metrics with these exporters, comma-separated: json, prometheus, otel")
+    parser.add_argument('--telemetry-log', metavar='PATH', help="File the json exporter appends to (default: stderr)")
+    parser.add_argument('--metrics-file', metavar='PATH', help="Write the prometheus exporter's metrics here on exit (default: print them); served at /metrics with --serve")
+    parser.add_argument('--display', choices=['auto', *DISPLAY_BACKENDS], default='auto', help="How interactive previews and PDFs are shown (auto detects Colab/IPython)")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help="SQLite file caching AI responses by model and prompt")
+    parser.add_argument('--no-cache', action='store_true', help="Always call the AI model, ignoring cached responses")
+    parser.add_argument('--cache-max-entries', type=int, default=50000, help="Least recently used responses beyond this are evicted")
+    parser.add_argument('--cache-max-age-days', type=float, default=30, help="Cached responses older than this are ignored and evicted")
+    return parser
+
+def main(argv=None):
+    # parse_known_args so the notebook kernel's own arguments (e.g. '-f kernel.json') are ignored in Colab.
+    args, _ = build_arg_parser().parse_known_args(argv)
+    recorder = configure_telemetry(args.telemetry, args.telemetry_log)
+    exports = parse_export_formats(args.formats)
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache, max_entries=args.cache_max_entries,
+                              max_age=args.cache_max_age_days * 24 * 3600)
+
+    if args.tailor and not args.profile:
+        raise SystemExit("--tailor needs the candidate's --profile PROFILE_JSON")
+    if args.stream and args.render_workers > 0:
+        raise SystemExit("--render-workers cannot be combined with --stream, which lays PDFs out as the text arrives")
+    sections = None
+    if args.sectioned:
+        from .sections import SectionedResumeGenerator
+        sections = SectionedResumeGenerator(cache)
+
+    if args.batch or args.serve or args.tailor:
+        from .render_pool import PDFRenderPool
+        from .scheduler import GenerationScheduler
+        from .sinks import LocalDirectorySink, ZipArchiveSink
+        from .stub import StubGeminiClient
+
+        # Created before any other threads start; see PDFRenderPool.
+        render_pool = PDFRenderPool(args.render_workers) if args.render_workers > 0 else None
+        scheduler = GenerationScheduler(client=StubGeminiClient() if args.stub_llm else None,
+                                        max_in_flight=args.concurrency, requests_per_minute=args.rpm,
+                                        tokens_per_minute=args.tpm, timeout=args.timeout, max_retries=args.max_retries,
+                                        cache=cache)
+        api_keys = [k.strip() for k in (args.api_key or ('stub' if args.stub_llm else '')).split(',') if k.strip()]
+        sink = ZipArchiveSink(args.archive) if args.archive else None
+        try:
+            if args.serve:
+                run_service(args, scheduler, sink or LocalDirectorySink(args.output_dir), api_keys, render_pool,
+                            sections, exports)
+            elif args.tailor:
+                from .multi_job import run_tailoring
+                run_tailoring(args.profile, args.tailor, args.output_dir, default_api_keys=api_keys,
+                              scheduler=scheduler, mode=args.tailor_mode, jobs_per_request=args.jobs_per_request,
+                              render_pool=render_pool, sink=sink)
+            else:
+                from .batch import run_batch
+                run_batch(args.batch, args.output_dir, default_api_keys=api_keys, scheduler=scheduler,
+                          stream=args.stream, render_pool=render_pool, sink=sink, sections=sections,
+                          exports=exports)
+        finally:
+            if sink is not None:
+                sink.close()
+            if render_pool is not None:
+                render_pool.close()
+    else:
+        run_interactive(cache=cache, stream=args.stream, display=get_display(args.display), sections=sections,
+                        exports=exports)
+
+    if cache is not None:
+        stats = cache.stats()
+        print(f"Response cache: {stats['hits']} hit(s), {stats['misses']} miss(es), {stats['entries']} stored.")
+        cache.close()
+
+    if recorder is not None:
+        from . import telemetry
+        exporter = recorder.find(telemetry.PrometheusExporter)
+        if exporter is not None and not args.serve:
+            if args.metrics_file:
+                with open(args.metrics_file, 'w', encoding='utf-8') as f:
+                    f.write(exporter.render())
+            else:
+                print("\n--- Metrics ---")
+                print(exporter.render(), end='')
+        telemetry.configure()
@@ -0,0 +1,68 @@
+"""
+Display backends for the interactive flow: how previews are shown and finished files handed to the user.
+
+IPython and google.colab are optional. They are imported only by the backend that uses them, and
+`get_display('auto')` picks a backend by checking which environment has already loaded them.
+"""
+import sys
+
+# --- Display Backends ---
+
+class ConsoleDisplay:
+    """
+    Plain terminal output: previews are printed as text and files are left where they were written.
+    """
+    name = 'console'
+
+    def show_markdown(self, title, text):
+        print(f"\n--- {title} ---")
+        print(text)
+
+    def deliver_file(self, path):
+        print(f"Saved '{path}'.")
+
+class IPythonDisplay(ConsoleDisplay):
+    """
+    Jupyter/IPython: previews are rendered as Markdown in the notebook.
+    """
+    name = 'ipython'
+
+    def show_markdown(self, title, text):
+        from IPython.display import display, Markdown
+        print(f"\n--- {title} ---")
+        display(Markdown(text))
+
+class ColabDisplay(IPythonDisplay):
+    """
+    Google Colab: Markdown previews, and files are downloaded to the user's machine.
+    """
+    name = 'colab'
+
+    def deliver_file(self, path):
+        from google.colab import files
+        print(f"\nAttempting to download '{path}'...")
+        files.download(path)
+        print(f"'{path}' downloaded successfully!")
+
+DISPLAY_BACKENDS = {
+    'console': ConsoleDisplay,
+    'ipython': IPythonDisplay,
+    'colab': ColabDisplay,
+}
+
+def get_display(name='auto'):
+    """
+    Returns the display backend called `name`. 'auto' chooses Colab or IPython when running inside one
+    (their modules are already loaded there), otherwise the console.
+    """
+    if name == 'auto':
+        if 'google.colab' in sys.modules:
+            name = 'colab'
+        elif 'IPython' in sys.modules and getattr(sys.modules['IPython'], 'get_ipython', lambda: None)() is not None:
+            name = 'ipython'
+        else:
+            name = 'console'
+    try:
+        return DISPLAY_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown display backend: {name!r}") from None
@@ -0,0 +1,370 @@
+"""Format-independent document model for generated resumes and cover letters, and the parsers that build it."""
+import re
+
+# --- Document Model and Parsing ---
+
+# Resume section headings as they appear (lowercased) in the AI output, mapped to the heading shown in the PDF.
+RESUME_SECTION_HEADERS = {
+    "work experience": "WORK EXPERIENCE",
+    "education": "EDUCATION",
+    "skills": "SKILLS",
+    "projects": "PROJECTS",
+}
+JOB_TITLE_TERMS = ["strategist", "developer", "engineer", "analyst", "manager"]
+SKILLS_SUBHEADINGS = frozenset(["programming/technical", "tools & platforms", "concepts"])
+# One regex scan per line instead of a substring search per job title term.
+JOB_TITLE_PATTERN = re.compile("|".join(map(re.escape, JOB_TITLE_TERMS)))
+# Complete texts are fed to the parsers in slices of this many characters, so only one slice's lines are
+# split out at a time rather than a copy of every line of the document.
+FEED_CHUNK_SIZE = 16384
+
+class ContactBlock:
+    """Candidate name and the contact details parsed from the contact line."""
+    __slots__ = ('name', 'details')
+
+    def __init__(self, name, details):
+        self.name = name
+        self.details = details
+
+class Summary:
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+class Section:
+    """
+    A resume section ('WORK EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS') and its items.
+    A section with key None holds untitled text found before the first heading.
+    """
+    __slots__ = ('key', 'items')
+
+    def __init__(self, key, items=None):
+        self.key = key
+        self.items = items if items is not None else []
+
+class Entry:
+    """
+    A job or qualification heading. organization and dates are None when the line could not be split into them.
+    """
+    __slots__ = ('title', 'organization', 'dates')
+
+    def __init__(self, title, organization=None, dates=None):
+        self.title = title
+        self.organization = organization
+        self.dates = dates
+
+class Bullet:
+    """A bullet point; `raw` keeps the line as the AI wrote it, `text` has the bullet marker removed."""
+    __slots__ = ('raw', 'text')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.text = raw.lstrip('*').strip()
+
+class TextLine:
+    """
+    A plain line of text. emphasis is None or 'italic'.
+    gap_after marks skills lines followed by another item rather than a skills sub-heading.
+    """
+    __slots__ = ('text', 'emphasis', 'gap_after')
+
+    def __init__(self, text, emphasis=None):
+        self.text = text
+        self.emphasis = emphasis
+        self.gap_after = False
+
+class SkillLine:
+    """A 'Label: value' line in the skills section."""
+    __slots__ = ('label', 'value', 'gap_after')
+
+    def __init__(self, label, value):
+        self.label = label
+        self.value = value
+        self.gap_after = False
+
+class ResumeDocument:
+    """
+    Parsed resume: optional contact block and summary followed by the sections in document order.
+    Independent of any output format, so one parse can be rendered to PDF or any other format.
+    """
+    __slots__ = ('contact', 'summary', 'sections')
+
+    def __init__(self):
+        self.contact = None
+        self.summary = None
+        self.sections = []
+
+    def nodes(self):
+        """
+        Yields (node, section) pairs in reading order, the same order ResumeParser reports them while parsing.
+        """
+        if self.contact is not None:
+            yield self.contact, None
+        if self.summary is not None:
+            yield self.summary, None
+        for section in self.sections:
+            yield section, section
+            for item in section.items:
+                yield item, section
+
+class LetterParagraph:
+    """A cover letter paragraph. kind is 'salutation', 'body', 'closing' or 'signature'."""
+    __slots__ = ('kind', 'text')
+
+    def __init__(self, kind, text):
+        self.kind = kind
+        self.text = text
+
+class CoverLetterDocument:
+    __slots__ = ('paragraphs',)
+
+    def __init__(self):
+        self.paragraphs = []
+
+    def nodes(self):
+        for paragraph in self.paragraphs:
+            yield paragraph, None
+
+class ResumeParser:
+    """
+    Single-pass, line-oriented state machine that turns resume text into a ResumeDocument.
+    Text can be fed in arbitrary chunks (e.g. straight from a streamed response); every finished node is
+    passed to `on_node(node, section)` as soon as it is complete, in the order ResumeDocument.nodes() yields them.
+
+    Before the contact line is found, lines are held back: once a line containing the candidate's name and
+    an email/LinkedIn URL arrives they are dropped and the line becomes the contact block, followed by the
+    Summary section. If a section heading arrives first, the held-back lines become an untitled section
+    instead. After that each line is classified according to the current section.
+
+    With retain=False nodes are only reported, not added to the document's sections, so memory stays
+    bounded however long the text is; close() then returns a document without its sections.
+    """
+    def __init__(self, your_name, on_node=None, retain=True):
+        self.your_name = your_name
+        self.on_node = on_node
+        self.retain = retain
+        self.document = ResumeDocument()
+        self._name_lower = your_name.lower()
+        self._buffer = ""
+        self._state = 'prelude' # prelude -> intro -> summary -> sections
+        self._prelude_lines = []
+        self._summary_lines = []
+        self._section = None
+        self._gap_pending = None # Skills item whose gap_after depends on the next line
+
+    def feed(self, text):
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split('\n')
+        for line in lines:
+            self._process_line(line)
+
+    def close(self):
+        """
+        Processes any remaining buffered text and returns the finished ResumeDocument.
+        """
+        self._process_line(self._buffer)
+        self._buffer = ""
+        if self._gap_pending is not None:
+            self._report(self._gap_pending, self._section) # Last line of the document never gets a gap
+            self._gap_pending = None
+
+        if self._state == 'prelude':
+            self._flush_prelude()
+        elif self._state == 'summary':
+            self._flush_summary()
+        return self.document
+
+    def _report(self, node, section):
+        if self.on_node:
+            self.on_node(node, section)
+
+    def _open_section(self, key):
+        self._section = Section(key)
+        if self.retain:
+            self.document.sections.append(self._section)
+        self._report(self._section, self._section)
+
+    def _add_item(self, item):
+        if self.retain:
+            self._section.items.append(item)
+        self._report(item, self._section)
+
+    def _flush_prelude(self):
+        if self._prelude_lines:
+            self._open_section(None)
+            for prelude_line in self._prelude_lines:
+                self._add_item(TextLine(prelude_line))
+        self._prelude_lines = []
+
+    def _flush_summary(self):
+        if self._summary_lines:
+            self.document.summary = Summary(" ".join(self._summary_lines))
+            self._report(self.document.summary, None)
+        self._summary_lines = []
+
+    def _process_line(self, line):
+        stripped_line = line.strip()
+        lowered = stripped_line.lower()
+        if self._gap_pending is not None:
+            self._gap_pending.gap_after = bool(stripped_line) and lowered not in SKILLS_SUBHEADINGS
+            self._report(self._gap_pending, self._section)
+            self._gap_pending = None
+        if not stripped_line:
+            return
+
+        # --- Stage 1: Introductory/Contact/Summary Block ---
+        if self._state == 'prelude':
+            if self._name_lower in lowered and ('@' in stripped_line or 'linkedin.com' in stripped_line):
+                self._prelude_lines = []
+                contact_line_content = stripped_line.replace(self.your_name, '').strip()
+                contact_line_content = contact_line_content.replace("(Highly Recommended)", "").strip()
+                details = [p.strip() for p in contact_line_content.split('|') if p.strip()]
+                self.document.contact = ContactBlock(self.your_name, details)
+                self._report(self.document.contact, None)
+                self._state = 'intro'
+                return
+            if lowered not in RESUME_SECTION_HEADERS:
+                self._prelude_lines.append(stripped_line)
+                return
+            self._flush_prelude()
+            self._state = 'sections'
+        elif self._state == 'intro':
+            if lowered == "summary":
+                self._state = 'summary'
+                return
+            if lowered not in RESUME_SECTION_HEADERS:
+                return # Text between the contact line and the first section is not kept
+            self._state = 'sections'
+        elif self._state == 'summary':
+            if lowered == "summary":
+                self._summary_lines = [] # Only the last Summary heading's text is used
+                return
+            if lowered not in RESUME_SECTION_HEADERS:
+                self._summary_lines.append(stripped_line)
+                return
+            self._flush_summary()
+            self._state = 'sections'
+
+        # --- Stage 2: Main Content Sections (Work Experience, Education, Skills, Projects) ---
+        section_key = RESUME_SECTION_HEADERS.get(lowered)
+        if section_key is not None:
+            self._open_section(section_key)
+            return
+
+        current = self._section.key
+        if current == "WORK EXPERIENCE":
+            if ' | ' in stripped_line and JOB_TITLE_PATTERN.search(lowered):
+                job_title_parts = stripped_line.split(' | ')
+                if len(job_title_parts) >= 3:
+                    self._add_item(Entry(job_title_parts[0], job_title_parts[1], job_title_parts[2]))
+                else:
+                    self._add_item(Entry(stripped_line))
+            elif stripped_line.startswith('*'):
+                self._add_item(Bullet(stripped_line))
+            else:
+                self._add_item(TextLine(stripped_line))
+
+        elif current == "EDUCATION":
+            if ' | ' in stripped_line:
+                edu_parts = stripped_line.split(' | ')
+                self._add_item(Entry(edu_parts[0], edu_parts[1]))
+            elif lowered.startswith('graduated:'):
+                self._add_item(TextLine(stripped_line, emphasis='italic'))
+            else:
+                self._add_item(TextLine(stripped_line))
+
+        elif current == "SKILLS":
+            if ':' in stripped_line:
+                label, value = stripped_line.split(':', 1)
+                item = SkillLine(label.strip(), value.strip())
+            else:
+                item = TextLine(stripped_line)
+            # Reported once the next line shows whether a gap follows it.
+            if self.retain:
+                self._section.items.append(item)
+            self._gap_pending = item
+
+        elif current == "PROJECTS":
+            if stripped_line.startswith('*'):
+                self._add_item(Bullet(stripped_line))
+            else:
+                self._add_item(TextLine(stripped_line))
+
+class CoverLetterParser:
+    """
+    Paragraph-oriented cover letter parser: each blank-line separated paragraph is classified
+    and passed to `on_node(paragraph, None)` as soon as it is complete. retain=False works as in ResumeParser.
+    """
+    def __init__(self, your_name, on_node=None, retain=True):
+        self.your_name = your_name
+        self.on_node = on_node
+        self.retain = retain
+        self.document = CoverLetterDocument()
+        self._name_lower = your_name.lower()
+        self._buffer = ""
+
+    def feed(self, text):
+        self._buffer += text
+        *paragraphs, self._buffer = self._buffer.split('\n\n')
+        for para in paragraphs:
+            self._process_paragraph(para)
+
+    def close(self):
+        self._process_paragraph(self._buffer)
+        self._buffer = ""
+        return self.document
+
+    def _process_paragraph(self, para):
+        clean_para = para.strip()
+        if not clean_para:
+            return
+        lowered = clean_para.lower()
+        if lowered.startswith("dear"):
+            kind = 'salutation'
+        elif lowered.startswith("sincerely,") or lowered.startswith("best regards,"):
+            kind = 'closing'
+        elif lowered == self._name_lower:
+            kind = 'signature'
+        else:
+            kind = 'body'
+        paragraph = LetterParagraph(kind, clean_para)
+        if self.retain:
+            self.document.paragraphs.append(paragraph)
+        if self.on_node:
+            self.on_node(paragraph, None)
+
+def make_parser(your_name, is_cover_letter=False, on_node=None, retain=True):
+    parser_class = CoverLetterParser if is_cover_letter else ResumeParser
+    return parser_class(your_name, on_node, retain)
+
+def iter_text_chunks(content_text, size=FEED_CHUNK_SIZE):
+    """
+    Yields a complete text in slices of `size` characters, for the incremental parsers.
+    """
+    for start in range(0, len(content_text), size):
+        yield content_text[start:start + size]
+
+def iter_document_nodes(text_chunks, your_name, is_cover_letter=False):
+    """
+    Parses a document arriving as an iterator of text chunks and yields (node, section) pairs as soon as
+    each node is complete, in ResumeDocument.nodes() order, without keeping the nodes.
+    """
+    pending = []
+    parser = make_parser(your_name, is_cover_letter, on_node=lambda node, section: pending.append((node, section)),
+                         retain=False)
+    for chunk in text_chunks:
+        parser.feed(chunk)
+        if pending:
+            yield from pending
+            pending.clear()
+    parser.close()
+    yield from pending
+
+def parse_document(content_text, your_name, is_cover_letter=False):
+    """
+    Parses complete AI output into a ResumeDocument or CoverLetterDocument.
+    """
+    parser = make_parser(your_name, is_cover_letter)
+    parser.feed(content_text)
+    return parser.close()
@@ -0,0 +1,274 @@
+"""Google Gemini access: pooled clients, structured errors and the blocking generation helpers.
+
+google.generativeai is imported only when the first model is created, so modules that merely
+handle errors or prompts do not pay for it.
+"""
+import asyncio
+import datetime
+import hashlib
+import itertools
+import threading
+import time
+
+from . import telemetry
+from .prompts import PrefixedPrompt, build_resume_prompt, build_cover_letter_prompt
+
+# --- AI Model Interaction with Google Gemini Only ---
+
+# HTTP status codes worth retrying: rate limiting and transient server-side failures.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class AIGenerationError(Exception):
+    """
+    Raised when the AI model could not produce text for a prompt.
+    Carries the HTTP status code (when the API reported one), how many attempts were made
+    and whether the failure was transient, so callers can report it instead of using it as a document.
+    """
+    def __init__(self, message, status_code=None, attempts=1, retryable=False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.attempts = attempts
+        self.retryable = retryable
+
+    def to_dict(self):
+        return {'error': str(self), 'status_code': self.status_code,
+                'attempts': self.attempts, 'retryable': self.retryable}
+
+def get_status_code(exc):
+    """
+    Returns the HTTP status code carried by an API exception, or None.
+    google.api_core exceptions expose it as an integer `code` attribute.
+    """
+    code = getattr(exc, 'status_code', None)
+    if code is None:
+        code = getattr(exc, 'code', None)
+    return int(code) if isinstance(code, int) else None
+
+def is_retryable_error(exc):
+    """
+    Decides whether a failed AI request is worth retrying (rate limits, 5xx, timeouts, dropped connections).
+    """
+    if isinstance(exc, AIGenerationError):
+        return exc.retryable
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    return get_status_code(exc) in RETRYABLE_STATUS_CODES
+
+DEFAULT_MODEL_NAME = 'gemini-2.5-flash'
+# Seconds before the API client gives up on one request.
+DEFAULT_REQUEST_TIMEOUT = 120.0
+
+def estimate_tokens(text):
+    """
+    Cheap token estimate (~4 characters per token), used for tokens-per-minute limiting and token metrics
+    without an extra API call.
+    """
+    return max(1, len(text) // 4)
+
+# --- google-generativeai Internals ---
+# GenerativeModel normally uses the process-wide client from genai.configure(), which is rebuilt on every
+# configure() call and can only hold one key, and the SDK has no public way to give a model its own client or
+# to wrap a CachedContent created through such a client. These two helpers are the only code relying on SDK
+# internals. They were checked against google-generativeai 0.8.6; pyproject.toml pins 0.8.x, and
+# tests/test_llm.py fails if a release changes either one.
+
+def _bind_api_client(model, api_key):
+    """
+    Gives `model` its own service client for `api_key`, so its connection is reused across calls and several
+    keys can be used side by side from worker threads.
+    """
+    from google.ai import generativelanguage as glm
+
+    if '_client' not in vars(model):
+        raise RuntimeError("This google-generativeai release no longer keeps a per-model client "
+                           "(GenerativeModel._client); install google-generativeai 0.8.x.")
+    model._client = glm.GenerativeServiceClient(client_options={'api_key': api_key})
+    return model
+
+def _wrap_cached_content(cached):
+    # genai.caching.CachedContent's public constructors go through the process-wide client.
+    import google.generativeai as genai
+
+    return genai.caching.CachedContent._from_obj(cached)
+
+def make_gemini_model(api_key, model_name=DEFAULT_MODEL_NAME):
+    """
+    Builds a GenerativeModel bound to its own API client for `api_key`.
+    """
+    # Imported here so that code which never talks to the API does not pay google-generativeai's import cost.
+    import google.generativeai as genai
+
+    return _bind_api_client(genai.GenerativeModel(model_name), api_key)
+
+# Gemini refuses to cache contexts shorter than this many tokens.
+MIN_CONTEXT_CACHE_TOKENS = 1024
+DEFAULT_CONTEXT_CACHE_TTL = 3600
+
+def make_cached_gemini_model(api_key, model_name, prefix, ttl_seconds=DEFAULT_CONTEXT_CACHE_TTL):
+    """
+    Stores `prefix` as a Gemini cached context for `ttl_seconds` and returns a GenerativeModel bound to it,
+    so requests through the model only send their suffix and the cached tokens are billed at the cached rate.
+    """
+    import google.generativeai as genai
+    from google.ai import generativelanguage as glm
+
+    # Created with a per-key cache client, like the service clients of _bind_api_client.
+    cache_client = glm.CacheServiceClient(client_options={'api_key': api_key})
+    cached = cache_client.create_cached_content(glm.CreateCachedContentRequest(cached_content=glm.CachedContent(
+        model=f"models/{model_name}", contents=[glm.Content(role='user', parts=[glm.Part(text=prefix)])],
+        ttl=datetime.timedelta(seconds=ttl_seconds))))
+    return _bind_api_client(genai.GenerativeModel.from_cached_content(_wrap_cached_content(cached)), api_key)
+
+class GeminiClientPool:
+    """
+    Creates one configured model per (API key, model name) the first time it is needed and reuses it afterwards,
+    so repeated calls skip client setup and keep their HTTP/gRPC connection. Safe to share across threads.
+
+    When created with several `api_keys`, calls made without an explicit key are spread across them round-robin.
+    `model_factory(api_key, model_name)` can be replaced, e.g. with a stub for benchmarks.
+
+    For a PrefixedPrompt whose prefix is long enough for Gemini context caching, the prefix is cached once
+    per key (by `cached_model_factory`, for `context_cache_ttl` seconds) and only the suffix is sent.
+    If the cache cannot be created the full prompt is sent instead, and that prefix is not tried again.
+
+    Each request is abandoned by the API client after `timeout` seconds, so a hung call cannot hold a thread.
+    """
+    def __init__(self, api_keys=None, model_name=DEFAULT_MODEL_NAME, model_factory=make_gemini_model,
+                 cached_model_factory=make_cached_gemini_model, context_cache_ttl=DEFAULT_CONTEXT_CACHE_TTL,
+                 timeout=DEFAULT_REQUEST_TIMEOUT):
+        self.api_keys = [k for k in (api_keys or []) if k]
+        self.model_name = model_name
+        self.timeout = timeout
+        self.model_factory = model_factory
+        self.cached_model_factory = cached_model_factory
+        self.context_cache_ttl = context_cache_ttl
+        self._models = {}
+        self._cached_models = {}
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._key_cycle = itertools.cycle(self.api_keys) if self.api_keys else None
+
+    def next_api_key(self):
+        """
+        Returns the next of the pool's API keys in round-robin order.
+        """
+        if self._key_cycle is None:
+            raise ValueError("GeminiClientPool has no API keys to choose from.")
+        with self._lock:
+            return next(self._key_cycle)
+
+    def get_model(self, api_key, model_name=None):
+        key = (api_key, model_name or self.model_name)
+        model = self._models.get(key)
+        if model is None:
+            with self._lock:
+                model = self._models.get(key)
+                if model is None:
+                    model = self._models[key] = self.model_factory(*key)
+        return model
+
+    def get_cached_model(self, api_key, prefix, model_name=None):
+        """
+        Returns a model bound to a cached context holding `prefix`, creating (or renewing) the cache when
+        needed, or None when the prefix is too short to cache or caching it failed.
+        """
+        if estimate_tokens(prefix) < MIN_CONTEXT_CACHE_TOKENS:
+            return None
+        model_name = model_name or self.model_name
+        key = (api_key, model_name, hashlib.sha256(prefix.encode('utf-8')).hexdigest())
+        entry = self._cached_models.get(key, ())
+        if entry and (entry[0] is None or entry[1] > time.monotonic()):
+            return entry[0]
+        # Creating a cached context is a network call, so it has its own lock rather than holding self._lock.
+        with self._cache_lock:
+            entry = self._cached_models.get(key, ())
+            if entry and (entry[0] is None or entry[1] > time.monotonic()):
+                return entry[0]
+            try:
+                model = self.cached_model_factory(api_key, model_name, prefix, self.context_cache_ttl)
+                telemetry.count('context_cache_created')
+            except Exception as e:
+                print(f"Context caching unavailable, sending full prompts instead: {e}")
+                model = None
+            # Renewed a minute before the server-side TTL runs out.
+            self._cached_models[key] = (model, time.monotonic() + self.context_cache_ttl - 60)
+            return model
+
+    def _model_and_contents(self, prompt, api_key, model_name):
+        api_key = api_key or self.next_api_key()
+        if isinstance(prompt, PrefixedPrompt):
+            model = self.get_cached_model(api_key, prompt.prefix, model_name)
+            if model is not None:
+                return model, prompt.suffix
+        return self.get_model(api_key, model_name), str(prompt)
+
+    def generate(self, prompt, api_key=None, model_name=None):
+        """
+        Generates text for the prompt with the pooled model for `api_key` (or the next pool key).
+        Raises AIGenerationError if the API call fails.
+        """
+        try:
+            model, contents = self._model_and_contents(prompt, api_key, model_name)
+            response = model.generate_content(contents, request_options={'timeout': self.timeout})
+            return response.text.strip()
+        except Exception as e:
+            raise AIGenerationError(f"Error communicating with AI: {e}", status_code=get_status_code(e),
+                                    retryable=is_retryable_error(e)) from e
+
+    def generate_stream(self, prompt, api_key=None, model_name=None):
+        """
+        Like generate, but yields the response text in chunks as the API streams them.
+        Raises AIGenerationError if the API call fails, including part-way through the stream.
+        """
+        try:
+            model, contents = self._model_and_contents(prompt, api_key, model_name)
+            for chunk in model.generate_content(contents, stream=True, request_options={'timeout': self.timeout}):
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise AIGenerationError(f"Error communicating with AI: {e}", status_code=get_status_code(e),
+                                    retryable=is_retryable_error(e)) from e
+
+    __call__ = generate
+
+DEFAULT_CLIENT_POOL = GeminiClientPool()
+
+def generate_text_with_ai(prompt, api_key, model_name=DEFAULT_MODEL_NAME, cache=None):
+    """
+    Connects to the Google Gemini API and generates text based on the provided prompt.
+    Uses the shared client pool, so the client for each API key is only set up once.
+    If a ResponseCache is given, a cached response for the same model and prompt is returned without any API call.
+    Raises AIGenerationError if the API call fails.
+    """
+    if cache is not None:
+        cache_key = cache.make_key(model_name, prompt)
+        text = cache.get(cache_key)
+        telemetry.count('cache_lookups', result='hit' if text is not None else 'miss')
+        if text is not None:
+            return text
+
+    with telemetry.span('ai.request', attempt=1, streaming=False):
+        text = DEFAULT_CLIENT_POOL.generate(prompt, api_key, model_name)
+    telemetry.count('ai_prompt_tokens', estimate_tokens(prompt))
+    telemetry.count('ai_response_tokens', estimate_tokens(text))
+    if cache is not None:
+        cache.put(cache_key, text, model_name)
+    return text
+
+def generate_resume_content(user_data, cache=None):
+    """
+    Generates resume content for the candidate with a single blocking AI call (or a cache hit).
+    """
+    print("\nGenerating Resume...")
+    with telemetry.span('prompt.build', kind='resume'):
+        prompt = build_resume_prompt(user_data)
+    return generate_text_with_ai(prompt, user_data['api_key'], cache=cache)
+
+def generate_cover_letter_content(user_data, cache=None):
+    """
+    Generates cover letter content for the candidate with a single blocking AI call (or a cache hit).
+    """
+    print("Generating Cover Letter...")
+    with telemetry.span('prompt.build', kind='cover_letter'):
+        prompt = build_cover_letter_prompt(user_data)
+    return generate_text_with_ai(prompt, user_data['api_key'], cache=cache)
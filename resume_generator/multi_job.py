@@ -0,0 +1,237 @@
+"""One candidate profile tailored to many jobs, sharing the profile part of the prompt across requests."""
+import asyncio
+import csv
+import itertools
+import json
+import time
+
+from . import telemetry
+from .batch import _batch_entry
+from .llm import MIN_CONTEXT_CACHE_TOKENS, AIGenerationError, estimate_tokens
+from .pipeline import DOCUMENT_KINDS, render_document_pdf, run_coroutine_sync, write_document_pdf
+from .prompts import (JOB_FIELDS, CandidateProfile, build_cover_letter_prompt, build_multi_job_prompt,
+                      build_prefixed_cover_letter_prompt, build_prefixed_resume_prompt, build_profile_prefix,
+                      build_resume_prompt)
+from .scheduler import GenerationScheduler
+from .sinks import LocalDirectorySink
+from .user_input import build_output_filenames, normalize_user_data
+
+# --- Multi-Job Tailoring ---
+
+# 'cached': one request per document, profile sent as a shared prefix served from Gemini context caching
+#           (profiles too short to cache are sent as the standard prompts instead, which are shorter);
+# 'batched': both documents for several jobs in one structured request;
+# 'separate': the standard per-document prompts, as a batch of one record per job would send them.
+TAILOR_MODES = ('cached', 'batched', 'separate')
+
+def read_job_targets(job_file):
+    """
+    Reads the target jobs (records with the JOB_FIELDS, plus an optional 'record_id') from a JSONL or CSV file.
+    Returns a list of (job_id, job) pairs; job_id defaults to the record's position in the file. Records that
+    cannot be parsed are returned with a ValueError naming the file and line in place of the job, as
+    read_batch_records does, so the caller can report them.
+    """
+    is_csv = job_file.lower().endswith('.csv')
+    targets = []
+    with open(job_file, newline='', encoding='utf-8') as f:
+        if is_csv:
+            reader = csv.DictReader(f)
+            rows = ((reader.line_num, record) for record in reader)
+        else:
+            rows = ((line_number, line) for line_number, line in enumerate(f, start=1) if line.strip())
+        for position, (line_number, record) in enumerate(rows, start=1):
+            try:
+                if not is_csv:
+                    record = json.loads(record)
+                job_id = str(record.get('record_id') or position)
+                targets.append((job_id, {field: str(record.get(field) or '').strip() for field in JOB_FIELDS}))
+            except (ValueError, AttributeError) as e:
+                targets.append((str(position), ValueError(f"{job_file}, line {line_number}: {e}")))
+    return targets
+
+def job_user_data(user_data, job):
+    """
+    Returns the candidate's user_data with the job fields of `job` in place of its own.
+    """
+    return {**user_data, **{field: job.get(field) or '' for field in JOB_FIELDS}}
+
+def _strip_code_fence(text):
+    text = text.strip()
+    if text.startswith('```'):
+        text = text.split('\n', 1)[1] if '\n' in text else ''
+        if text.rstrip().endswith('```'):
+            text = text.rstrip()[:-3]
+    return text
+
+def parse_multi_job_response(text, job_count):
+    """
+    Parses the reply to a build_multi_job_prompt request. Returns {job_number: {'resume': ..., 'cover_letter': ...}}
+    for the jobs (numbered from 1 to `job_count`) the reply answered completely; jobs that are missing or
+    malformed are left out so the caller can request them on their own. An unparseable reply gives {}.
+    """
+    try:
+        entries = json.loads(_strip_code_fence(text))
+    except ValueError:
+        return {}
+    if not isinstance(entries, list):
+        return {}
+    parsed = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        number, resume, cover_letter = entry.get('job'), entry.get('resume'), entry.get('cover_letter')
+        if isinstance(number, str) and number.isdigit():
+            number = int(number)
+        if (isinstance(number, int) and 1 <= number <= job_count and isinstance(resume, str) and resume.strip()
+                and isinstance(cover_letter, str) and cover_letter.strip()):
+            parsed[number] = {'resume': resume.strip(), 'cover_letter': cover_letter.strip()}
+    return parsed
+
+class _Tailoring:
+    # State shared by the tasks of one run_multi_job_pipeline call.
+    def __init__(self, user_data, scheduler, sink, mode, render_pool):
+        self.user_data = user_data
+        self.scheduler = scheduler
+        self.sink = sink
+        self.render_pool = render_pool
+        with telemetry.span('prompt.build', kind='profile'):
+            self.profile = CandidateProfile(user_data)
+            self.prefix = build_profile_prefix(self.profile) if mode != 'separate' else None
+        # Below the context caching minimum nothing is cached, and the prefix plus a job suffix is longer than
+        # the standard prompts, so a short profile is sent the 'separate' way.
+        if mode == 'cached' and estimate_tokens(self.prefix) < MIN_CONTEXT_CACHE_TOKENS:
+            print(f"The profile is below the {MIN_CONTEXT_CACHE_TOKENS}-token context caching minimum; "
+                  "sending the standard prompts instead.")
+            self.prefix = None
+            mode = 'separate'
+        self.mode = mode
+
+    def prompt(self, kind, job):
+        if self.prefix is None:
+            build = build_resume_prompt if kind == 'resume' else build_cover_letter_prompt
+            return build(job_user_data(self.user_data, job), self.profile)
+        build = build_prefixed_resume_prompt if kind == 'resume' else build_prefixed_cover_letter_prompt
+        return build(self.prefix, job)
+
+    async def generate(self, kind, job, api_key):
+        with telemetry.span('generate', kind=kind):
+            return await self.scheduler.generate(self.prompt(kind, job), api_key)
+
+    async def finish(self, job_id, job, texts, started):
+        """
+        Renders and stores both documents of one job from their generated `texts` and returns its entry.
+        """
+        entry = _batch_entry(job_id)
+        candidate = job_user_data(self.user_data, job)
+        pdf_names = dict(zip(DOCUMENT_KINDS, build_output_filenames(candidate, prefix=job_id)))
+
+        async def render(kind):
+            pdf_bytes = await render_document_pdf(kind, texts[kind], candidate, self.render_pool)
+            return await write_document_pdf(kind, pdf_bytes, pdf_names[kind], self.sink)
+
+        locations = dict(zip(DOCUMENT_KINDS, await asyncio.gather(*(render(kind) for kind in DOCUMENT_KINDS))))
+        entry['timings'] = {'total': round(time.perf_counter() - started, 4)}
+        failed = [pdf_names[kind] for kind in DOCUMENT_KINDS if locations[kind] is None]
+        if failed:
+            entry['error'] = f"Failed to create '{failed[0]}'."
+            return entry
+        entry.update(status='ok', resume_pdf=locations['resume'], cover_letter_pdf=locations['cover_letter'])
+        return entry
+
+    async def run_job(self, job_id, job, api_key, texts=None):
+        # `texts` holds documents already generated for this job (by a batched request).
+        started = time.perf_counter()
+        texts = dict(texts or {})
+        try:
+            missing = [kind for kind in DOCUMENT_KINDS if kind not in texts]
+            texts.update(zip(missing, await asyncio.gather(*(self.generate(kind, job, api_key) for kind in missing))))
+        except AIGenerationError as e:
+            entry = _batch_entry(job_id)
+            entry.update(e.to_dict())
+            return entry
+        return await self.finish(job_id, job, texts, started)
+
+    async def run_group(self, group, api_key):
+        # One structured request for every job in `group`; jobs the reply does not answer are requested alone.
+        prompt = build_multi_job_prompt(self.prefix, [job for _, job in group])
+        try:
+            with telemetry.span('generate', kind='multi_job', jobs=len(group)):
+                reply = await self.scheduler.generate(prompt, api_key)
+            answers = parse_multi_job_response(reply, len(group))
+        except AIGenerationError as e:
+            print(f"Batched request for {len(group)} job(s) failed ({e}); requesting them one by one.")
+            answers = {}
+        if len(answers) < len(group):
+            telemetry.count('multi_job_fallbacks', len(group) - len(answers))
+        return await asyncio.gather(*(self.run_job(job_id, job, api_key, answers.get(number))
+                                      for number, (job_id, job) in enumerate(group, start=1)))
+
+async def run_multi_job_pipeline(user_data, jobs, scheduler, sink=None, mode='cached', jobs_per_request=4,
+                                 render_pool=None, api_keys=None):
+    """
+    Generates and renders a resume and cover letter tailoring one candidate (`user_data`) to each of `jobs`,
+    a list of (job_id, job) pairs where each job holds the JOB_FIELDS. The candidate profile is rendered
+    into the prompt once for all jobs:
+
+    - 'cached' sends one request per document made of the shared profile prefix and a short job-specific
+      suffix; GeminiClientPool serves the prefix from Gemini context caching, so only the suffix is billed
+      as new input for every job after the first. A profile shorter than MIN_CONTEXT_CACHE_TOKENS cannot be
+      cached, so it is sent as in 'separate', which then makes the smaller requests.
+    - 'batched' asks for both documents of up to `jobs_per_request` jobs in one structured (JSON) request,
+      sending the profile once per group. Jobs missing from a malformed or partial reply are requested
+      on their own, as in 'cached'.
+    - 'separate' sends the standard per-document prompts (what a batch with one record per job sends).
+
+    PDFs are written to `sink` (by default files relative to the current directory) under names prefixed with
+    each job_id. The jobs (or groups of jobs) are assigned `api_keys` in turn, as batch mode assigns its
+    default keys to records; by default every request uses user_data['api_key'].
+    Returns the entries for every job in order, shaped like the batch manifest entries.
+    """
+    if mode not in TAILOR_MODES:
+        raise ValueError(f"Unknown tailoring mode: {mode!r} (choose from {', '.join(TAILOR_MODES)})")
+    tailoring = _Tailoring(user_data, scheduler, sink or LocalDirectorySink(), mode, render_pool)
+    key_cycle = itertools.cycle(api_keys or [user_data['api_key']])
+    with telemetry.span('candidate', jobs=len(jobs), mode=tailoring.mode):
+        if tailoring.mode == 'batched':
+            size = max(1, jobs_per_request)
+            groups = await asyncio.gather(*(tailoring.run_group(jobs[i:i + size], next(key_cycle))
+                                            for i in range(0, len(jobs), size)))
+            return [entry for group in groups for entry in group]
+        return list(await asyncio.gather(*(tailoring.run_job(job_id, job, next(key_cycle)) for job_id, job in jobs)))
+
+def run_tailoring(profile_file, jobs_file, output_dir, default_api_keys=None, scheduler=None, mode='cached',
+                  jobs_per_request=4, render_pool=None, sink=None):
+    """
+    Tailors the candidate in `profile_file` (a JSON user_data record; its job fields are ignored) to every
+    job in `jobs_file` (see read_job_targets) with run_multi_job_pipeline, writing the PDFs to `sink`,
+    by default files in output_dir. A profile without its own api_key spreads the jobs over default_api_keys.
+    Returns a dict with counts of succeeded and failed jobs.
+    """
+    with open(profile_file, encoding='utf-8') as f:
+        record = json.load(f)
+    user_data = normalize_user_data(record, (default_api_keys or [None])[0])
+    if not user_data['api_key']:
+        print("No API key in the profile and no default API key given.")
+        return {'ok': 0, 'error': 0}
+    api_keys = None if record.get('api_key') else default_api_keys
+    targets = read_job_targets(jobs_file)
+    jobs = [(job_id, job) for job_id, job in targets if not isinstance(job, Exception)]
+    scheduler = scheduler or GenerationScheduler()
+    sink = sink or LocalDirectorySink(output_dir)
+
+    print(f"--- Tailoring {user_data['your_name']} to {len(jobs)} job(s) ({mode}) -> {output_dir} ---")
+    started = time.perf_counter()
+    entries = [_batch_entry(job_id, f"Invalid job: {job}") for job_id, job in targets if isinstance(job, Exception)]
+    entries += run_coroutine_sync(run_multi_job_pipeline(user_data, jobs, scheduler, sink=sink, mode=mode,
+                                                         jobs_per_request=jobs_per_request, render_pool=render_pool,
+                                                         api_keys=api_keys))
+    counts = {'ok': 0, 'error': 0}
+    for entry in entries:
+        counts[entry['status']] += 1
+        if entry['error']:
+            print(f"Job {entry['record_id']} failed: {entry['error']}")
+        else:
+            print(f"Job {entry['record_id']} done.")
+    print(f"\nTailoring complete in {time.perf_counter() - started:.2f}s: "
+          f"{counts['ok']} succeeded, {counts['error']} failed.")
+    return counts
@@ -0,0 +1,426 @@
+"""PDF rendering of parsed documents with ReportLab."""
+import io
+import time
+from types import MappingProxyType
+
+# Import ReportLab modules for PDF generation
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+
+from . import telemetry
+from .document import (ContactBlock, Summary, Section, Entry, Bullet, TextLine, SkillLine, ResumeDocument,
+                       LetterParagraph, CoverLetterDocument, make_parser, iter_document_nodes, iter_text_chunks)
+
+# --- PDF Generation Function ---
+
+def build_pdf_styles():
+    """
+    Returns the ReportLab stylesheet used for resumes and cover letters:
+    the sample stylesheet with adjusted headings plus the custom paragraph styles.
+    """
+    styles = getSampleStyleSheet()
+
+    # Modify existing ReportLab styles to fit resume/cover letter needs
+    styles['Heading1'].fontSize = 16
+    styles['Heading1'].leading = 18
+    styles['Heading1'].spaceBefore = 12
+    styles['Heading1'].spaceAfter = 6
+    styles['Heading1'].fontName = 'Helvetica-Bold'
+    styles['Heading1'].alignment = TA_LEFT # Align headings to left by default
+
+    styles['Heading2'].fontSize = 14
+    styles['Heading2'].leading = 16
+    styles['Heading2'].spaceBefore = 10
+    styles['Heading2'].spaceAfter = 5
+    styles['Heading2'].fontName = 'Helvetica-Bold'
+    styles['Heading2'].alignment = TA_LEFT # Align subheadings to left
+
+    # Add custom paragraph styles, inheriting properties from base styles
+    styles.add(ParagraphStyle(name='TitleStyle',
+                             parent=styles['Title'],
+                             fontSize=24,
+                             leading=28,
+                             alignment=TA_CENTER,
+                             spaceAfter=20))
+
+    styles.add(ParagraphStyle(name='BodyTextCustom',
+                             parent=styles['BodyText'],
+                             fontSize=10,
+                             leading=12,
+                             spaceAfter=6,
+                             alignment=TA_JUSTIFY))
+
+    styles.add(ParagraphStyle(name='ListItem',
+                             parent=styles['Bullet'],
+                             fontSize=10,
+                             leading=12,
+                             leftIndent=0.3*inch,
+                             spaceAfter=3))
+
+    styles.add(ParagraphStyle(name='ContactInfoCentered', # Specific for Contact info
+                             parent=styles['Normal'],
+                             fontSize=10,
+                             leading=12,
+                             alignment=TA_CENTER,
+                             spaceAfter=6)) # Add space after contact lines
+
+    styles.add(ParagraphStyle(name='AddressLine', # For cover letter address lines
+                             parent=styles['Normal'],
+                             fontSize=10,
+                             leading=12,
+                             spaceAfter=3,
+                             alignment=TA_LEFT))
+
+    styles.add(ParagraphStyle(name='Signature',
+                             parent=styles['Normal'],
+                             fontSize=10,
+                             leading=12,
+                             spaceBefore=20,
+                             alignment=TA_LEFT))
+    return styles
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """
+    ParagraphStyle that rejects changes once built, so a theme shared by many documents
+    (and threads) cannot be altered by any one of them.
+    """
+    def __init__(self, style):
+        super().__init__(style.name)
+        self.__dict__.update(style.__dict__)
+        self.__dict__['parent'] = None # Values were already copied from the parent
+        self.__dict__['_frozen'] = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f"Style '{self.name}' belongs to a PDFTheme and is frozen; build a new theme instead.")
+        super().__setattr__(name, value)
+
+class PDFTheme:
+    """
+    Compiled, read-only set of paragraph styles (and page size) used to render resumes and cover letters.
+    Building the stylesheet is the expensive part of setting up a document, so a theme is built once and
+    shared by every document rendered with it. Look styles up by name: theme['Heading1'].
+    """
+    def __init__(self, stylesheet=None, page_size=letter):
+        stylesheet = stylesheet or build_pdf_styles()
+        self.styles = MappingProxyType({name: FrozenParagraphStyle(style)
+                                        for name, style in stylesheet.byName.items()
+                                        if isinstance(style, ParagraphStyle)})
+        self.page_size = page_size
+
+    def __getitem__(self, name):
+        return self.styles[name]
+
+    def __contains__(self, name):
+        return name in self.styles
+
+_default_theme = None
+
+def get_default_theme():
+    """
+    Returns the shared default PDFTheme, compiling it on first use.
+    """
+    global _default_theme
+    if _default_theme is None:
+        _default_theme = PDFTheme()
+    return _default_theme
+
+def set_default_theme(theme):
+    """
+    Swaps the theme used by create_pdf and create_pdf_from_stream when no theme is passed explicitly.
+    """
+    global _default_theme
+    _default_theme = theme
+
+class StoryBuilder:
+    """
+    Turns AI output into ReportLab flowables incrementally by rendering each document node as the parser
+    completes it. Text can be fed in arbitrary chunks; flowables are appended to `story` as soon as enough
+    text has arrived, and `on_flowables(new_flowables)` is called for each batch.
+    """
+    def __init__(self, styles, user_data, is_cover_letter=False, on_flowables=None):
+        self.styles = styles
+        self.on_flowables = on_flowables
+        self.is_cover_letter = is_cover_letter
+        self.story = []
+        self.flowable_count = 0
+        self.parser = make_parser(user_data['your_name'], is_cover_letter, on_node=self._render_node)
+        self._renderers = {
+            ContactBlock: self._render_contact,
+            Summary: self._render_summary,
+            Section: self._render_section,
+            Entry: self._render_entry,
+            Bullet: self._render_bullet,
+            TextLine: self._render_text,
+            SkillLine: self._render_skill,
+            LetterParagraph: self._render_letter_paragraph,
+        }
+
+    def feed(self, text):
+        self.parser.feed(text)
+
+    def close(self):
+        """
+        Processes any remaining buffered text and returns the finished story.
+        """
+        document = self.parser.close()
+        if isinstance(document, ResumeDocument) and self.story:
+            self._emit(Spacer(1, 0.2 * inch))
+        return self.story
+
+    def render_document(self, document):
+        """
+        Renders an already parsed document (e.g. one kept from an earlier parse) and returns the story.
+        """
+        for node, section in document.nodes():
+            self._render_node(node, section)
+        if isinstance(document, ResumeDocument) and self.story:
+            self._emit(Spacer(1, 0.2 * inch))
+        return self.story
+
+    def iter_flowables(self, nodes):
+        """
+        Renders (node, section) pairs from a generator such as iter_document_nodes and yields each node's
+        flowables as soon as it is rendered. Nothing is kept, so memory does not grow with the document.
+        """
+        for node, section in nodes:
+            self._render_node(node, section)
+            yield from self.story
+            self.story.clear()
+        if not self.is_cover_letter and self.flowable_count:
+            self._emit(Spacer(1, 0.2 * inch))
+            yield from self.story
+            self.story.clear()
+
+    def _emit(self, *flowables):
+        self.flowable_count += len(flowables)
+        self.story.extend(flowables)
+        if self.on_flowables:
+            self.on_flowables(flowables)
+
+    def _render_node(self, node, section):
+        self._renderers[type(node)](node, section)
+
+    def _render_contact(self, contact, section):
+        # 1. Name (centered, bold), 2. Contact Info (centered)
+        self._emit(Paragraph(f"<b>{contact.name}</b>", self.styles['TitleStyle']), Spacer(1, 0.05 * inch))
+        if contact.details:
+            self._emit(Paragraph(" | ".join(contact.details), self.styles['ContactInfoCentered']), Spacer(1, 0.1 * inch))
+
+    def _render_summary(self, summary, section):
+        self._emit(Paragraph("<b>SUMMARY</b>", self.styles['Heading1']),
+                   Paragraph(summary.text, self.styles['BodyTextCustom']),
+                   Spacer(1, 0.2 * inch))
+
+    def _render_section(self, section, _):
+        if section.key is not None:
+            self._emit(Paragraph(f"<b>{section.key}</b>", self.styles['Heading1']), Spacer(1, 0.1 * inch))
+
+    def _render_entry(self, entry, section):
+        styles = self.styles
+        if section.key == "EDUCATION":
+            self._emit(Paragraph(f"<b>{entry.title}</b>", styles['Heading2']),
+                       Paragraph(entry.organization, styles['BodyTextCustom']))
+        elif entry.organization is None:
+            self._emit(Paragraph(entry.title, styles['Heading2']))
+        else:
+            self._emit(Paragraph(f"<b>{entry.title}</b> | {entry.organization}", styles['Heading2']),
+                       Paragraph(f"<i>{entry.dates}</i>", styles['BodyTextCustom']))
+
+    def _render_bullet(self, bullet, section):
+        self._emit(Paragraph(bullet.raw, self.styles['ListItem']))
+
+    def _render_text(self, line, section):
+        text = f"<i>{line.text}</i>" if line.emphasis == 'italic' else line.text
+        self._emit(Paragraph(text, self.styles['BodyTextCustom']))
+        if line.gap_after:
+            self._emit(Spacer(1, 0.05 * inch))
+
+    def _render_skill(self, skill, section):
+        self._emit(Paragraph(f"<b>{skill.label}:</b> {skill.value}", self.styles['BodyTextCustom']))
+        if skill.gap_after:
+            self._emit(Spacer(1, 0.05 * inch))
+
+    def _render_letter_paragraph(self, paragraph, section):
+        styles = self.styles
+        if paragraph.kind == 'salutation':
+            self._emit(Paragraph(paragraph.text, styles['AddressLine']), Spacer(1, 0.1 * inch))
+        elif paragraph.kind == 'closing':
+            self._emit(Paragraph(paragraph.text, styles['Signature']), Spacer(1, 0.2 * inch))
+        elif paragraph.kind == 'signature':
+            self._emit(Paragraph(paragraph.text, styles['Signature']))
+        else:
+            self._emit(Paragraph(paragraph.text, styles['BodyTextCustom']), Spacer(1, 0.1 * inch))
+
+def make_story_builder(styles, user_data, is_cover_letter=False, on_flowables=None):
+    return StoryBuilder(styles, user_data, is_cover_letter, on_flowables)
+
+class FlowableQueue(list):
+    """
+    The flowable list handed to ReportLab's doc.build, filled lazily from an iterator. build() only ever
+    takes flowables from the front (putting split remainders back there) and checks len() before looking at
+    them, so keeping `lookahead` flowables queued is enough: each flowable is dropped once it is drawn on its
+    page and the next ones are only produced (parsed, even received) when layout gets to them.
+    """
+    def __init__(self, flowables, lookahead=64):
+        super().__init__()
+        self.lookahead = lookahead
+        self.taken = 0
+        self._source = iter(flowables)
+
+    def __len__(self):
+        while self._source is not None and list.__len__(self) < self.lookahead:
+            try:
+                self.append(next(self._source))
+                self.taken += 1
+            except StopIteration:
+                self._source = None
+        return list.__len__(self)
+
+class StreamError(Exception):
+    """
+    Carries an error raised by the text stream feeding a layout, so build_pdf does not report it as a failed build.
+    """
+    def __init__(self, error):
+        super().__init__(str(error))
+        self.error = error
+
+def build_pdf(filename, story, styles, page_size=letter):
+    """
+    Lays out the story into a PDF file with ReportLab. `story` is a list of flowables or any iterable of them,
+    e.g. a generator from StoryBuilder.iter_flowables, which is consumed page by page as layout proceeds.
+    Returns True on success, False on failure.
+    """
+    doc = SimpleDocTemplate(filename, pagesize=page_size)
+    try:
+        flowables = FlowableQueue(story)
+        if not len(flowables):
+            print(f"Warning: No content was parsed for '{filename}'. PDF will be blank or almost blank.")
+            flowables.append(Paragraph("No content could be parsed for this document.", styles['BodyTextCustom']))
+            flowables.append(Paragraph("Please check the raw AI output and adjust parsing logic in create_pdf.", styles['BodyTextCustom']))
+
+        with telemetry.span('pdf.layout') as span:
+            doc.build(flowables)
+            span.set_attribute('flowables', flowables.taken)
+            span.set_attribute('pages', doc.page)
+        return True
+    except StreamError:
+        raise
+    except Exception as e:
+        print(f"Error building PDF '{filename}': {e}")
+        return False
+
+class PDFRenderer:
+    """
+    Renders resume and cover letter text to PDF files with one PDFTheme reused for every document,
+    so per-document work is only parsing and layout. Safe to share across threads.
+
+    Parsing, flowable creation and layout run as one pipeline: the text is parsed in slices, each node
+    becomes flowables only when layout needs them, and flowables are dropped once drawn. Neither the parsed
+    document nor the story is held, so apart from the PDF output itself memory stays bounded however many
+    pages the document has.
+    """
+    def __init__(self, theme=None):
+        self.theme = theme or get_default_theme()
+
+    def iter_flowables(self, text_chunks, user_data, is_cover_letter=False, on_flowables=None):
+        """
+        Yields the flowables for a document arriving as an iterator of text chunks, node by node.
+        """
+        builder = make_story_builder(self.theme, user_data, is_cover_letter, on_flowables)
+        return builder.iter_flowables(iter_document_nodes(text_chunks, user_data['your_name'], is_cover_letter))
+
+    def render(self, filename, content_text, user_data, is_cover_letter=False):
+        """
+        Renders the full text of a document. Returns True on success, False on failure.
+        """
+        flowables = self.iter_flowables(iter_text_chunks(content_text), user_data, is_cover_letter)
+        return build_pdf(filename, flowables, self.theme, self.theme.page_size)
+
+    def render_bytes(self, content_text, user_data, is_cover_letter=False):
+        """
+        Renders the document in memory and returns the PDF bytes, or None on failure.
+        """
+        buffer = io.BytesIO()
+        if not self.render(buffer, content_text, user_data, is_cover_letter):
+            return None
+        return buffer.getvalue()
+
+    def render_document(self, filename, document, user_data):
+        """
+        Renders an already parsed ResumeDocument or CoverLetterDocument, skipping the parse.
+        """
+        builder = make_story_builder(self.theme, user_data, isinstance(document, CoverLetterDocument))
+        return build_pdf(filename, builder.iter_flowables(document.nodes()), self.theme, self.theme.page_size)
+
+    def render_document_bytes(self, document, user_data):
+        """
+        Renders an already parsed document in memory and returns the PDF bytes, or None on failure.
+        """
+        buffer = io.BytesIO()
+        if not self.render_document(buffer, document, user_data):
+            return None
+        return buffer.getvalue()
+
+    def render_stream(self, filename, text_chunks, user_data, is_cover_letter=False, on_flowables=None, timings=None):
+        """
+        Renders a document from an iterator of text chunks; see create_pdf_from_stream.
+        """
+        started = time.perf_counter()
+        marks = {}
+
+        def timed(chunks):
+            try:
+                for chunk in chunks:
+                    marks.setdefault('first_chunk', time.perf_counter())
+                    yield chunk
+            except Exception as e:
+                # The stream is read inside doc.build; wrapped so build_pdf passes it on instead of reporting
+                # a failed layout, and the caller (e.g. the scheduler, which retries) sees the original error.
+                raise StreamError(e) from e
+            marks['stream_closed'] = time.perf_counter()
+
+        chunks = timed(text_chunks)
+        with telemetry.span('pdf.stream'):
+            try:
+                ok = build_pdf(filename, self.iter_flowables(chunks, user_data, is_cover_letter, on_flowables),
+                               self.theme, self.theme.page_size)
+            except StreamError as e:
+                raise e.error from None
+            # If layout failed part-way, still read the rest of the stream so the caller gets the whole text.
+            for _ in chunks:
+                pass
+        stream_closed_at = marks.get('stream_closed', time.perf_counter())
+        if timings is not None:
+            timings['first_chunk'] = marks.get('first_chunk', stream_closed_at) - started
+            timings['stream'] = stream_closed_at - started
+            timings['render'] = time.perf_counter() - stream_closed_at
+        return ok
+
+def create_pdf(filename, content_text, user_data, title="Document", is_cover_letter=False, theme=None):
+    """
+    Generates a PDF document from the given text content using ReportLab.
+    Includes highly revised parsing for resume sections based on observed AI output patterns.
+    `filename` may also be a writable binary file object such as io.BytesIO, so nothing touches the disk.
+    Uses the shared default theme unless another PDFTheme is given.
+    """
+    return PDFRenderer(theme).render(filename, content_text, user_data, is_cover_letter)
+
+def render_pdf_bytes(content_text, user_data, is_cover_letter=False, theme=None):
+    """
+    Renders a document entirely in memory and returns the PDF bytes, or None on failure.
+    """
+    return PDFRenderer(theme).render_bytes(content_text, user_data, is_cover_letter)
+
+def create_pdf_from_stream(filename, text_chunks, user_data, title="Document", is_cover_letter=False,
+                           on_flowables=None, timings=None, theme=None):
+    """
+    Like create_pdf, but consumes the AI output as an iterator of text chunks (e.g. a streamed response).
+    Pages are laid out while the text is still arriving, so only the last page is left once the stream ends.
+    If a `timings` dict is given, 'first_chunk', 'stream' and 'render' durations (seconds) are recorded in it.
+    Returns True on success, False if layout fails; an error raised by the stream itself is re-raised.
+    """
+    return PDFRenderer(theme).render_stream(filename, text_chunks, user_data, is_cover_letter, on_flowables, timings)
@@ -0,0 +1,236 @@
+"""Per-candidate generation and rendering pipeline."""
+import asyncio
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import telemetry
+from .prompts import build_resume_prompt, build_cover_letter_prompt
+from .sinks import LocalDirectorySink
+
+# --- Per-Candidate Pipeline ---
+
+# For each document: prompt builder, PDF title and the is_cover_letter flag passed to create_pdf.
+DOCUMENT_KINDS = {
+    'resume': (build_resume_prompt, "Resume", False),
+    'cover_letter': (build_cover_letter_prompt, "Cover Letter", True),
+}
+
+def run_coroutine_sync(coro):
+    """
+    Runs a coroutine to completion from synchronous code. Inside a notebook (Colab/Jupyter) an event loop
+    is already running, so the coroutine is run on a fresh loop in a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+async def _generate_and_render(kind, user_data, scheduler, pdf_name, sink, result, stream=False, on_chunk=None,
+                               render_pool=None, sections=None, exports=(), on_export=None):
+    with telemetry.span('document', kind=kind, streaming=stream):
+        await _generate_and_render_document(kind, user_data, scheduler, pdf_name, sink, result, stream, on_chunk,
+                                            render_pool, sections, exports, on_export)
+
+async def _generate_and_render_document(kind, user_data, scheduler, pdf_name, sink, result, stream, on_chunk,
+                                        render_pool, sections, exports, on_export):
+    # ReportLab is only loaded once the first document is rendered in this process.
+    from .pdf import create_pdf_from_stream
+
+    build_prompt, title, is_cover_letter = DOCUMENT_KINDS[kind]
+    timings = result['timings']
+    if kind == 'resume' and sections is not None:
+        # Section by section: only the sections whose inputs changed since the last run are generated.
+        started = time.perf_counter()
+        text, result['sections'] = await sections.generate(user_data, scheduler)
+        timings[f'{kind}_generate'] = time.perf_counter() - started
+        result['texts'][kind] = text
+        pdf_bytes = await _render_document(kind, text, user_data, pdf_name, sink, result, render_pool, exports,
+                                           on_export)
+        result['pdfs'][kind] = await write_document_pdf(kind, pdf_bytes, pdf_name, sink)
+        return
+
+    with telemetry.span('prompt.build', kind=kind):
+        prompt = build_prompt(user_data)
+
+    if stream:
+        def consume(chunks):
+            if on_chunk:
+                chunks = _tap_chunks(chunks, kind, on_chunk)
+            stream_timings = {}
+            buffer = io.BytesIO()
+            rendered = create_pdf_from_stream(buffer, chunks, user_data, title, is_cover_letter, timings=stream_timings)
+            return (buffer.getvalue() if rendered else None), stream_timings
+
+        text, (pdf_bytes, stream_timings) = await scheduler.generate_streaming(prompt, user_data['api_key'], consume)
+        result['texts'][kind] = text
+        timings[f'{kind}_first_chunk'] = stream_timings['first_chunk']
+        timings[f'{kind}_generate'] = stream_timings['stream']
+        timings[f'{kind}_render'] = stream_timings['render']
+        if exports:
+            # The PDF was laid out from the stream; the other formats are rendered from one parse of the text.
+            from .document import parse_document
+
+            started = time.perf_counter()
+            document = await asyncio.to_thread(parse_document, text, user_data['your_name'], is_cover_letter)
+            result['exports'][kind] = await export_document(kind, document, user_data, exports, pdf_name, sink,
+                                                            on_export, timings, started)
+    else:
+        started = time.perf_counter()
+        with telemetry.span('generate', kind=kind):
+            text = await scheduler.generate(prompt, user_data['api_key'])
+        timings[f'{kind}_generate'] = time.perf_counter() - started
+        result['texts'][kind] = text
+        pdf_bytes = await _render_document(kind, text, user_data, pdf_name, sink, result, render_pool, exports,
+                                           on_export)
+
+    result['pdfs'][kind] = await write_document_pdf(kind, pdf_bytes, pdf_name, sink)
+
+async def _render_document(kind, text, user_data, pdf_name, sink, result, render_pool, exports, on_export):
+    # Returns the PDF bytes; with `exports`, also writes the other formats and records them in result['exports'].
+    timings = result['timings']
+    started = time.perf_counter()
+    if not exports:
+        pdf_bytes = await render_document_pdf(kind, text, user_data, render_pool)
+        timings[f'{kind}_render'] = time.perf_counter() - started
+        return pdf_bytes
+
+    from .document import parse_document
+
+    # One parse feeds every format. The PDF is laid out in the background while the preview formats,
+    # which take milliseconds, are written first.
+    with telemetry.span('parse', kind=kind):
+        document = await asyncio.to_thread(parse_document, text, user_data['your_name'], DOCUMENT_KINDS[kind][2])
+    pdf_task = asyncio.create_task(render_document_pdf(kind, document, user_data, render_pool))
+    try:
+        result['exports'][kind] = await export_document(kind, document, user_data, exports, pdf_name, sink,
+                                                        on_export, timings, started)
+        pdf_bytes = await pdf_task
+    finally:
+        pdf_task.cancel()
+    timings[f'{kind}_render'] = time.perf_counter() - started
+    return pdf_bytes
+
+async def render_document_pdf(kind, content, user_data, render_pool=None):
+    """
+    Renders a document of `kind` to PDF bytes in a thread, or in `render_pool` (a PDFRenderPool) when one
+    is given. `content` is the generated text or an already parsed document. Returns None if rendering failed.
+    """
+    from .pdf import PDFRenderer
+
+    is_cover_letter = DOCUMENT_KINDS[kind][2]
+    with telemetry.span('render', kind=kind, pool=render_pool is not None):
+        if render_pool is not None:
+            return await render_pool.render(None, content, user_data, is_cover_letter)
+        # ReportLab rendering is blocking, so keep it off the event loop that drives the AI requests.
+        if isinstance(content, str):
+            return await asyncio.to_thread(PDFRenderer().render_bytes, content, user_data, is_cover_letter)
+        return await asyncio.to_thread(PDFRenderer().render_document_bytes, content, user_data)
+
+async def export_document(kind, document, user_data, formats, pdf_name, sink, on_export=None, timings=None,
+                          started=None):
+    """
+    Renders a parsed document to each output format in `formats` other than 'pdf' (see
+    resume_generator.renderers) and writes each file to `sink` under `pdf_name` with the format's extension.
+    Preview formats (HTML, Markdown) go first and are rendered on the event loop, since they take
+    milliseconds; the others run in a thread. `on_export(kind, format, location)` is called as each file
+    is written, and `timings['<kind>_<format>']` records its delay since `started` (a perf_counter value).
+    Returns {format: location}, with None for a format that failed to render.
+    """
+    from .renderers import get_renderer
+
+    renderers = sorted((get_renderer(name) for name in formats if name != 'pdf'), key=lambda r: not r.preview)
+    base_name = os.path.splitext(pdf_name)[0]
+    locations = {}
+    for renderer in renderers:
+        location = None
+        with telemetry.span('export', kind=kind, format=renderer.name):
+            try:
+                if renderer.preview:
+                    data = renderer.render(document, user_data)
+                else:
+                    data = await asyncio.to_thread(renderer.render, document, user_data)
+            except Exception as e:
+                print(f"Error rendering {DOCUMENT_KINDS[kind][1]} as {renderer.name}: {e}")
+                data = None
+            if data:
+                telemetry.observe('export_bytes', len(data), kind=kind, format=renderer.name)
+                location = await asyncio.to_thread(sink.write, base_name + renderer.extension, data)
+            else:
+                telemetry.count('export_failures', kind=kind, format=renderer.name)
+        locations[renderer.name] = location
+        if timings is not None and started is not None:
+            timings[f'{kind}_{renderer.name}'] = time.perf_counter() - started
+        if on_export and location is not None:
+            on_export(kind, renderer.name, location)
+    return locations
+
+async def write_document_pdf(kind, pdf_bytes, pdf_name, sink):
+    """
+    Writes rendered `pdf_bytes` to `sink` under `pdf_name` and returns the sink location,
+    or None (counted as a failure) when there is nothing to write.
+    """
+    if not pdf_bytes:
+        telemetry.count('pdf_failures', kind=kind)
+        return None
+    telemetry.observe('pdf_bytes', len(pdf_bytes), kind=kind)
+    with telemetry.span('sink.write', kind=kind, sink=type(sink).__name__):
+        return await asyncio.to_thread(sink.write, pdf_name, pdf_bytes)
+
+def _tap_chunks(chunks, kind, on_chunk):
+    for chunk in chunks:
+        on_chunk(kind, chunk)
+        yield chunk
+
+async def run_candidate_pipeline(user_data, scheduler, pdf_names, stream=False, on_chunk=None, render_pool=None,
+                                 sink=None, sections=None, exports=(), on_export=None):
+    """
+    Generates the resume and cover letter for one candidate at the same time and renders each PDF
+    as soon as its text arrives, instead of waiting for the other document.
+
+    With stream=True the responses are streamed: each document's text is parsed into flowables while it
+    arrives and the PDF build starts the moment its stream closes; `on_chunk(kind, chunk)` is called for
+    every chunk (from a worker thread) so callers can show progress. Otherwise PDFs are rendered in a thread,
+    or in `render_pool` (a PDFRenderPool) when one is given.
+
+    With `sections` (a SectionedResumeGenerator) the resume is generated one section at a time, reusing the
+    fragments of sections whose inputs have not changed, and is not streamed; the result then also has
+    'sections', the generator's report of which sections were generated and which reused.
+
+    `exports` names further output formats ('html', 'markdown', 'docx'; see resume_generator.renderers).
+    Each document's text is then parsed once for every format: the preview formats are written while the PDF
+    is still rendering, and `on_export(kind, format, location)` is called as each file is written. The files
+    go next to the PDF under the same name with the format's extension, and the result also has 'exports',
+    {kind: {format: location}}, with '<kind>_<format>' timings measured from the end of generation.
+
+    PDFs are rendered in memory and written to `sink` (an OutputSink, by default files relative to the
+    current directory) under the names `pdf_names` gives for 'resume' and 'cover_letter'. Returns a dict with
+    the generated 'texts', the sink locations of the 'pdfs' (None for a failed render) and per-stage 'timings' in
+    seconds ('resume_generate', 'resume_render', 'cover_letter_generate', 'cover_letter_render', 'total',
+    plus '<kind>_first_chunk' when streaming).
+    Raises AIGenerationError if either AI request fails; the other request is cancelled.
+    """
+    sink = sink or LocalDirectorySink()
+    result = {'texts': {}, 'pdfs': {}, 'timings': {}}
+    if exports:
+        result['exports'] = {}
+    started = time.perf_counter()
+    with telemetry.span('candidate', streaming=stream):
+        tasks = [asyncio.create_task(_generate_and_render(kind, user_data, scheduler, pdf_names[kind], sink, result,
+                                                          stream, on_chunk, render_pool, sections, exports,
+                                                          on_export))
+                 for kind in DOCUMENT_KINDS]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    result['timings']['total'] = time.perf_counter() - started
+    return result
+
+def format_stage_timings(timings):
+    return ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
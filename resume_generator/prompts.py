@@ -0,0 +1,202 @@
+"""Prompt construction for resume and cover letter generation."""
+
+# --- Prompt Construction ---
+
+# The prompts are precompiled format templates; the candidate-specific sections come from a CandidateProfile,
+# which renders them once so that tailoring one candidate to many jobs does not rebuild them per job.
+RESUME_PROMPT_TEMPLATE = """
+    Generate a professional resume for {p.your_name} applying for a {job_title} position at {company_name}.
+
+    Contact Information:
+    Name: {p.your_name}
+    Email: {p.your_email}
+    Phone: {p.your_phone}
+    LinkedIn: {p.your_linkedin}
+
+    Summary/Objective: Write a concise professional summary highlighting key skills and career goals relevant to the {job_title} role.
+
+    Work Experience:
+    Provide detailed bullet points for each experience, focusing on achievements and quantifiable results.
+    {p.experience_block}
+
+Education:{p.education_block}
+
+Skills: {p.skills}
+
+Format the resume clearly with sections like 'Contact Information', 'Summary', 'Work Experience', 'Education', and 'Skills'. Use bullet points for responsibilities and achievements."""
+
+COVER_LETTER_PROMPT_TEMPLATE = """
+    Write a professional cover letter for {p.your_name} applying for the {job_title} position at {company_name}.
+
+    Address the letter to {hiring_manager}.
+
+    Key details to include:
+    - Express enthusiasm for the {job_title} role.
+    - Briefly highlight relevant experience and skills from the following:
+      {p.experience_summary}
+      Skills: {p.skills}
+    - Connect your qualifications to the company's needs or the job description (imagine typical requirements for this job title).
+    - Mention how you heard about the position: {how_heard}.
+    - Include any additional points: {additional_points}
+    - Professional closing.
+
+    Ensure the tone is professional, confident, and tailored to the specific role and company.
+    """
+
+# user_data fields that describe the target job rather than the candidate.
+JOB_FIELDS = ('job_title', 'company_name', 'hiring_manager_name', 'how_heard', 'additional_cover_letter_points')
+
+class CandidateProfile:
+    """
+    The candidate-specific prompt sections of a user_data record (contact details, experience, education,
+    skills), rendered once. Pass one profile to build_resume_prompt/build_cover_letter_prompt for every job
+    the candidate targets, or to the shared-prefix builders below.
+    """
+    __slots__ = ('your_name', 'your_email', 'your_phone', 'your_linkedin', 'experience_block', 'education_block',
+                 'skills', 'experience_summary')
+
+    def __init__(self, user_data):
+        self.your_name = user_data['your_name']
+        self.your_email = user_data['your_email']
+        self.your_phone = user_data['your_phone']
+        self.your_linkedin = user_data['your_linkedin']
+        self.experience_block = "".join(
+            f"\n- Job Title: {exp['title']}\n  Company: {exp['company']}\n  Dates: {exp['dates']}"
+            + "".join(f"\n  - {resp}" for resp in exp['responsibilities'])
+            for exp in user_data['experiences'])
+        self.education_block = "".join(
+            f"\n- Degree: {edu['degree']}\n  Institution: {edu['institution']}\n  Graduation Date: {edu['dates']}"
+            for edu in user_data['education'])
+        self.skills = ', '.join(user_data['skills'])
+        self.experience_summary = ', '.join(exp['title'] + ' at ' + exp['company'] for exp in user_data['experiences'])
+
+def build_resume_prompt(user_data, profile=None):
+    """
+    Constructs a detailed prompt for the AI to generate resume content.
+    `profile` is the candidate's CandidateProfile, built from user_data when not given.
+    """
+    return RESUME_PROMPT_TEMPLATE.format(p=profile or CandidateProfile(user_data), job_title=user_data['job_title'],
+                                         company_name=user_data['company_name'])
+
+def build_cover_letter_prompt(user_data, profile=None):
+    """
+    Constructs a detailed prompt for the AI to generate cover letter content.
+    `profile` is the candidate's CandidateProfile, built from user_data when not given.
+    """
+    return COVER_LETTER_PROMPT_TEMPLATE.format(
+        p=profile or CandidateProfile(user_data), job_title=user_data['job_title'],
+        company_name=user_data['company_name'],
+        hiring_manager=user_data['hiring_manager_name'] if user_data['hiring_manager_name'] else 'Hiring Manager',
+        how_heard=user_data['how_heard'] if user_data['how_heard'] else 'online posting',
+        additional_points=user_data['additional_cover_letter_points'])
+
+# --- Shared-Prefix Prompts (one profile, many jobs) ---
+
+PROFILE_PREFIX_TEMPLATE = """You write tailored job application documents for the candidate below. Every request that follows names one target job; use only facts from this profile.
+
+Candidate Profile:
+Name: {p.your_name}
+Email: {p.your_email}
+Phone: {p.your_phone}
+LinkedIn: {p.your_linkedin}
+
+Work Experience:{p.experience_block}
+
+Education:{p.education_block}
+
+Skills: {p.skills}
+
+Resume format: start with one contact line (name | email | phone | LinkedIn), then the sections 'Summary', 'Work Experience', 'Education' and 'Skills'. Write each position as 'Job Title | Company | Dates' followed by '* ' bullet points focused on achievements and quantifiable results.
+Cover letter format: a 'Dear ...,' salutation, short body paragraphs separated by blank lines, a professional closing such as 'Sincerely,' and the candidate's name on the last line.
+"""
+
+RESUME_JOB_TEMPLATE = """
+Target job: {job_title} at {company_name}.
+Write the candidate's resume for this job. The summary should highlight the skills and career goals most relevant to the {job_title} role."""
+
+COVER_LETTER_JOB_TEMPLATE = """
+Target job: {job_title} at {company_name}.
+Write the candidate's cover letter for this job, addressed to {hiring_manager}. Express enthusiasm for the role, connect the candidate's experience and skills to typical requirements for it, mention that they heard about it through {how_heard}, and include these additional points: {additional_points}. Keep the tone professional, confident and tailored to the company."""
+
+MULTI_JOB_TEMPLATE = """
+Target jobs:
+{job_list}
+
+For every target job, write the candidate's resume and cover letter, tailored to that job and company.
+Return only a JSON array with one object per job, in the order listed, of the form {{"job": <job number>, "resume": "<resume text>", "cover_letter": "<cover letter text>"}}. Inside the strings use the plain-text formats described above, with \\n for line breaks."""
+
+class PrefixedPrompt(str):
+    """
+    A prompt made of a `prefix` shared by many requests (the candidate profile) and a request-specific
+    `suffix`. It is an ordinary string (prefix + suffix) everywhere, so caches, rate limits and stub clients
+    treat it like any prompt; GeminiClientPool recognises it and can serve the prefix from Gemini context caching.
+    """
+    def __new__(cls, prefix, suffix):
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix = prefix
+        prompt.suffix = suffix
+        return prompt
+
+def build_profile_prefix(profile):
+    return PROFILE_PREFIX_TEMPLATE.format(p=profile)
+
+def _job_fields(job):
+    return {'job_title': job['job_title'], 'company_name': job['company_name'],
+            'hiring_manager': job.get('hiring_manager_name') or 'Hiring Manager',
+            'how_heard': job.get('how_heard') or 'an online posting',
+            'additional_points': job.get('additional_cover_letter_points') or 'none'}
+
+def build_prefixed_resume_prompt(prefix, job):
+    """
+    Resume prompt for one target `job` (a dict of JOB_FIELDS) behind the shared profile `prefix`.
+    """
+    return PrefixedPrompt(prefix, RESUME_JOB_TEMPLATE.format(**_job_fields(job)))
+
+def build_prefixed_cover_letter_prompt(prefix, job):
+    """
+    Cover letter prompt for one target `job` (a dict of JOB_FIELDS) behind the shared profile `prefix`.
+    """
+    return PrefixedPrompt(prefix, COVER_LETTER_JOB_TEMPLATE.format(**_job_fields(job)))
+
+def build_multi_job_prompt(prefix, jobs):
+    """
+    One structured request for both documents for several `jobs` behind the shared profile `prefix`.
+    The reply is a JSON array; see parse_multi_job_response in multi_job.
+    """
+    job_list = "\n".join(
+        "Job {number}: {job_title} at {company_name}; cover letter addressed to {hiring_manager}, heard about "
+        "through {how_heard}, additional points: {additional_points}".format(number=number, **_job_fields(job))
+        for number, job in enumerate(jobs, start=1))
+    return PrefixedPrompt(prefix, MULTI_JOB_TEMPLATE.format(job_list=job_list))
+
+# --- Section Prompts (one request per resume section) ---
+
+# Each prompt depends only on the inputs of its own section, so a section's generated fragment can be reused
+# until one of those inputs changes (see resume_generator.sections). Contact details and education are
+# formatted without the AI.
+SUMMARY_SECTION_TEMPLATE = """Write the professional summary of a resume for a {job_title} position at {company_name}.
+Candidate experience: {experience_summary}
+Skills: {skills}
+Return only the summary: two or three sentences highlighting the skills and career goals most relevant to the {job_title} role, without a heading."""
+
+EXPERIENCE_SECTION_TEMPLATE = """Write the resume bullet points for one position held by a candidate applying for a {job_title} position.
+Position: {title} at {company} ({dates})
+Responsibilities:{responsibilities}
+Return only the bullet points, one per line, each starting with '* ' and focused on achievements and quantifiable results."""
+
+SKILLS_SECTION_TEMPLATE = """Group the following skills for the skills section of a resume: {skills}
+Return only lines of the form 'Category: skill, skill' (for example 'Languages: Python, SQL'), without a heading."""
+
+def build_summary_section_prompt(user_data, profile=None):
+    profile = profile or CandidateProfile(user_data)
+    return SUMMARY_SECTION_TEMPLATE.format(job_title=user_data['job_title'], company_name=user_data['company_name'],
+                                           experience_summary=profile.experience_summary or 'none listed',
+                                           skills=profile.skills or 'none listed')
+
+def build_experience_section_prompt(exp, job_title):
+    return EXPERIENCE_SECTION_TEMPLATE.format(
+        job_title=job_title, title=exp['title'], company=exp['company'], dates=exp['dates'],
+        responsibilities="".join(f"\n- {resp}" for resp in exp['responsibilities']))
+
+def build_skills_section_prompt(skills):
+    return SKILLS_SECTION_TEMPLATE.format(skills=', '.join(skills))
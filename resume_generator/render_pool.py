@@ -0,0 +1,85 @@
+"""Process-pool PDF rendering stage."""
+import asyncio
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+# --- Parallel PDF Rendering ---
+
+_worker_renderer = None
+
+def _init_render_worker(theme_factory=None):
+    """
+    Process pool initializer: compiles the theme and renders a throwaway document once, so ReportLab's
+    modules, fonts and caches are loaded before the first real job arrives.
+    """
+    global _worker_renderer
+    from .pdf import PDFRenderer, PDFTheme
+    _worker_renderer = PDFRenderer(theme_factory() if theme_factory else PDFTheme())
+    _worker_renderer.render(io.BytesIO(), "Warm Up | warm@example.com\nSkills\nWarm: up", {'your_name': 'Warm Up'})
+
+def _render_job(output, content, your_name, is_cover_letter):
+    # Runs in a worker process. `content` is raw text or an already parsed document.
+    user_data = {'your_name': your_name}
+    target = output if output is not None else io.BytesIO()
+    if isinstance(content, str):
+        ok = _worker_renderer.render(target, content, user_data, is_cover_letter)
+    else:
+        ok = _worker_renderer.render_document(target, content, user_data)
+    if not ok:
+        return None
+    return output if output is not None else target.getvalue()
+
+class PDFRenderPool:
+    """
+    Renders PDFs in worker processes, so ReportLab layout (CPU-bound, pure Python and held back by the GIL)
+    can use every core while the event loop keeps AI requests flowing.
+
+    Each worker preloads ReportLab and its own PDFTheme (built by `theme_factory`, a picklable callable,
+    or the default theme) once at startup. Jobs take raw text or a parsed document and return the output
+    path, or the PDF bytes when no output path is given, or None if the build failed.
+
+    At most `max_pending` jobs are queued or running at once; further callers wait for a free slot, so a fast
+    generation stage cannot pile up unrendered documents in memory. submit() and render() count towards
+    separate limits of that size.
+    """
+    def __init__(self, max_workers=None, max_pending=None, theme_factory=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 2
+        self._executor = ProcessPoolExecutor(self.max_workers, initializer=_init_render_worker,
+                                             initargs=(theme_factory,))
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._async_slots = None
+        # Start and warm every worker now, before the caller starts threads of its own;
+        # forking a process that is already running threads can deadlock the child.
+        wait([self._executor.submit(os.getpid) for _ in range(self.max_workers)])
+
+    def submit(self, output, content, user_data, is_cover_letter=False):
+        """
+        Queues one render job, blocking while `max_pending` jobs are outstanding.
+        Returns a concurrent.futures.Future for the job's result.
+        """
+        self._slots.acquire()
+        future = self._executor.submit(_render_job, output, content, user_data['your_name'], is_cover_letter)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def render(self, output, content, user_data, is_cover_letter=False):
+        """
+        Renders one document in a worker process without blocking the event loop and returns the job's result.
+        """
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.max_pending)
+        async with self._async_slots:
+            future = self._executor.submit(_render_job, output, content, user_data['your_name'], is_cover_letter)
+            return await asyncio.wrap_future(future)
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
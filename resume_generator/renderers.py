@@ -0,0 +1,286 @@
+"""
+Output formats for parsed documents: one parse of the AI text can be rendered to PDF, HTML, DOCX and Markdown.
+
+Renderers take a ResumeDocument or CoverLetterDocument (see resume_generator.document) and return the file's
+bytes. HTML and Markdown are 'preview' renderers: they take milliseconds, so they can be shown while the PDF
+is still being laid out. ReportLab and python-docx (optional) are imported only by the renderers that use them.
+"""
+import html
+import io
+
+from .document import (ContactBlock, Summary, Section, Entry, Bullet, TextLine, SkillLine, LetterParagraph,
+                       CoverLetterDocument, parse_document)
+
+# --- Renderers ---
+
+class DocumentRenderer:
+    """
+    Base class: `render(document, user_data)` returns the rendered file as bytes (the PDF renderer returns
+    None if layout fails).
+    Subclasses handle each node type in a method named after it (contact, summary, section, entry, bullet,
+    text, skill, paragraph), called in document order between begin() and end().
+    """
+    name = None
+    extension = None
+    media_type = None
+    preview = False
+
+    def render(self, document, user_data):
+        state = self.begin(document, user_data)
+        handlers = {
+            ContactBlock: self.contact,
+            Summary: self.summary,
+            Section: self.section,
+            Entry: self.entry,
+            Bullet: self.bullet,
+            TextLine: self.text,
+            SkillLine: self.skill,
+            LetterParagraph: self.paragraph,
+        }
+        for node, section in document.nodes():
+            handlers[type(node)](state, node, section)
+        return self.end(state, document, user_data)
+
+class MarkdownRenderer(DocumentRenderer):
+    """
+    Markdown with the same structure as the PDF: name and contact line, '##' section headings,
+    '###' entries, '-' bullets and bold skill labels.
+    """
+    name = 'markdown'
+    extension = '.md'
+    media_type = 'text/markdown; charset=utf-8'
+    preview = True
+
+    def begin(self, document, user_data):
+        return []
+
+    def end(self, lines, document, user_data):
+        return ("\n".join(lines).strip() + "\n").encode('utf-8')
+
+    def _block(self, lines, *new_lines):
+        # Separates each block from the one before it with a blank line; bullet() appends list items directly.
+        if lines and lines[-1] != "":
+            lines.append("")
+        lines.extend(new_lines)
+
+    def contact(self, lines, contact, section):
+        self._block(lines, f"# {contact.name}")
+        if contact.details:
+            self._block(lines, " | ".join(contact.details))
+
+    def summary(self, lines, summary, section):
+        self._block(lines, "## SUMMARY", "", summary.text)
+
+    def section(self, lines, section, _):
+        if section.key is not None:
+            self._block(lines, f"## {section.key}")
+
+    def entry(self, lines, entry, section):
+        if section.key == "EDUCATION":
+            self._block(lines, f"### {entry.title}", "", entry.organization)
+        elif entry.organization is None:
+            self._block(lines, f"### {entry.title}")
+        else:
+            self._block(lines, f"### {entry.title} | {entry.organization}", "", f"*{entry.dates}*")
+
+    def bullet(self, lines, bullet, section):
+        if lines and lines[-1].startswith("- "):
+            lines.append(f"- {bullet.text}")
+        else:
+            self._block(lines, f"- {bullet.text}")
+
+    def text(self, lines, line, section):
+        self._block(lines, f"*{line.text}*" if line.emphasis == 'italic' else line.text)
+
+    def skill(self, lines, skill, section):
+        self._block(lines, f"**{skill.label}:** {skill.value}")
+
+    def paragraph(self, lines, paragraph, section):
+        self._block(lines, paragraph.text)
+
+HTML_STYLE = """body{font-family:Helvetica,Arial,sans-serif;font-size:10pt;line-height:1.2;max-width:7.5in;margin:0.5in auto;color:#000}
+h1{font-size:24pt;text-align:center;margin:0 0 4pt}
+h2{font-size:16pt;margin:12pt 0 6pt}
+h3{font-size:14pt;margin:10pt 0 5pt}
+p{margin:0 0 6pt;text-align:justify}
+p.contact{text-align:center}
+p.signature{margin-top:20pt}
+ul{margin:0 0 6pt;padding-left:0.3in}
+li{margin-bottom:3pt}"""
+
+class HTMLRenderer(DocumentRenderer):
+    """
+    A standalone HTML page styled after the PDF. All document text is escaped.
+    """
+    name = 'html'
+    extension = '.html'
+    media_type = 'text/html; charset=utf-8'
+    preview = True
+
+    def begin(self, document, user_data):
+        return {'parts': [], 'in_list': False}
+
+    def end(self, state, document, user_data):
+        self._close_list(state)
+        kind = "Cover Letter" if isinstance(document, CoverLetterDocument) else "Resume"
+        title = html.escape(f"{user_data['your_name']} - {kind}")
+        return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
+                f'<style>\n{HTML_STYLE}\n</style>\n</head>\n<body>\n' + "\n".join(state['parts'])
+                + "\n</body>\n</html>\n").encode('utf-8')
+
+    def _close_list(self, state):
+        if state['in_list']:
+            state['parts'].append("</ul>")
+            state['in_list'] = False
+
+    def _add(self, state, *parts):
+        self._close_list(state)
+        state['parts'].extend(parts)
+
+    def contact(self, state, contact, section):
+        self._add(state, f"<h1>{html.escape(contact.name)}</h1>")
+        if contact.details:
+            self._add(state, f'<p class="contact">{html.escape(" | ".join(contact.details))}</p>')
+
+    def summary(self, state, summary, section):
+        self._add(state, "<h2>SUMMARY</h2>", f"<p>{html.escape(summary.text)}</p>")
+
+    def section(self, state, section, _):
+        if section.key is not None:
+            self._add(state, f"<h2>{html.escape(section.key)}</h2>")
+
+    def entry(self, state, entry, section):
+        if section.key == "EDUCATION":
+            self._add(state, f"<h3>{html.escape(entry.title)}</h3>", f"<p>{html.escape(entry.organization)}</p>")
+        elif entry.organization is None:
+            self._add(state, f"<h3>{html.escape(entry.title)}</h3>")
+        else:
+            self._add(state, f"<h3>{html.escape(entry.title)} | {html.escape(entry.organization)}</h3>",
+                      f"<p><i>{html.escape(entry.dates)}</i></p>")
+
+    def bullet(self, state, bullet, section):
+        if not state['in_list']:
+            state['parts'].append("<ul>")
+            state['in_list'] = True
+        state['parts'].append(f"<li>{html.escape(bullet.text)}</li>")
+
+    def text(self, state, line, section):
+        text = html.escape(line.text)
+        self._add(state, f"<p><i>{text}</i></p>" if line.emphasis == 'italic' else f"<p>{text}</p>")
+
+    def skill(self, state, skill, section):
+        self._add(state, f"<p><b>{html.escape(skill.label)}:</b> {html.escape(skill.value)}</p>")
+
+    def paragraph(self, state, paragraph, section):
+        css = ' class="signature"' if paragraph.kind in ('closing', 'signature') else ''
+        self._add(state, f"<p{css}>{html.escape(paragraph.text)}</p>")
+
+class DOCXRenderer(DocumentRenderer):
+    """
+    A Word document built with python-docx (pip install python-docx), using Word's built-in heading and
+    'List Bullet' styles so it stays editable.
+    """
+    name = 'docx'
+    extension = '.docx'
+    media_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+    def begin(self, document, user_data):
+        import docx
+        return docx.Document()
+
+    def end(self, doc, document, user_data):
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+
+    def contact(self, doc, contact, section):
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        doc.add_heading(contact.name, level=0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+        if contact.details:
+            doc.add_paragraph(" | ".join(contact.details)).alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    def summary(self, doc, summary, section):
+        doc.add_heading("SUMMARY", level=1)
+        doc.add_paragraph(summary.text)
+
+    def section(self, doc, section, _):
+        if section.key is not None:
+            doc.add_heading(section.key, level=1)
+
+    def entry(self, doc, entry, section):
+        if section.key == "EDUCATION":
+            doc.add_heading(entry.title, level=2)
+            doc.add_paragraph(entry.organization)
+        elif entry.organization is None:
+            doc.add_heading(entry.title, level=2)
+        else:
+            doc.add_heading(f"{entry.title} | {entry.organization}", level=2)
+            doc.add_paragraph().add_run(entry.dates).italic = True
+
+    def bullet(self, doc, bullet, section):
+        doc.add_paragraph(bullet.text, style='List Bullet')
+
+    def text(self, doc, line, section):
+        run = doc.add_paragraph().add_run(line.text)
+        run.italic = line.emphasis == 'italic'
+
+    def skill(self, doc, skill, section):
+        paragraph = doc.add_paragraph()
+        paragraph.add_run(f"{skill.label}:").bold = True
+        paragraph.add_run(f" {skill.value}")
+
+    def paragraph(self, doc, paragraph, section):
+        doc.add_paragraph(paragraph.text)
+
+class PDFDocumentRenderer(DocumentRenderer):
+    """
+    The ReportLab PDF (see resume_generator.pdf), rendered from the parsed document with the default theme.
+    """
+    name = 'pdf'
+    extension = '.pdf'
+    media_type = 'application/pdf'
+
+    def render(self, document, user_data):
+        from .pdf import PDFRenderer
+        return PDFRenderer().render_document_bytes(document, user_data)
+
+RENDERERS = {
+    'pdf': PDFDocumentRenderer,
+    'html': HTMLRenderer,
+    'markdown': MarkdownRenderer,
+    'docx': DOCXRenderer,
+}
+
+# Renderers whose libraries are optional: format -> (module, install hint).
+OPTIONAL_DEPENDENCIES = {
+    'docx': ('docx', "pip install python-docx (or resume-generator[docx])"),
+}
+
+def get_renderer(name):
+    """
+    Returns the renderer registered for the format `name`.
+    """
+    try:
+        return RENDERERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown output format: {name!r} (choose from {', '.join(RENDERERS)})") from None
+
+def check_formats(names):
+    """
+    Raises ValueError for unknown formats and ImportError, with an install hint, for formats whose optional
+    library is missing.
+    """
+    import importlib.util
+
+    for name in names:
+        get_renderer(name)
+        module, hint = OPTIONAL_DEPENDENCIES.get(name, (None, None))
+        if module and importlib.util.find_spec(module) is None:
+            raise ImportError(f"The {name} format needs {hint}")
+
+def render_formats(content_text, user_data, is_cover_letter=False, formats=('pdf', 'html', 'markdown')):
+    """
+    Parses the AI text once and renders it to every format in `formats`. Returns {format: bytes}.
+    """
+    document = parse_document(content_text, user_data['your_name'], is_cover_letter)
+    return {name: get_renderer(name).render(document, user_data) for name in formats}
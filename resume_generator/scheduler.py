@@ -0,0 +1,241 @@
+"""Concurrent, rate-limited AI request scheduling with retries."""
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import telemetry
+from .llm import (AIGenerationError, DEFAULT_CLIENT_POOL, DEFAULT_MODEL_NAME, DEFAULT_REQUEST_TIMEOUT, GeminiClientPool,
+                  estimate_tokens, get_status_code, is_retryable_error)
+
+# --- Concurrent AI Request Scheduling ---
+
+class TokenBucket:
+    """
+    Asyncio token bucket that refills `rate_per_minute` units evenly over a minute.
+    Waiters are served in arrival order because the lock is held while sleeping.
+    """
+    def __init__(self, rate_per_minute, clock=time.monotonic):
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.fill_rate = self.capacity / 60.0
+        self.clock = clock
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+        self.updated = now
+
+    async def acquire(self, amount=1):
+        # A single request larger than the whole bucket would otherwise wait forever.
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.fill_rate)
+                self._refill()
+            self.tokens -= amount
+
+    def consume(self, amount):
+        """
+        Debits units without waiting (e.g. response tokens known only after the call); the balance may go negative.
+        """
+        self._refill()
+        self.tokens -= amount
+
+class _KeyLimits:
+    """
+    Per-API-key concurrency and rate limit state used by GenerationScheduler.
+    """
+    def __init__(self, max_in_flight, requests_per_minute, tokens_per_minute):
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+class GenerationScheduler:
+    """
+    Keeps up to `max_in_flight` AI requests running per API key, under optional requests-per-minute and
+    tokens-per-minute limits. Transient failures (429/5xx/timeouts) are retried with exponential backoff
+    and full jitter; anything else, or running out of retries, raises AIGenerationError.
+
+    `client` is any callable taking (prompt, api_key) and returning text, either a plain function (run in a
+    thread pool) or a coroutine function, so a StubGeminiClient can stand in for the real API.
+    With a ResponseCache, cache hits are answered before any slot or rate limit budget is taken.
+
+    A request that exceeds `timeout` is retried, but a call running in a thread cannot be interrupted, so its
+    slot stays taken until the thread returns; the default Gemini client stops waiting after `timeout` itself.
+    """
+    def __init__(self, client=None, max_in_flight=4, requests_per_minute=None, tokens_per_minute=None,
+                 max_retries=5, base_delay=1.0, max_delay=30.0, timeout=DEFAULT_REQUEST_TIMEOUT, thread_workers=32,
+                 cache=None, model_name=DEFAULT_MODEL_NAME):
+        if client is None:
+            # The shared pool already stops waiting after the default timeout; other timeouts get their own pool.
+            same_timeout = timeout == DEFAULT_CLIENT_POOL.timeout
+            client = DEFAULT_CLIENT_POOL if same_timeout else GeminiClientPool(timeout=timeout)
+        self.client = client
+        self.cache = cache
+        self.model_name = model_name
+        self.max_in_flight = max_in_flight
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix='ai-request')
+        self._limits = {}
+
+    def capacity(self, key_count=1):
+        """
+        Returns how many requests can be in flight at once when the load is spread over `key_count` API keys.
+        """
+        return self.max_in_flight * max(1, key_count)
+
+    def _limits_for(self, api_key):
+        if api_key not in self._limits:
+            self._limits[api_key] = _KeyLimits(self.max_in_flight, self.requests_per_minute, self.tokens_per_minute)
+        return self._limits[api_key]
+
+    def backoff_delay(self, attempt):
+        """
+        Full-jitter exponential backoff: a random delay up to base_delay * 2**attempt, capped at max_delay.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _stream_and_consume(self, prompt, api_key, consume, abandoned):
+        # Runs in the thread pool: feeds the streamed chunks to `consume` while collecting the full text.
+        # Once the attempt is `abandoned` (timed out or cancelled) the stream is cut off, so `consume`
+        # stops receiving chunks while a retry feeds its own.
+        parts = []
+        stream = getattr(self.client, 'generate_stream', None)
+
+        def chunks():
+            for chunk in (stream(prompt, api_key) if stream else [self.client(prompt, api_key)]):
+                if abandoned.is_set():
+                    raise TimeoutError("AI request abandoned")
+                parts.append(chunk)
+                yield chunk
+
+        value = consume(chunks())
+        return "".join(parts).strip(), value
+
+    def _run_in_thread(self, func, *args):
+        # Like asyncio.to_thread, runs with a copy of the caller's context so telemetry spans started in the
+        # thread (e.g. by `consume`) nest under the request's span.
+        context = contextvars.copy_context()
+        return asyncio.get_running_loop().run_in_executor(self._executor, context.run, func, *args)
+
+    async def _await_thread(self, call, on_abandon):
+        # Waits up to `timeout` for a call running in the thread pool. The thread cannot be stopped, so if the
+        # wait ends early (timeout or cancellation) the still-running call is passed to on_abandon.
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), timeout=self.timeout)
+        except BaseException:
+            if not call.done():
+                on_abandon(call)
+            raise
+
+    async def _call_client(self, prompt, api_key, consume, on_abandon):
+        if asyncio.iscoroutinefunction(self.client):
+            text = await asyncio.wait_for(self.client(prompt, api_key), timeout=self.timeout)
+            if consume is None:
+                return text, None
+            return text, await self._run_in_thread(consume, iter([text]))
+        if consume is None:
+            return await self._await_thread(self._run_in_thread(self.client, prompt, api_key), on_abandon), None
+        abandoned = threading.Event()
+
+        def abandon(call):
+            abandoned.set()
+            on_abandon(call)
+
+        call = self._run_in_thread(self._stream_and_consume, prompt, api_key, consume, abandoned)
+        return await self._await_thread(call, abandon)
+
+    async def generate(self, prompt, api_key):
+        """
+        Generates text for one prompt, waiting for a free slot and rate limit budget on the prompt's API key.
+        Returns the text or raises AIGenerationError.
+        """
+        text, _ = await self._generate(prompt, api_key)
+        return text
+
+    async def generate_streaming(self, prompt, api_key, consume):
+        """
+        Streams the response for one prompt into `consume(chunks)`, a blocking function that receives an
+        iterator of text chunks and runs in the thread pool (e.g. create_pdf_from_stream). On a retry,
+        `consume` is called again with the new stream. Returns (full_text, consume's return value) or raises
+        AIGenerationError. Clients without a generate_stream method deliver the whole text as one chunk.
+        """
+        return await self._generate(prompt, api_key, consume)
+
+    async def _generate(self, prompt, api_key, consume=None):
+        # The cache's SQLite calls run off the event loop, so a slow lookup does not hold up other requests.
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self.model_name, prompt)
+            text = await asyncio.to_thread(self.cache.get, cache_key)
+            telemetry.count('cache_lookups', result='hit' if text is not None else 'miss')
+            if text is not None:
+                if consume is None:
+                    return text, None
+                return text, await self._run_in_thread(consume, iter([text]))
+
+        limits = self._limits_for(api_key)
+        prompt_tokens = estimate_tokens(prompt)
+        attempt = 0
+        while True:
+            attempt += 1
+            waited = time.perf_counter()
+            abandoned_calls = []
+            await limits.semaphore.acquire()
+            try:
+                if limits.requests:
+                    await limits.requests.acquire()
+                if limits.tokens:
+                    await limits.tokens.acquire(prompt_tokens)
+                telemetry.observe('ai_wait_seconds', time.perf_counter() - waited)
+                try:
+                    with telemetry.span('ai.request', attempt=attempt, streaming=consume is not None):
+                        text, value = await self._call_client(prompt, api_key, consume, abandoned_calls.append)
+                    response_tokens = estimate_tokens(text)
+                    telemetry.count('ai_prompt_tokens', prompt_tokens)
+                    telemetry.count('ai_response_tokens', response_tokens)
+                    if limits.tokens:
+                        limits.tokens.consume(response_tokens)
+                    if self.cache is not None:
+                        await asyncio.to_thread(self.cache.put, cache_key, text, self.model_name)
+                    return text, value
+                except Exception as e:
+                    error = e
+            finally:
+                if abandoned_calls:
+                    # The abandoned call still occupies the slot; it is freed when the thread returns.
+                    abandoned_calls[0].add_done_callback(lambda call: _release_slot(call, limits.semaphore))
+                else:
+                    limits.semaphore.release()
+
+            retryable = is_retryable_error(error)
+            telemetry.count('ai_errors', status_code=get_status_code(error), retryable=retryable)
+            if not retryable or attempt > self.max_retries:
+                if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+                    message = f"AI request timed out after {self.timeout}s"
+                else:
+                    message = str(error) or type(error).__name__
+                raise AIGenerationError(message, status_code=get_status_code(error), attempts=attempt,
+                                        retryable=retryable) from error
+            telemetry.count('ai_retries')
+            # Sleep outside the semaphore so other requests on this key can use the slot meanwhile.
+            await asyncio.sleep(self.backoff_delay(attempt - 1))
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+def _release_slot(call, semaphore):
+    # Done callback of an abandoned call: its result is no longer wanted, only the slot it held.
+    if not call.cancelled():
+        call.exception()
+    semaphore.release()
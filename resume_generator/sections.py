@@ -0,0 +1,124 @@
+"""Section-level resume generation: only sections whose inputs changed are sent to the AI again."""
+import asyncio
+
+from . import telemetry
+from .cache import ResponseCache
+from .prompts import (CandidateProfile, build_experience_section_prompt, build_skills_section_prompt,
+                      build_summary_section_prompt)
+
+# --- Section-Level Resume Generation ---
+
+def _clean_lines(text, heading):
+    # Drops blank lines and a heading the model may repeat despite the prompt.
+    lines = [line.strip() for line in text.strip().split('\n') if line.strip()]
+    if lines and lines[0].rstrip(':').lower() == heading:
+        lines = lines[1:]
+    return lines
+
+def clean_summary(text):
+    lines = _clean_lines(text, 'summary')
+    summary = " ".join(lines)
+    return summary[len('summary:'):].strip() if summary.lower().startswith('summary:') else summary
+
+def clean_bullets(text):
+    return "\n".join(f"* {line.lstrip('*-• ').strip()}" for line in _clean_lines(text, 'work experience'))
+
+def clean_skills(text):
+    return "\n".join(_clean_lines(text, 'skills'))
+
+def format_contact_line(user_data):
+    return " | ".join(value for value in (user_data['your_name'], user_data['your_email'], user_data['your_phone'],
+                                          user_data['your_linkedin']) if value)
+
+def format_education(education):
+    return "\n".join(f"{edu['degree']} | {edu['institution']}\nGraduated: {edu['dates']}" for edu in education)
+
+class ResumeSection:
+    """
+    One section of a sectioned resume. `prompt` is None for sections formatted without the AI (contact
+    details, education); otherwise `clean` turns the AI's reply into the fragment that goes into the resume.
+    """
+    __slots__ = ('section_id', 'heading', 'prompt', 'clean', 'text')
+
+    def __init__(self, section_id, heading, prompt=None, clean=None, text=None):
+        self.section_id = section_id
+        self.heading = heading
+        self.prompt = prompt
+        self.clean = clean
+        self.text = text
+
+def plan_resume_sections(user_data):
+    """
+    Splits a resume into its sections in document order: contact, summary, one section per experience,
+    education and skills. Each AI section's prompt is built only from that section's inputs.
+    """
+    profile = CandidateProfile(user_data)
+    sections = [ResumeSection('contact', None, text=format_contact_line(user_data)),
+                ResumeSection('summary', "Summary", build_summary_section_prompt(user_data, profile), clean_summary)]
+    for number, exp in enumerate(user_data['experiences'], start=1):
+        heading = "Work Experience" if number == 1 else None
+        sections.append(ResumeSection(f'experience:{number}', heading,
+                                      build_experience_section_prompt(exp, user_data['job_title']),
+                                      lambda text, exp=exp: f"{exp['title']} | {exp['company']} | {exp['dates']}\n"
+                                                            + clean_bullets(text)))
+    if user_data['education']:
+        sections.append(ResumeSection('education', "Education", text=format_education(user_data['education'])))
+    if user_data['skills']:
+        sections.append(ResumeSection('skills', "Skills", build_skills_section_prompt(user_data['skills']),
+                                      clean_skills))
+    return sections
+
+def assemble_resume(sections):
+    """
+    Joins the section fragments into resume text in the layout the resume parser expects.
+    """
+    blocks = []
+    for section in sections:
+        blocks.append(f"{section.heading}\n{section.text}" if section.heading else section.text)
+    return "\n\n".join(block for block in blocks if block)
+
+class SectionedResumeGenerator:
+    """
+    Generates a resume one section at a time and keeps every AI-written fragment in `store` (a ResponseCache,
+    by default in memory) under the key the scheduler's response cache would use for the section's prompt,
+    i.e. a hash of the model and the section's inputs. When a candidate edits one experience or adds a skill,
+    only the sections whose inputs changed are requested again; the rest of the resume is reassembled from
+    stored fragments. Sharing the scheduler's own ResponseCache as `store` keeps one entry per fragment.
+    """
+    def __init__(self, store=None):
+        self.store = store if store is not None else ResponseCache(':memory:', max_age=None)
+
+    async def generate(self, user_data, scheduler):
+        """
+        Returns (resume_text, report) where report lists the section ids that were 'generated' by the AI,
+        'reused' from stored fragments and 'formatted' without the AI.
+        Raises AIGenerationError if a section request fails; fragments that did arrive are kept.
+        """
+        sections = plan_resume_sections(user_data)
+        report = {'generated': [], 'reused': [], 'formatted': []}
+        missing = []
+        # A shared response cache counts the miss when the scheduler looks the prompt up again.
+        shared = self.store is scheduler.cache
+        for section in sections:
+            if section.prompt is None:
+                report['formatted'].append(section.section_id)
+                continue
+            key = self.store.make_key(scheduler.model_name, section.prompt)
+            reply = await asyncio.to_thread(self.store.get, key, count_miss=not shared)
+            telemetry.count('section_fragments', result='reused' if reply is not None else 'generated')
+            if reply is None:
+                missing.append((section, key))
+            else:
+                section.text = section.clean(reply)
+                report['reused'].append(section.section_id)
+
+        async def generate_section(section, key):
+            with telemetry.span('generate', kind='resume', section=section.section_id):
+                reply = await scheduler.generate(section.prompt, user_data['api_key'])
+            if not shared:
+                await asyncio.to_thread(self.store.put, key, reply, scheduler.model_name)
+            section.text = section.clean(reply)
+
+        await asyncio.gather(*(generate_section(section, key) for section, key in missing))
+        report['generated'] = [section.section_id for section, _ in missing]
+        return assemble_resume(sections), report
@@ -0,0 +1,361 @@
+"""
+HTTP service mode: an ASGI application that queues generation jobs and runs them on a bounded worker pool.
+
+Endpoints:
+    POST /jobs                      submit a user_data JSON object; 202 with the job ID, 503 when the queue is full
+    GET  /jobs/{id}                 job status and result (PDF locations, stage timings, error)
+    GET  /jobs/{id}/events          server-sent events: status changes, 'export' events as each extra format is
+                                    written and, in streaming mode, text chunks
+    GET  /jobs/{id}/{kind}.pdf      the finished resume or cover_letter PDF, when the sink can read it back
+    GET  /jobs/{id}/{kind}.{ext}    the same document as .html, .md or .docx when the service exports those
+                                    formats; previews are available while the PDF is still rendering
+    GET  /stats                     queue depth, running/finished counts and p50/p95/p99 job latency
+    GET  /metrics                   the same gauges plus all recorded telemetry, in Prometheus text format
+                                    (telemetry needs a PrometheusExporter configured, e.g. --telemetry prometheus)
+    GET  /healthz                   liveness check
+
+The app has no web framework dependency; any ASGI server can run it (`resume-generator --serve` uses uvicorn).
+"""
+import asyncio
+import itertools
+import json
+import math
+import os
+import time
+import uuid
+from collections import deque
+
+from . import telemetry
+from .batch import process_batch_record
+from .sinks import LocalDirectorySink, content_type
+from .user_input import normalize_user_data
+
+# --- Job Queue and Worker Pool ---
+
+MAX_REQUEST_BYTES = 1024 * 1024
+
+class QueueFullError(Exception):
+    pass
+
+class LatencyTracker:
+    """
+    Keeps the latencies of the last `window` jobs and reports nearest-rank percentiles in milliseconds.
+    """
+    def __init__(self, window=1000):
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds):
+        self._samples.append(seconds)
+
+    def percentiles(self, quantiles=(50, 95, 99)):
+        samples = sorted(self._samples)
+        if not samples:
+            return {f'p{q}': None for q in quantiles}
+        return {f'p{q}': round(samples[max(0, math.ceil(q * len(samples) / 100) - 1)] * 1000, 1) for q in quantiles}
+
+class Job:
+    """
+    One queued generation request. Every state change is appended to `events` so that event-stream
+    subscribers can replay what they missed and then wait for more.
+    """
+    def __init__(self, job_id, user_data):
+        self.id = job_id
+        self.user_data = user_data
+        self.status = 'queued'
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.exports = {}
+        self.events = []
+        self._changed = asyncio.Event()
+        self.publish('status', {'status': self.status})
+
+    @property
+    def finished(self):
+        return self.status in ('ok', 'error')
+
+    def publish(self, event, data):
+        self.events.append((event, data))
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self):
+        """
+        Yields (event, data) pairs from the first event on, until the job has finished.
+        """
+        position = 0
+        while True:
+            changed = self._changed
+            while position < len(self.events):
+                yield self.events[position]
+                position += 1
+            if self.finished:
+                return
+            await changed.wait()
+
+    def to_dict(self):
+        info = {'job_id': self.id, 'status': self.status, 'submitted_at': self.submitted_at,
+                'started_at': self.started_at, 'finished_at': self.finished_at}
+        if self.result is not None:
+            info.update(resume_pdf=self.result['resume_pdf'], cover_letter_pdf=self.result['cover_letter_pdf'],
+                        error=self.result['error'], timings=self.result.get('timings'))
+            for key in ('status_code', 'attempts', 'retryable', 'sections'):
+                if key in self.result:
+                    info[key] = self.result[key]
+        if self.exports:
+            info['exports'] = self.exports
+        return info
+
+class GenerationService:
+    """
+    Runs submitted jobs through the per-candidate pipeline (process_batch_record) on `workers` asyncio tasks
+    sharing one GenerationScheduler, so AI concurrency and rate limits stay in the scheduler's hands.
+
+    At most `max_queue` jobs wait at a time; submit() raises QueueFullError beyond that so callers can shed load.
+    Finished jobs are kept for lookup until more than `max_finished_jobs` have accumulated, oldest first out.
+    Jobs without an api_key get the `default_api_keys` round-robin, as in batch mode. With `sections`
+    (a SectionedResumeGenerator) resubmitting an edited candidate only regenerates the changed resume sections.
+    `exports` names further output formats ('html', 'markdown', 'docx') written next to each PDF; each one is
+    published as an 'export' event and can be downloaded as soon as it is written.
+    """
+    def __init__(self, scheduler, sink=None, workers=4, max_queue=100, default_api_keys=None, stream=False,
+                 render_pool=None, max_finished_jobs=10000, latency_window=1000, sections=None, exports=()):
+        self.scheduler = scheduler
+        self.sink = sink or LocalDirectorySink("service_output")
+        self.workers = workers
+        self.max_queue = max_queue
+        self.stream = stream
+        self.render_pool = render_pool
+        self.sections = sections
+        self.exports = tuple(exports)
+        self.max_finished_jobs = max_finished_jobs
+        self.latency = LatencyTracker(latency_window)
+        self.counts = {'submitted': 0, 'ok': 0, 'error': 0, 'rejected': 0}
+        self.running = 0
+        self._key_cycle = itertools.cycle(default_api_keys) if default_api_keys else itertools.repeat(None)
+        self._jobs = {}
+        self._finished_ids = deque()
+        self._queue = None
+        self._tasks = []
+
+    def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, record):
+        """
+        Validates a user_data record and queues it. Returns the Job; raises ValueError for an invalid
+        record and QueueFullError when the queue is at capacity.
+        """
+        self.start()
+        if not isinstance(record, dict):
+            raise ValueError("Request body must be a JSON object of user_data fields.")
+        try:
+            user_data = normalize_user_data(record, next(self._key_cycle))
+        except (ValueError, AttributeError, TypeError) as e:
+            raise ValueError(f"Invalid user_data: {e}") from None
+        if not user_data['your_name']:
+            raise ValueError("user_data needs at least 'your_name'.")
+
+        job = Job(uuid.uuid4().hex, user_data)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.counts['rejected'] += 1
+            raise QueueFullError(f"Job queue is full ({self.max_queue} waiting).") from None
+        self._jobs[job.id] = job
+        self.counts['submitted'] += 1
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def stats(self):
+        return {'queue_depth': self._queue.qsize() if self._queue else 0, 'queue_capacity': self.max_queue,
+                'running': self.running, 'workers': self.workers, **self.counts,
+                'latency_ms': self.latency.percentiles()}
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            self.running += 1
+            job.status = 'running'
+            job.started_at = time.time()
+            job.publish('status', {'status': job.status})
+
+            on_chunk = None
+            if self.stream:
+                # Chunks arrive on a scheduler thread; hand them to the event loop that owns the job.
+                on_chunk = lambda kind, chunk, job=job: loop.call_soon_threadsafe(
+                    job.publish, 'chunk', {'kind': kind, 'text': chunk})
+            on_export = lambda kind, format_name, location, job=job: _export_written(job, kind, format_name, location)
+            try:
+                job.result = await process_batch_record(job.id, job.user_data, self.sink, self.scheduler,
+                                                        self.stream, self.render_pool, on_chunk, self.sections,
+                                                        self.exports, on_export)
+            except Exception as e:
+                job.result = {'status': 'error', 'resume_pdf': None, 'cover_letter_pdf': None,
+                              'error': f"Unexpected error: {e}"}
+            finally:
+                self.running -= 1
+
+            job.finished_at = time.time()
+            job.status = job.result['status']
+            self.counts[job.status] += 1
+            self.latency.record(job.finished_at - job.submitted_at)
+            telemetry.count('service_jobs', status=job.status)
+            telemetry.observe('service_job_seconds', job.finished_at - job.submitted_at)
+            job.user_data = None
+            job.publish('status', job.to_dict())
+
+            self._finished_ids.append(job.id)
+            while len(self._finished_ids) > self.max_finished_jobs:
+                del self._jobs[self._finished_ids.popleft()]
+
+def _export_written(job, kind, format_name, location):
+    # Called on the event loop as soon as an export is written, usually before the PDF is finished.
+    from .renderers import RENDERERS
+
+    job.exports.setdefault(kind, {})[format_name] = location
+    job.publish('export', {'kind': kind, 'format': format_name, 'location': location,
+                           'url': f"/jobs/{job.id}/{kind}{RENDERERS[format_name].extension}"})
+
+# --- ASGI Application ---
+
+class ServiceApp:
+    """
+    Minimal ASGI 3 application exposing a GenerationService over HTTP. Workers are started by the lifespan
+    startup event, or by the first submitted job when the server does not send lifespan events.
+    """
+    def __init__(self, service):
+        self.service = service
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.service.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.service.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        method = scope['method']
+        parts = [p for p in scope['path'].split('/') if p]
+
+        if method == 'POST' and parts == ['jobs']:
+            return await self._submit(receive, send)
+        if method != 'GET':
+            return await _send_json(send, 405, {'error': "Method not allowed."})
+        if parts == ['healthz']:
+            return await _send_json(send, 200, {'status': 'ok'})
+        if parts == ['stats']:
+            return await _send_json(send, 200, self.service.stats())
+        if parts == ['metrics']:
+            return await self._metrics(send)
+        if len(parts) in (2, 3) and parts[0] == 'jobs':
+            job = self.service.get(parts[1])
+            if job is None:
+                return await _send_json(send, 404, {'error': "Unknown job."})
+            if len(parts) == 2:
+                return await _send_json(send, 200, job.to_dict())
+            if parts[2] == 'events':
+                return await self._events(job, send)
+            kind, extension = os.path.splitext(parts[2])
+            if kind in ('resume', 'cover_letter') and extension:
+                return await self._download(job, kind, extension, send)
+        await _send_json(send, 404, {'error': "Not found."})
+
+    async def _submit(self, receive, send):
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if len(body) > MAX_REQUEST_BYTES:
+                return await _send_json(send, 413, {'error': "Request body too large."})
+            if not message.get('more_body'):
+                break
+        try:
+            job = self.service.submit(json.loads(body or b'null'))
+        except ValueError as e:
+            return await _send_json(send, 400, {'error': str(e)})
+        except QueueFullError as e:
+            return await _send_json(send, 503, {'error': str(e)}, [(b'retry-after', b'1')])
+        await _send_json(send, 202, {'job_id': job.id, 'status': job.status, 'status_url': f"/jobs/{job.id}",
+                                     'events_url': f"/jobs/{job.id}/events"})
+
+    async def _metrics(self, send):
+        stats = self.service.stats()
+        lines = []
+        for name in ('queue_depth', 'queue_capacity', 'running', 'workers'):
+            lines += [f"# TYPE resume_generator_service_{name} gauge", f"resume_generator_service_{name} {stats[name]}"]
+        text = "\n".join(lines) + "\n"
+        recorder = telemetry.get_telemetry()
+        exporter = recorder.find(telemetry.PrometheusExporter) if recorder else None
+        if exporter is not None:
+            text += exporter.render()
+        body = text.encode('utf-8')
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/plain; version=0.0.4'),
+                                (b'content-length', str(len(body)).encode())]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _events(self, job, send):
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/event-stream'), (b'cache-control', b'no-cache')]})
+        async for event, data in job.follow():
+            payload = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+            await send({'type': 'http.response.body', 'body': payload, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def _download(self, job, kind, extension, send):
+        from .renderers import RENDERERS
+
+        if extension == '.pdf':
+            location = job.result and job.result[f'{kind}_pdf']
+        else:
+            formats = [name for name, renderer in RENDERERS.items() if renderer.extension == extension]
+            location = formats and job.exports.get(kind, {}).get(formats[0])
+        if not location:
+            return await _send_json(send, 404, {'error': f"No {kind}{extension} for this job (status: {job.status})."})
+        try:
+            data = await asyncio.to_thread(self.service.sink.read, location)
+        except NotImplementedError as e:
+            return await _send_json(send, 501, {'error': str(e)})
+        filename = location.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', content_type(location).encode()),
+                                (b'content-disposition', f'attachment; filename="{filename}"'.encode('utf-8')),
+                                (b'content-length', str(len(data)).encode())]})
+        await send({'type': 'http.response.body', 'body': data})
+
+async def _send_json(send, status, payload, headers=()):
+    body = json.dumps(payload).encode('utf-8')
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode()),
+                            *headers]})
+    await send({'type': 'http.response.body', 'body': body})
+
+def create_app(scheduler, **service_options):
+    """
+    Builds the ASGI app around a new GenerationService; `service_options` are passed to GenerationService.
+    """
+    return ServiceApp(GenerationService(scheduler, **service_options))
@@ -0,0 +1,176 @@
+"""Pluggable destinations for finished documents."""
+import io
+import os
+import threading
+import zipfile
+
+# --- Output Sinks ---
+
+def content_type(name):
+    """
+    Returns the Content-Type for a document from its file extension: the PDF or another output format.
+    """
+    from .renderers import RENDERERS
+
+    extension = os.path.splitext(name)[1].lower()
+    for renderer in RENDERERS.values():
+        if renderer.extension == extension:
+            return renderer.media_type
+    return 'application/octet-stream'
+
+class OutputSink:
+    """
+    Destination for finished documents. write(name, data) stores the bytes under `name` and returns
+    a location string for logs and manifests. Implementations must be safe to call from several threads.
+    Sinks that can hand documents back (e.g. for download from the HTTP service) also implement read(location).
+    """
+    def write(self, name, data):
+        raise NotImplementedError
+
+    def read(self, location):
+        raise NotImplementedError(f"{type(self).__name__} cannot read documents back")
+
+    def contains(self, location):
+        """
+        Returns False if the document written at `location` is known to be missing (e.g. deleted, or lost
+        with an archive that was never closed). Sinks that cannot tell return True. The location may come from
+        a manifest written by an earlier run, so it is looked up by document name within this sink.
+        """
+        return True
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class LocalDirectorySink(OutputSink):
+    """
+    Writes each document to a file in `directory` (created if missing).
+    """
+    def __init__(self, directory="."):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def read(self, location):
+        with open(location, 'rb') as f:
+            return f.read()
+
+    def contains(self, location):
+        # Locations are relative to the directory the writing process ran in, so only the file name is used.
+        return os.path.exists(os.path.join(self.directory, os.path.basename(location)))
+
+class ZipArchiveSink(OutputSink):
+    """
+    Streams every document into one zip archive. `target` is a path or a writable binary file object, which
+    need not be seekable (e.g. a socket or HTTP response body).
+    The archive's index is written by close(), so it must be closed for the archive to be readable. A path
+    target is built in '<target>.partial' and only replaces `target` on close(), so a crash never leaves
+    `target` without its index. Documents already in an existing `target` are carried over, except those
+    written again under the same name.
+    """
+    def __init__(self, target, compression=zipfile.ZIP_DEFLATED):
+        self.target = target
+        self._existing = set()
+        self._written = set()
+        self._lock = threading.Lock()
+        if isinstance(target, str):
+            if os.path.exists(target):
+                try:
+                    with zipfile.ZipFile(target) as archive:
+                        self._existing = set(archive.namelist())
+                except zipfile.BadZipFile:
+                    print(f"Warning: '{target}' is not a readable zip archive; it will be replaced.")
+            self._partial_path = f"{target}.partial"
+            self._archive = zipfile.ZipFile(self._partial_path, 'w', compression=compression)
+        else:
+            self._partial_path = None
+            self._archive = zipfile.ZipFile(target, 'w', compression=compression)
+
+    def write(self, name, data):
+        with self._lock:
+            self._archive.writestr(name, data)
+            self._written.add(name)
+        location = self.target if isinstance(self.target, str) else "archive"
+        return f"{location}:{name}"
+
+    def contains(self, location):
+        # '<target>:<name>'; the target path may have been given relative to another directory.
+        name = location.rpartition(':')[2]
+        return name in self._existing or name in self._written
+
+    def close(self):
+        with self._lock:
+            if self._archive is None:
+                return
+            carried = self._existing - self._written
+            if carried:
+                with zipfile.ZipFile(self.target) as previous:
+                    for info in previous.infolist():
+                        if info.filename in carried:
+                            self._archive.writestr(info, previous.read(info))
+            self._archive.close()
+            self._archive = None
+            if self._partial_path is not None:
+                os.replace(self._partial_path, self.target)
+
+class InMemoryObjectStore:
+    """
+    Local stand-in for an S3-style object store client, implementing put_object/get_object with the same
+    keyword arguments so ObjectStoreSink can be exercised without a network service.
+    """
+    def __init__(self):
+        self.objects = {}
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        with self._lock:
+            self.objects[(Bucket, Key)] = bytes(Body)
+        return {}
+
+    def get_object(self, Bucket, Key):
+        with self._lock:
+            return {'Body': io.BytesIO(self.objects[(Bucket, Key)])}
+
+class ObjectStoreSink(OutputSink):
+    """
+    Uploads each document with `client.put_object(Bucket=..., Key=..., Body=...)`, the call shape of boto3's
+    S3 client; InMemoryObjectStore provides a local stand-in.
+    """
+    def __init__(self, client, bucket, prefix=""):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def write(self, name, data):
+        key = f"{self.prefix}{name}"
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=data, ContentType=content_type(name))
+        return f"{self.bucket}/{key}"
+
+    def read(self, location):
+        key = location[len(self.bucket) + 1:]
+        return self.client.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+
+class HTTPResponseSink(OutputSink):
+    """
+    Hands each document to `send(headers, body)`, e.g. a web framework callback that returns it as an HTTP
+    response, with Content-Type and a Content-Disposition attachment filename set.
+    """
+    def __init__(self, send):
+        self.send = send
+
+    def write(self, name, data):
+        headers = {'Content-Type': content_type(name),
+                   'Content-Disposition': f'attachment; filename="{name}"',
+                   'Content-Length': str(len(data))}
+        self.send(headers, data)
+        return name
@@ -0,0 +1,70 @@
+"""Stub AI client for local testing and load tests without the real API."""
+import random
+import time
+
+# --- Stub AI Client (local testing and load tests without the real API) ---
+
+class StubAPIError(Exception):
+    """
+    Error raised by StubGeminiClient, shaped like a google.api_core exception with an HTTP `code`.
+    """
+    def __init__(self, code, message=""):
+        super().__init__(message or f"Stub API error {code}")
+        self.code = code
+
+class StubGeminiClient:
+    """
+    Stand-in for the Gemini API with injectable latency and failures.
+    Each call sleeps for `latency` seconds (plus up to `jitter` extra, plus the reply's length divided by
+    `chars_per_second` when given, like a model generating output) and, with probability `error_rate`,
+    raises a StubAPIError with one of `error_codes`; otherwise it returns reply(prompt): `response_text` or
+    a canned reply based on the prompt. Subclasses can override reply(). generate_stream yields the same
+    reply in chunks. Call counts are kept so tests can check retry behaviour.
+    """
+    def __init__(self, latency=0.5, jitter=0.0, error_rate=0.0, error_codes=(429, 503), response_text=None, seed=None,
+                 chars_per_second=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.response_text = response_text
+        self.chars_per_second = chars_per_second
+        self.calls = 0
+        self.failures = 0
+        self._random = random.Random(seed)
+
+    def reply(self, prompt):
+        if self.response_text is not None:
+            return self.response_text
+        if "cover letter" in prompt:
+            return "Dear Hiring Manager,\n\nThis is a stub cover letter.\n\nSincerely,"
+        return "Summary\nThis is a stub resume.\n\nSkills\nTesting"
+
+    def _respond(self, prompt):
+        # Returns (reply, seconds the call should take); injected failures still take the base latency.
+        self.calls += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if self._random.random() < self.error_rate:
+            self.failures += 1
+            time.sleep(delay)
+            raise StubAPIError(self._random.choice(self.error_codes))
+        text = self.reply(prompt)
+        if self.chars_per_second:
+            delay += len(text) / self.chars_per_second
+        return text, delay
+
+    def __call__(self, prompt, api_key):
+        text, delay = self._respond(prompt)
+        time.sleep(delay)
+        return text
+
+    def generate_stream(self, prompt, api_key, chunk_size=64):
+        """
+        Streams the reply in `chunk_size` character pieces, spreading the latency evenly across them
+        the way a real streamed response arrives.
+        """
+        text, delay = self._respond(prompt)
+        pieces = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)] or [""]
+        for piece in pieces:
+            time.sleep(delay / len(pieces))
+            yield piece
@@ -0,0 +1,308 @@
+"""
+Per-stage metrics and tracing.
+
+Code is instrumented with three module-level calls:
+
+    with telemetry.span('pdf.layout', kind='resume'):   # timed stage, nested like an OpenTelemetry span
+        ...
+    telemetry.count('ai_retries', kind='resume')         # monotonically increasing counter
+    telemetry.observe('pdf_bytes', len(data))            # distribution (count, sum, min, max)
+
+Nothing is recorded until exporters are installed with `configure(...)`. Until then span() returns a shared
+no-op context manager and count()/observe() return immediately, so instrumentation costs one global lookup.
+
+Exporters receive every finished span and every metric update and decide what to keep:
+JSONLogExporter writes one JSON line per event, PrometheusExporter aggregates into the text exposition
+format, and OpenTelemetryExporter mirrors spans into an OpenTelemetry tracer (optional dependency).
+
+Recorded spans: candidate > document{kind} > prompt.build, generate > ai.request{attempt}, render > pdf.layout,
+sink.write (when streaming, ai.request > pdf.stream > pdf.layout instead of generate/render). Parsing runs
+inside pdf.layout, which takes flowables as layout reaches them, and the span records 'flowables' and 'pages'.
+When other output formats are requested, generate is followed by parse, then export{format} for each format
+while render runs alongside.
+Counters: cache_lookups{result}, ai_prompt_tokens, ai_response_tokens (estimated, ~4 characters per token),
+ai_errors{status_code,retryable}, ai_retries, pdf_failures{kind}, export_failures{kind,format},
+batch_records{status}, service_jobs{status}.
+Observations: ai_wait_seconds (slot and rate-limit wait), pdf_bytes{kind}, export_bytes{kind,format},
+service_job_seconds.
+PDFs rendered in a PDFRenderPool are timed by the render span only, as worker processes record nothing.
+"""
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+
+# --- Spans ---
+
+_current_span = contextvars.ContextVar('resume_generator_span', default=None)
+
+class Span:
+    """
+    One timed stage. `trace_id` is shared by a span and everything started inside it (in the same task or
+    thread, or a thread started with a copied context); `parent_id` links to the enclosing span.
+    """
+    __slots__ = ('name', 'attributes', 'trace_id', 'span_id', 'parent_id', 'start_ns', 'end_ns', 'error',
+                 '_telemetry', '_token')
+
+    def __init__(self, telemetry, name, attributes):
+        parent = _current_span.get()
+        self.name = name
+        self.attributes = attributes
+        self.span_id = os.urandom(8).hex()
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = None
+        self.end_ns = None
+        self.error = None
+        self._telemetry = telemetry
+
+    @property
+    def duration(self):
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        self._telemetry._span_started(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self._telemetry._span_finished(self)
+        return False
+
+    def to_dict(self):
+        return {'name': self.name, 'trace_id': self.trace_id, 'span_id': self.span_id, 'parent_id': self.parent_id,
+                'start_ns': self.start_ns, 'end_ns': self.end_ns, 'duration_s': round(self.duration, 6),
+                'attributes': self.attributes, 'error': self.error}
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set_attribute(self, key, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NOOP_SPAN = _NoopSpan()
+
+# --- Exporters ---
+
+class Exporter:
+    """
+    Receives telemetry events. on_span_start/on_span_end get Span objects; on_metric gets
+    (kind, name, value, labels) with kind 'counter' or 'observation'. Methods may be called from any thread.
+    """
+    def on_span_start(self, span):
+        pass
+
+    def on_span_end(self, span):
+        pass
+
+    def on_metric(self, kind, name, value, labels):
+        pass
+
+    def close(self):
+        pass
+
+class JSONLogExporter(Exporter):
+    """
+    Writes one JSON object per finished span or metric update to `target`, a path (appended to)
+    or a text stream (default: stderr).
+    """
+    def __init__(self, target=None):
+        self._owns_stream = isinstance(target, str)
+        self.stream = open(target, 'a', encoding='utf-8') if self._owns_stream else (target or sys.stderr)
+        self._lock = threading.Lock()
+
+    def _write(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self.stream.write(line)
+
+    def on_span_end(self, span):
+        self._write({'type': 'span', **span.to_dict()})
+
+    def on_metric(self, kind, name, value, labels):
+        self._write({'type': kind, 'name': name, 'value': value, 'labels': labels, 'time_ns': time.time_ns()})
+
+    def close(self):
+        with self._lock:
+            if self._owns_stream:
+                self.stream.close()
+            else:
+                self.stream.flush()
+
+class PrometheusExporter(Exporter):
+    """
+    Aggregates counters, observations and span durations (as `<prefix>_stage_seconds{stage=...}`)
+    and renders them in the Prometheus text exposition format with render().
+    Observations and stage durations are exported as summaries (count and sum).
+    """
+    def __init__(self, prefix='resume_generator'):
+        self.prefix = prefix
+        self._counters = {}
+        self._summaries = {}
+        self._lock = threading.Lock()
+
+    def on_span_end(self, span):
+        self._observe('stage_seconds', span.duration, (('stage', span.name),))
+
+    def on_metric(self, kind, name, value, labels):
+        key = tuple(sorted(labels.items()))
+        if kind == 'counter':
+            with self._lock:
+                series = self._counters.setdefault(name, {})
+                series[key] = series.get(key, 0) + value
+        else:
+            self._observe(name, value, key)
+
+    def _observe(self, name, value, key):
+        with self._lock:
+            count, total = self._summaries.setdefault(name, {}).get(key, (0, 0.0))
+            self._summaries[name][key] = (count + 1, total + value)
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.prefix}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.extend(f"{metric}{_format_labels(key)} {value}" for key, value in sorted(series.items()))
+            for name, series in sorted(self._summaries.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} summary")
+                for key, (count, total) in sorted(series.items()):
+                    lines.append(f"{metric}_count{_format_labels(key)} {count}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {total:.6g}")
+        return "\n".join(lines) + "\n"
+
+def _format_labels(key):
+    if not key:
+        return ""
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in key)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(key, escaped)) + "}"
+
+class OpenTelemetryExporter(Exporter):
+    """
+    Mirrors spans into OpenTelemetry: each Span starts a real OpenTelemetry span (parented like ours) on
+    `tracer`, by default opentelemetry.trace.get_tracer('resume_generator'), and ends it with the same
+    timestamps, attributes and error status. Needs the opentelemetry-api package.
+    """
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer('resume_generator')
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def on_span_start(self, span):
+        with self._lock:
+            parent = self._open.get(span.parent_id)
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        otel_span = self.tracer.start_span(span.name, context=context, start_time=span.start_ns,
+                                           attributes=_otel_attributes(span.attributes))
+        with self._lock:
+            self._open[span.span_id] = otel_span
+
+    def on_span_end(self, span):
+        with self._lock:
+            otel_span = self._open.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        otel_span.set_attributes(_otel_attributes(span.attributes))
+        if span.error:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=span.end_ns)
+
+def _otel_attributes(attributes):
+    # OpenTelemetry attribute values must be str, bool, int or float.
+    return {key: value if isinstance(value, (str, bool, int, float)) else str(value)
+            for key, value in attributes.items() if value is not None}
+
+EXPORTERS = {
+    'json': JSONLogExporter,
+    'prometheus': PrometheusExporter,
+    'otel': OpenTelemetryExporter,
+}
+
+# --- Recording ---
+
+class Telemetry:
+    """
+    Fans spans and metrics out to a list of exporters.
+    """
+    def __init__(self, exporters):
+        self.exporters = list(exporters)
+
+    def span(self, name, attributes):
+        return Span(self, name, attributes)
+
+    def _span_started(self, span):
+        for exporter in self.exporters:
+            exporter.on_span_start(span)
+
+    def _span_finished(self, span):
+        for exporter in self.exporters:
+            exporter.on_span_end(span)
+
+    def metric(self, kind, name, value, labels):
+        for exporter in self.exporters:
+            exporter.on_metric(kind, name, value, labels)
+
+    def find(self, exporter_type):
+        return next((e for e in self.exporters if isinstance(e, exporter_type)), None)
+
+    def close(self):
+        for exporter in self.exporters:
+            exporter.close()
+
+_telemetry = None
+
+def configure(*exporters):
+    """
+    Installs the exporters process-wide and returns the Telemetry object; with no exporters, disables
+    recording again. Any previously configured exporters are closed.
+    """
+    global _telemetry
+    previous, _telemetry = _telemetry, (Telemetry(exporters) if exporters else None)
+    if previous is not None:
+        previous.close()
+    return _telemetry
+
+def get_telemetry():
+    """
+    Returns the active Telemetry, or None when recording is disabled.
+    """
+    return _telemetry
+
+def enabled():
+    return _telemetry is not None
+
+def span(name, **attributes):
+    """
+    Context manager timing one stage. Returns a no-op when telemetry is disabled.
+    """
+    if _telemetry is None:
+        return _NOOP_SPAN
+    return _telemetry.span(name, attributes)
+
+def count(name, value=1, **labels):
+    if _telemetry is not None:
+        _telemetry.metric('counter', name, value, labels)
+
+def observe(name, value, **labels):
+    if _telemetry is not None:
+        _telemetry.metric('observation', name, value, labels)
@@ -0,0 +1,160 @@
+"""Collecting candidate details interactively and normalizing user_data records."""
+import json
+
+# --- User Input Function ---
+
+def get_user_input():
+    """
+    Prompts the user for their Google Gemini API key and details
+    required for resume and cover letter generation.
+    Handles ValueError for numeric inputs.
+    """
+    print("--- AI Resume & Cover Letter Generator ---")
+    print("This tool will help you generate a resume and cover letter using an AI model.")
+    print("Please provide the requested information.")
+
+    api_key = input("Enter your Google Gemini API Key: ").strip()
+    if not api_key:
+        print("API Key cannot be empty. Please restart and provide a valid key.")
+        return None
+
+    job_title = input("Enter the Job Title you are applying for: ").strip()
+    company_name = input("Enter the Company Name: ").strip()
+    your_name = input("Enter your Full Name: ").strip()
+    your_email = input("Enter your Email Address: ").strip()
+    your_phone = input("Enter your Phone Number: ").strip()
+    your_linkedin = input("Enter your LinkedIn Profile URL (optional): ").strip()
+
+    print("\n--- Your Work Experience ---")
+    experiences = []
+    while True:
+        try:
+            num_experiences = int(input("How many work experiences do you want to include? "))
+            break
+        except ValueError:
+            print("Invalid input. Please enter a number for the quantity of work experiences.")
+
+    for i in range(num_experiences):
+        print(f"\nExperience {i+1}:")
+        exp_title = input("Job Title: ").strip()
+        exp_company = input("Company: ").strip()
+        exp_dates = input("Start Date - End Date (e.g., Jan 2020 - Dec 2022): ").strip()
+        exp_responsibilities = input("Key Responsibilities/Achievements (comma-separated): ").strip().split(',')
+        experiences.append({
+            'title': exp_title,
+            'company': exp_company,
+            'dates': exp_dates,
+            'responsibilities': [r.strip() for r in exp_responsibilities if r.strip()]
+        })
+
+    print("\n--- Your Education ---")
+    education_list = []
+    while True:
+        try:
+            num_education = int(input("How many educational qualifications do you want to include? "))
+            break
+        except ValueError:
+            print("Invalid input. Please enter a number for the quantity of educational qualifications.")
+
+    for i in range(num_education):
+        print(f"\nEducation {i+1}:")
+        edu_degree = input("Degree/Qualification: ").strip()
+        edu_institution = input("Institution: ").strip()
+        edu_dates = input("Graduation Date (e.g., May 2023): ").strip()
+        education_list.append({
+            'degree': edu_degree,
+            'institution': edu_institution,
+            'dates': edu_dates
+        })
+
+    skills = input("\n--- Your Skills (comma-separated, e.g., Python, Machine Learning, Data Analysis): ").strip().split(',')
+    skills = [s.strip() for s in skills if s.strip()]
+
+    print("\n--- Cover Letter Specifics ---")
+    hiring_manager_name = input("Enter the Hiring Manager's Name (optional): ").strip()
+    how_heard = input("How did you hear about this position? (optional): ").strip()
+    additional_cover_letter_points = input("Any additional points for the cover letter (e.g., specific projects, passion): ").strip()
+
+    user_data = {
+        'api_key': api_key,
+        'job_title': job_title,
+        'company_name': company_name,
+        'your_name': your_name,
+        'your_email': your_email,
+        'your_phone': your_phone,
+        'your_linkedin': your_linkedin,
+        'experiences': experiences,
+        'education': education_list,
+        'skills': skills,
+        'hiring_manager_name': hiring_manager_name,
+        'how_heard': how_heard,
+        'additional_cover_letter_points': additional_cover_letter_points
+    }
+    return user_data
+
+# --- user_data Records ---
+
+USER_DATA_TEXT_FIELDS = ['job_title', 'company_name', 'your_name', 'your_email', 'your_phone',
+                         'your_linkedin', 'hiring_manager_name', 'how_heard', 'additional_cover_letter_points']
+USER_DATA_LIST_FIELDS = ['experiences', 'education', 'skills']
+# Keys every experience and education entry needs; the prompts read them directly.
+EXPERIENCE_FIELDS = ('title', 'company', 'dates')
+EDUCATION_FIELDS = ('degree', 'institution', 'dates')
+
+def build_output_filenames(user_data, prefix=""):
+    """
+    Builds the resume and cover letter PDF filenames for a candidate,
+    keeping only alphanumeric characters from the name and job title.
+    """
+    resume_name_part = "".join(c for c in user_data['your_name'] if c.isalnum() or c == ' ').replace(' ', '_')
+    job_title_part = "".join(c for c in user_data['job_title'] if c.isalnum() or c == ' ').replace(' ', '_')
+    if prefix:
+        prefix = "".join(c for c in str(prefix) if c.isalnum() or c in '-_') + "_"
+
+    resume_filename_pdf = f"{prefix}{resume_name_part}_Resume_{job_title_part}.pdf"
+    cover_letter_filename_pdf = f"{prefix}{resume_name_part}_CoverLetter_{job_title_part}.pdf"
+    return resume_filename_pdf, cover_letter_filename_pdf
+
+def normalize_user_data(record, default_api_key=None):
+    """
+    Turns a raw job-file record into the same user_data shape that get_user_input() returns.
+    Missing optional fields become empty values. CSV cells for experiences/education hold JSON,
+    and skills may be either a JSON list or a comma-separated string.
+    Raises ValueError if an experience or education entry is not an object with the EXPERIENCE_FIELDS or
+    EDUCATION_FIELDS, or skills are not strings, so bad records are rejected before any AI request.
+    """
+    user_data = {'api_key': str(record.get('api_key') or default_api_key or '').strip()}
+    for field in USER_DATA_TEXT_FIELDS:
+        user_data[field] = str(record.get(field) or '').strip()
+
+    for field in USER_DATA_LIST_FIELDS:
+        value = record.get(field) or []
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith('['):
+                value = json.loads(value)
+            elif field == 'skills':
+                value = [s.strip() for s in value.split(',') if s.strip()]
+            else:
+                value = []
+        if not isinstance(value, list):
+            raise ValueError(f"'{field}' must be a list.")
+        user_data[field] = value
+
+    for field, required in (('experiences', EXPERIENCE_FIELDS), ('education', EDUCATION_FIELDS)):
+        for position, entry in enumerate(user_data[field], start=1):
+            if not isinstance(entry, dict):
+                raise ValueError(f"'{field}' entry {position} must be an object.")
+            missing = [key for key in required if entry.get(key) is None]
+            if missing:
+                raise ValueError(f"'{field}' entry {position} is missing {', '.join(map(repr, missing))}.")
+    if not all(isinstance(skill, str) for skill in user_data['skills']):
+        raise ValueError("'skills' must be a list of strings.")
+
+    for exp in user_data['experiences']:
+        responsibilities = exp.get('responsibilities') or []
+        if isinstance(responsibilities, str):
+            responsibilities = responsibilities.split(',')
+        exp['responsibilities'] = [r.strip() for r in responsibilities if r.strip()]
+
+    return user_data
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The fake AI client and the recorded fixtures live with the benchmarks.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
@@ -0,0 +1,101 @@
+"""
+Records tests/fixtures/render_golden.json, the reference output for test_render_equivalence.py: for every
+document in the benchmark fixtures, a digest of the flowables the PDF builder produces and of the PDF itself.
+
+The reference builder is the single-file main.py of the baseline revision (REFERENCE_REVISION), before the
+streaming story builder and the document model, loaded from git history; its notebook-only google.colab
+import is given an empty stand-in, as nothing from it is used for rendering. Run from the repository root:
+
+    python tests/make_render_golden.py [--revision ae8ce7a]
+"""
+import argparse
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import types
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+GOLDEN_PATH = os.path.join(TESTS_DIR, 'fixtures', 'render_golden.json')
+REFERENCE_REVISION = 'ae8ce7a'
+
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+def describe_flowable(flowable):
+    from reportlab.platypus import Paragraph, Spacer
+
+    if isinstance(flowable, Paragraph):
+        return ['Paragraph', flowable.style.name, flowable.text]
+    if isinstance(flowable, Spacer):
+        return ['Spacer', flowable.width, flowable.height]
+    return [type(flowable).__name__]
+
+def story_digest(flowables):
+    """
+    SHA-256 of the flowables' types, style names and text; independent of the ReportLab version.
+    """
+    dump = json.dumps([describe_flowable(f) for f in flowables])
+    return hashlib.sha256(dump.encode('utf-8')).hexdigest()
+
+def pdf_digest(pdf_bytes):
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+def document_key(kind, name):
+    return f"{kind}:{name}"
+
+def load_reference_module(revision):
+    source = subprocess.run(['git', 'show', f'{revision}:main.py'], cwd=ROOT_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    colab = types.ModuleType('google.colab')
+    colab.files = None
+    sys.modules['google.colab'] = colab
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'reference_main.py')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        spec = importlib.util.spec_from_file_location('reference_main', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--revision', default=REFERENCE_REVISION, help="Git revision of the reference main.py")
+    args = parser.parse_args()
+
+    from reportlab import Version, rl_config
+    from fake_llm import load_recorded_responses
+
+    # Fixed timestamps and document IDs, so the same layout always gives the same bytes.
+    rl_config.invariant = 1
+    reference = load_reference_module(args.revision)
+    stories = []
+
+    class RecordingDocTemplate(reference.SimpleDocTemplate):
+        def build(self, flowables, *build_args, **build_kwargs):
+            # Layout consumes the list it is given, so it gets a copy.
+            stories.append(list(flowables))
+            return super().build(list(stories[-1]), *build_args, **build_kwargs)
+
+    reference.SimpleDocTemplate = RecordingDocTemplate
+    documents = {}
+    for (kind, name), text in sorted(load_recorded_responses().items()):
+        buffer = io.BytesIO()
+        if not reference.create_pdf(buffer, text, {'your_name': name}, is_cover_letter=kind == 'cover_letter'):
+            raise SystemExit(f"Reference builder failed on {document_key(kind, name)}")
+        documents[document_key(kind, name)] = {'story': story_digest(stories[-1]),
+                                               'pdf': pdf_digest(buffer.getvalue())}
+
+    with open(GOLDEN_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'revision': args.revision, 'reportlab_version': Version, 'documents': documents}, f,
+                  indent=1, sort_keys=True)
+        f.write("\n")
+    print(f"Recorded {len(documents)} documents to {GOLDEN_PATH}")
+
+if __name__ == '__main__':
+    main()
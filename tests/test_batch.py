@@ -0,0 +1,104 @@
+"""
+Restartable batch runs: skipping completed records, regenerating edited or lost ones, reusing sections.
+"""
+import json
+import os
+
+from fake_llm import load_corpus
+from resume_generator.batch import BATCH_MANIFEST_NAME, load_batch_manifest, run_batch
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.sections import SectionedResumeGenerator
+from resume_generator.sinks import LocalDirectorySink, ZipArchiveSink
+from resume_generator.stub import StubGeminiClient
+
+RECORDS = [{key: value for key, value in user_data.items() if key != 'api_key'} for user_data in load_corpus()[:3]]
+
+def write_jobs(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return str(path)
+
+def batch(job_file, output_dir, **kwargs):
+    # Returns the counts and the number of AI requests the run made.
+    client = StubGeminiClient(latency=0)
+    counts = run_batch(job_file, output_dir, default_api_keys=['key'], scheduler=GenerationScheduler(client=client),
+                       **kwargs)
+    return counts, client.calls
+
+def manifest_entries(output_dir):
+    with open(os.path.join(output_dir, BATCH_MANIFEST_NAME), encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_rerun_skips_completed_records(tmp_path):
+    job_file = write_jobs(tmp_path / 'jobs.jsonl', RECORDS)
+    output_dir = str(tmp_path / 'out')
+    assert batch(job_file, output_dir) == ({'ok': 3, 'error': 0, 'skipped': 0}, 6)
+    assert batch(job_file, output_dir) == ({'ok': 0, 'error': 0, 'skipped': 3}, 0)
+
+def test_rerun_from_another_directory_finds_completed_records(tmp_path, monkeypatch):
+    job_file = write_jobs(tmp_path / 'jobs.jsonl', RECORDS)
+    monkeypatch.chdir(tmp_path)
+    assert batch(job_file, 'out')[0]['ok'] == 3
+
+    elsewhere = tmp_path / 'elsewhere'
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    assert batch(job_file, str(tmp_path / 'out')) == ({'ok': 0, 'error': 0, 'skipped': 3}, 0)
+
+def test_rerun_regenerates_only_edited_records(tmp_path):
+    job_file = write_jobs(tmp_path / 'jobs.jsonl', RECORDS)
+    output_dir = str(tmp_path / 'out')
+    batch(job_file, output_dir)
+
+    edited = [dict(record) for record in RECORDS]
+    edited[1]['skills'] = edited[1]['skills'] + ['Rust']
+    write_jobs(tmp_path / 'jobs.jsonl', edited)
+    assert batch(job_file, output_dir) == ({'ok': 1, 'error': 0, 'skipped': 2}, 2)
+    assert manifest_entries(output_dir)[-1]['record_id'] == '2'
+
+def test_rerun_reuses_the_unchanged_sections_of_edited_records(tmp_path):
+    job_file = write_jobs(tmp_path / 'jobs.jsonl', RECORDS)
+    output_dir = str(tmp_path / 'out')
+    sections = SectionedResumeGenerator()
+    batch(job_file, output_dir, sections=sections)
+
+    edited = [dict(record) for record in RECORDS]
+    edited[1]['skills'] = edited[1]['skills'] + ['Rust']
+    write_jobs(tmp_path / 'jobs.jsonl', edited)
+    counts, calls = batch(job_file, output_dir, sections=sections)
+
+    assert counts == {'ok': 1, 'error': 0, 'skipped': 2}
+    report = manifest_entries(output_dir)[-1]['sections']
+    # The summary and skills sections depend on the skills; the experiences are reused, plus one cover letter.
+    assert report['generated'] == ['summary', 'skills']
+    assert report['reused'] == [f"experience:{i}" for i in range(1, len(RECORDS[1]['experiences']) + 1)]
+    assert calls == 3
+
+def test_records_whose_pdfs_are_missing_are_generated_again(tmp_path):
+    job_file = write_jobs(tmp_path / 'jobs.jsonl', RECORDS)
+    output_dir = str(tmp_path / 'out')
+    batch(job_file, output_dir)
+    os.remove(manifest_entries(output_dir)[0]['resume_pdf'])
+
+    assert batch(job_file, output_dir)[0] == {'ok': 1, 'error': 0, 'skipped': 2}
+
+def test_truncated_manifest_line_is_ignored(tmp_path):
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    sink = LocalDirectorySink(str(output_dir))
+    locations = [sink.write(name, b'pdf') for name in ('1_resume.pdf', '1_cover.pdf')]
+    entry = {'record_id': '1', 'status': 'ok', 'resume_pdf': locations[0], 'cover_letter_pdf': locations[1],
+             'input_hash': 'abc'}
+    (output_dir / BATCH_MANIFEST_NAME).write_text(json.dumps(entry) + "\n" + '{"record_id": "2", "sta',
+                                                  encoding='utf-8')
+    assert load_batch_manifest(str(output_dir / BATCH_MANIFEST_NAME), sink) == {'1': 'abc'}
+
+def test_archive_rerun_skips_records_in_the_archive(tmp_path):
+    job_file = write_jobs(tmp_path / 'jobs.jsonl', RECORDS)
+    output_dir = str(tmp_path / 'out')
+    archive = str(tmp_path / 'out.zip')
+    with ZipArchiveSink(archive) as sink:
+        batch(job_file, output_dir, sink=sink)
+    with ZipArchiveSink(archive) as sink:
+        assert batch(job_file, output_dir, sink=sink) == ({'ok': 0, 'error': 0, 'skipped': 3}, 0)
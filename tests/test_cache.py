@@ -0,0 +1,117 @@
+"""
+ResponseCache: hits and misses, age expiry, least-recently-used eviction, and lookups off the event loop.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from resume_generator import cache as cache_module
+from resume_generator.cache import ResponseCache
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.stub import StubGeminiClient
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, 'time', clock.time)
+    return clock
+
+def test_hits_and_misses_are_counted():
+    cache = ResponseCache(':memory:')
+    key = cache.make_key('model', "prompt")
+    assert cache.get(key) is None
+    cache.put(key, "text", 'model')
+    assert cache.get(key) == "text"
+    assert cache.get(key, count_miss=False) == "text"
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'entries': 1, 'hit_rate': 2 / 3}
+
+def test_key_depends_on_model_prompt_and_params():
+    keys = {ResponseCache.make_key('a', "prompt"), ResponseCache.make_key('b', "prompt"),
+            ResponseCache.make_key('a', "other"), ResponseCache.make_key('a', "prompt", {'temperature': 0})}
+    assert len(keys) == 4
+
+def test_entries_expire_after_max_age(clock):
+    cache = ResponseCache(':memory:', max_age=10)
+    cache.put('key', "text")
+    clock.now += 9
+    assert cache.get('key') == "text"
+    clock.now += 2
+    assert cache.get('key') is None
+
+    cache.prune()
+    assert cache.stats()['entries'] == 0
+
+def test_max_age_none_keeps_entries(clock):
+    cache = ResponseCache(':memory:', max_age=None)
+    cache.put('key', "text")
+    clock.now += 365 * 24 * 3600
+    assert cache.get('key') == "text"
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = ResponseCache(':memory:', max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, key.upper())
+        clock.now += 1
+    # Reading 'a' makes 'b' the least recently used.
+    assert cache.get('a') == "A"
+    cache.prune()
+
+    assert cache.stats()['entries'] == 2
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == ("A", "C")
+
+def test_eviction_runs_every_prune_every_puts(clock, monkeypatch):
+    monkeypatch.setattr(ResponseCache, 'PRUNE_EVERY', 5)
+    cache = ResponseCache(':memory:', max_entries=3)
+    for i in range(4):
+        cache.put(str(i), "text")
+        clock.now += 1
+    assert cache.stats()['entries'] == 4
+    cache.put('4', "text")
+    assert cache.stats()['entries'] == 3
+    assert cache.get('0') is None and cache.get('4') == "text"
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = ResponseCache(path)
+    cache.put('key', "text")
+    cache.close()
+    assert ResponseCache(path).get('key') == "text"
+
+class ThreadRecordingCache(ResponseCache):
+    def __init__(self):
+        super().__init__(':memory:')
+        self.threads = []
+
+    def get(self, key, count_miss=True):
+        self.threads.append(threading.get_ident())
+        return super().get(key, count_miss)
+
+    def put(self, key, response, model_name=None):
+        self.threads.append(threading.get_ident())
+        super().put(key, response, model_name)
+
+def test_scheduler_uses_the_cache_off_the_event_loop():
+    cache = ThreadRecordingCache()
+    scheduler = GenerationScheduler(client=StubGeminiClient(latency=0), cache=cache)
+
+    async def generate_twice():
+        loop_thread = threading.get_ident()
+        texts = [await scheduler.generate("prompt", "key") for _ in range(2)]
+        return loop_thread, texts
+
+    try:
+        loop_thread, texts = asyncio.run(generate_twice())
+    finally:
+        scheduler.close()
+    assert texts[0] == texts[1]
+    assert len(cache.threads) == 3
+    assert loop_thread not in cache.threads
@@ -0,0 +1,151 @@
+"""
+Gemini access without network calls: the google-generativeai internals llm.py relies on, and how
+GeminiClientPool picks models for plain and shared-prefix prompts.
+"""
+import pytest
+
+from resume_generator.llm import (MIN_CONTEXT_CACHE_TOKENS, AIGenerationError, GeminiClientPool, _bind_api_client,
+                                  is_retryable_error, make_cached_gemini_model, make_gemini_model)
+from resume_generator.prompts import PrefixedPrompt
+from resume_generator.stub import StubAPIError
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+        self.contents = []
+
+    def generate_content(self, contents, stream=False, request_options=None):
+        self.contents.append((contents, request_options))
+        if stream:
+            return iter([FakeResponse(f"{self.name} chunk")])
+        return FakeResponse(f" {self.name} reply ")
+
+class FakeFactories:
+    def __init__(self, cache_fails=False):
+        self.models = []
+        self.cached_models = []
+        self.cache_fails = cache_fails
+
+    def model(self, api_key, model_name):
+        self.models.append((api_key, model_name))
+        return FakeModel(f"{api_key}/{model_name}")
+
+    def cached_model(self, api_key, model_name, prefix, ttl):
+        self.cached_models.append((api_key, model_name, prefix))
+        if self.cache_fails:
+            raise RuntimeError("caching disabled")
+        return FakeModel(f"{api_key}/{model_name}/cached")
+
+def make_pool(factories, **kwargs):
+    return GeminiClientPool(model_factory=factories.model, cached_model_factory=factories.cached_model, **kwargs)
+
+LONG_PREFIX = "profile " * (MIN_CONTEXT_CACHE_TOKENS * 4 // 8 + 8)
+
+# --- SDK internals ---
+
+def test_models_get_their_own_client_per_api_key():
+    pytest.importorskip('google.generativeai')
+    from google.ai import generativelanguage as glm
+
+    first, second = make_gemini_model('key-a'), make_gemini_model('key-b')
+    assert isinstance(first._client, glm.GenerativeServiceClient)
+    assert first._client is not second._client
+
+def test_cached_models_wrap_the_created_cached_content(monkeypatch):
+    pytest.importorskip('google.generativeai')
+    from google.ai import generativelanguage as glm
+
+    requests = []
+
+    class FakeCacheServiceClient:
+        def __init__(self, client_options):
+            self.api_key = client_options['api_key']
+
+        def create_cached_content(self, request):
+            requests.append((self.api_key, request))
+            return glm.CachedContent(name='cachedContents/profile', model=request.cached_content.model)
+
+    monkeypatch.setattr(glm, 'CacheServiceClient', FakeCacheServiceClient)
+    model = make_cached_gemini_model('key-a', 'gemini-2.5-flash', "profile text", ttl_seconds=600)
+
+    assert model.cached_content == 'cachedContents/profile'
+    assert isinstance(model._client, glm.GenerativeServiceClient)
+    api_key, request = requests[0]
+    assert api_key == 'key-a'
+    assert request.cached_content.model == 'models/gemini-2.5-flash'
+    assert request.cached_content.contents[0].parts[0].text == "profile text"
+
+def test_binding_fails_clearly_without_a_per_model_client():
+    pytest.importorskip('google.generativeai')
+
+    class ModelWithoutClient:
+        pass
+
+    with pytest.raises(RuntimeError, match="google-generativeai 0.8.x"):
+        _bind_api_client(ModelWithoutClient(), 'key')
+
+# --- GeminiClientPool ---
+
+def test_pool_reuses_one_model_per_key_and_model_name():
+    factories = FakeFactories()
+    pool = make_pool(factories, timeout=5)
+    assert pool.generate("prompt", 'key-a') == "key-a/gemini-2.5-flash reply"
+    pool.generate("prompt", 'key-a')
+    pool.generate("prompt", 'key-b')
+    pool.generate("prompt", 'key-a', model_name='other')
+    assert factories.models == [('key-a', 'gemini-2.5-flash'), ('key-b', 'gemini-2.5-flash'), ('key-a', 'other')]
+
+def test_pool_passes_the_request_timeout():
+    factories = FakeFactories()
+    pool = make_pool(factories, timeout=7)
+    model = pool.get_model('key')
+    pool.generate("prompt", 'key')
+    list(pool.generate_stream("prompt", 'key'))
+    assert [options for _, options in model.contents] == [{'timeout': 7}, {'timeout': 7}]
+
+def test_pool_spreads_calls_without_a_key_over_its_keys():
+    factories = FakeFactories()
+    pool = make_pool(factories, api_keys=['key-a', 'key-b'])
+    for _ in range(4):
+        pool.generate("prompt")
+    assert [api_key for api_key, _ in factories.models] == ['key-a', 'key-b']
+    with pytest.raises(ValueError):
+        make_pool(factories).next_api_key()
+
+def test_long_prefixes_are_cached_once_per_key_and_only_the_suffix_is_sent():
+    factories = FakeFactories()
+    pool = make_pool(factories)
+    for suffix in ("job one", "job two"):
+        assert pool.generate(PrefixedPrompt(LONG_PREFIX, suffix), 'key-a') == "key-a/gemini-2.5-flash/cached reply"
+    assert len(factories.cached_models) == 1
+    cached_model = pool.get_cached_model('key-a', LONG_PREFIX)
+    assert [contents for contents, _ in cached_model.contents] == ["job one", "job two"]
+
+def test_short_prefixes_and_failed_caches_send_the_full_prompt(capsys):
+    factories = FakeFactories()
+    make_pool(factories).generate(PrefixedPrompt("short profile", " job"), 'key-a')
+    assert factories.cached_models == []
+
+    failing = FakeFactories(cache_fails=True)
+    pool = make_pool(failing)
+    for _ in range(2):
+        pool.generate(PrefixedPrompt(LONG_PREFIX, " job"), 'key-a')
+    # The failed prefix is not tried again.
+    assert len(failing.cached_models) == 1
+    assert pool.get_model('key-a').contents[0][0] == LONG_PREFIX + " job"
+    assert "Context caching unavailable" in capsys.readouterr().out
+
+def test_api_errors_become_ai_generation_errors():
+    class FailingModel(FakeModel):
+        def generate_content(self, contents, stream=False, request_options=None):
+            raise StubAPIError(503)
+
+    pool = GeminiClientPool(model_factory=lambda api_key, model_name: FailingModel(api_key))
+    with pytest.raises(AIGenerationError) as info:
+        pool.generate("prompt", 'key')
+    assert info.value.status_code == 503 and info.value.retryable
+    assert is_retryable_error(info.value)
@@ -0,0 +1,100 @@
+"""
+Multi-job tailoring: which prompts each mode sends, how jobs are spread over API keys, and bad job files.
+"""
+import asyncio
+import json
+
+import pytest
+
+from fake_llm import RecordedGeminiClient, load_corpus
+from resume_generator.llm import MIN_CONTEXT_CACHE_TOKENS, estimate_tokens
+from resume_generator.multi_job import job_user_data, read_job_targets, run_multi_job_pipeline, run_tailoring
+from resume_generator.prompts import (JOB_FIELDS, CandidateProfile, PrefixedPrompt, build_cover_letter_prompt,
+                                      build_profile_prefix, build_resume_prompt)
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.sinks import InMemoryObjectStore, ObjectStoreSink
+
+CORPUS = {len(user_data['experiences']): user_data for user_data in load_corpus()}
+
+class KeyRecordingClient(RecordedGeminiClient):
+    """
+    RecordedGeminiClient that keeps every (prompt, api_key) it was called with.
+    """
+    def __init__(self):
+        super().__init__(latency=0)
+        self.requests = []
+
+    def __call__(self, prompt, api_key):
+        self.requests.append((prompt, api_key))
+        return super().__call__(prompt, api_key)
+
+def make_jobs(count):
+    return [(f"job-{i}", {field: CORPUS[i][field] for field in JOB_FIELDS}) for i in range(1, count + 1)]
+
+def tailor(user_data, jobs, mode, api_keys=None):
+    client = KeyRecordingClient()
+    sink = ObjectStoreSink(InMemoryObjectStore(), 'tailored')
+
+    async def run():
+        scheduler = GenerationScheduler(client=client, max_retries=0)
+        try:
+            return await run_multi_job_pipeline(user_data, jobs, scheduler, sink=sink, mode=mode, api_keys=api_keys)
+        finally:
+            scheduler.close()
+
+    return asyncio.run(run()), client.requests
+
+def test_cached_mode_sends_standard_prompts_for_short_profiles():
+    user_data = CORPUS[3]
+    assert estimate_tokens(build_profile_prefix(CandidateProfile(user_data))) < MIN_CONTEXT_CACHE_TOKENS
+    jobs = make_jobs(2)
+    entries, requests = tailor(user_data, jobs, 'cached')
+
+    assert [entry['status'] for entry in entries] == ['ok', 'ok']
+    expected = set()
+    for _, job in jobs:
+        target = job_user_data(user_data, job)
+        expected.update((build_resume_prompt(target), build_cover_letter_prompt(target)))
+    prompts = [prompt for prompt, _ in requests]
+    assert set(prompts) == expected
+    assert not any(isinstance(prompt, PrefixedPrompt) for prompt in prompts)
+
+def test_cached_mode_shares_the_prefix_of_long_profiles():
+    user_data = CORPUS[25]
+    prefix = build_profile_prefix(CandidateProfile(user_data))
+    assert estimate_tokens(prefix) >= MIN_CONTEXT_CACHE_TOKENS
+    entries, requests = tailor(user_data, make_jobs(2), 'cached')
+
+    assert [entry['status'] for entry in entries] == ['ok', 'ok']
+    assert len(requests) == 4
+    assert all(isinstance(prompt, PrefixedPrompt) and prompt.prefix == prefix for prompt, _ in requests)
+
+@pytest.mark.parametrize('mode', ['cached', 'separate'])
+def test_jobs_are_spread_over_the_api_keys(mode):
+    _, requests = tailor(CORPUS[3], make_jobs(4), mode, api_keys=['key-a', 'key-b'])
+    assert sorted(api_key for _, api_key in requests) == ['key-a'] * 4 + ['key-b'] * 4
+
+def test_malformed_job_lines_are_reported_with_path_and_line(tmp_path):
+    jobs_file = tmp_path / 'jobs.jsonl'
+    good = {field: CORPUS[1][field] for field in JOB_FIELDS}
+    jobs_file.write_text(json.dumps(good) + "\n\n{not json\n" + json.dumps(["a", "list"]) + "\n" + json.dumps(good)
+                         + "\n", encoding='utf-8')
+    targets = read_job_targets(str(jobs_file))
+
+    assert [job_id for job_id, _ in targets] == ['1', '2', '3', '4']
+    assert targets[0][1] == good and targets[3][1] == good
+    assert isinstance(targets[1][1], ValueError) and f"{jobs_file}, line 3" in str(targets[1][1])
+    assert isinstance(targets[2][1], ValueError) and f"{jobs_file}, line 4" in str(targets[2][1])
+
+def test_run_tailoring_counts_malformed_jobs_as_failed(tmp_path):
+    profile_file = tmp_path / 'profile.json'
+    profile_file.write_text(json.dumps({key: value for key, value in CORPUS[3].items() if key != 'api_key'}),
+                            encoding='utf-8')
+    jobs_file = tmp_path / 'jobs.jsonl'
+    jobs_file.write_text("{not json\n" + "".join(json.dumps(job) + "\n" for _, job in make_jobs(2)),
+                         encoding='utf-8')
+    scheduler = GenerationScheduler(client=KeyRecordingClient(), max_retries=0)
+
+    counts = run_tailoring(str(profile_file), str(jobs_file), str(tmp_path / 'out'), default_api_keys=['key'],
+                           scheduler=scheduler)
+    assert counts == {'ok': 2, 'error': 1}
@@ -0,0 +1,65 @@
+"""
+Parser and PDF output on the benchmark fixtures, compared with the builder from before the document model
+(recorded by make_render_golden.py), and streamed or pre-parsed rendering compared with whole-text rendering.
+"""
+import io
+import json
+import random
+
+import pytest
+from reportlab import Version, rl_config
+
+from fake_llm import load_recorded_responses
+from make_render_golden import GOLDEN_PATH, document_key, pdf_digest, story_digest
+from resume_generator.document import iter_text_chunks, parse_document
+from resume_generator.pdf import PDFRenderer
+
+with open(GOLDEN_PATH, encoding='utf-8') as f:
+    GOLDEN = json.load(f)
+RESPONSES = load_recorded_responses()
+DOCUMENTS = sorted(RESPONSES)
+
+@pytest.fixture(autouse=True)
+def invariant_pdfs(monkeypatch):
+    # Fixed timestamps and document IDs, so equal layouts give equal bytes.
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+
+def render_args(kind, name):
+    return RESPONSES[(kind, name)], {'your_name': name}, kind == 'cover_letter'
+
+def random_chunks(text, seed):
+    rng = random.Random(seed)
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, 200)
+        yield text[position:position + size]
+        position += size
+
+def test_golden_covers_fixtures():
+    assert sorted(GOLDEN['documents']) == sorted(document_key(*document) for document in DOCUMENTS)
+
+@pytest.mark.parametrize('kind,name', DOCUMENTS)
+def test_story_matches_reference_builder(kind, name):
+    text, user_data, is_cover_letter = render_args(kind, name)
+    flowables = list(PDFRenderer().iter_flowables(iter_text_chunks(text), user_data, is_cover_letter))
+    assert story_digest(flowables) == GOLDEN['documents'][document_key(kind, name)]['story']
+
+@pytest.mark.skipif(GOLDEN['reportlab_version'] != Version,
+                    reason="PDF bytes were recorded with another ReportLab version")
+@pytest.mark.parametrize('kind,name', DOCUMENTS)
+def test_pdf_matches_reference_builder(kind, name):
+    pdf_bytes = PDFRenderer().render_bytes(*render_args(kind, name))
+    assert pdf_digest(pdf_bytes) == GOLDEN['documents'][document_key(kind, name)]['pdf']
+
+@pytest.mark.parametrize('kind,name', DOCUMENTS)
+def test_streamed_and_parsed_rendering_match_whole_text(kind, name):
+    text, user_data, is_cover_letter = render_args(kind, name)
+    renderer = PDFRenderer()
+    expected = renderer.render_bytes(text, user_data, is_cover_letter)
+
+    streamed = io.BytesIO()
+    assert renderer.render_stream(streamed, random_chunks(text, name), user_data, is_cover_letter)
+    assert streamed.getvalue() == expected
+
+    document = parse_document(text, user_data['your_name'], is_cover_letter)
+    assert renderer.render_document_bytes(document, user_data) == expected
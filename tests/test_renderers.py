@@ -0,0 +1,129 @@
+"""
+HTML, Markdown and DOCX exports of a small resume and cover letter, compared with their expected output.
+"""
+import io
+
+import pytest
+
+from resume_generator.renderers import HTML_STYLE, check_formats, get_renderer, render_formats
+
+USER_DATA = {'your_name': "Ada Lovelace"}
+
+RESUME = """Ada Lovelace | ada@example.com | London
+
+Summary
+Engineer who ships analytical engines & <tools>.
+
+Work Experience
+Lead Engineer | Analytical Co | 1842 - 1843
+* Wrote the first program.
+* Documented the engine.
+
+Education
+BSc Mathematics | University of London | 1840
+
+Skills
+Languages: Python, Ada
+"""
+
+COVER_LETTER = """Dear Hiring Manager,
+
+I would like to apply & help.
+
+Sincerely,
+
+Ada Lovelace"""
+
+RESUME_MARKDOWN = """# Ada Lovelace
+
+ada@example.com | London
+
+## SUMMARY
+
+Engineer who ships analytical engines & <tools>.
+
+## WORK EXPERIENCE
+
+### Lead Engineer | Analytical Co
+
+*1842 - 1843*
+
+- Wrote the first program.
+- Documented the engine.
+
+## EDUCATION
+
+### BSc Mathematics
+
+University of London
+
+## SKILLS
+
+**Languages:** Python, Ada
+"""
+
+RESUME_HTML_BODY = """<h1>Ada Lovelace</h1>
+<p class="contact">ada@example.com | London</p>
+<h2>SUMMARY</h2>
+<p>Engineer who ships analytical engines &amp; &lt;tools&gt;.</p>
+<h2>WORK EXPERIENCE</h2>
+<h3>Lead Engineer | Analytical Co</h3>
+<p><i>1842 - 1843</i></p>
+<ul>
+<li>Wrote the first program.</li>
+<li>Documented the engine.</li>
+</ul>
+<h2>EDUCATION</h2>
+<h3>BSc Mathematics</h3>
+<p>University of London</p>
+<h2>SKILLS</h2>
+<p><b>Languages:</b> Python, Ada</p>"""
+
+def html_page(title, body):
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
+            f'<style>\n{HTML_STYLE}\n</style>\n</head>\n<body>\n{body}\n</body>\n</html>\n')
+
+def test_resume_markdown():
+    assert render_formats(RESUME, USER_DATA, formats=['markdown'])['markdown'].decode() == RESUME_MARKDOWN
+
+def test_resume_html():
+    html = render_formats(RESUME, USER_DATA, formats=['html'])['html'].decode()
+    assert html == html_page("Ada Lovelace - Resume", RESUME_HTML_BODY)
+
+def test_cover_letter_markdown_and_html():
+    outputs = render_formats(COVER_LETTER, USER_DATA, is_cover_letter=True, formats=['markdown', 'html'])
+    assert outputs['markdown'].decode() == ("Dear Hiring Manager,\n\nI would like to apply & help.\n\n"
+                                            "Sincerely,\n\nAda Lovelace\n")
+    assert outputs['html'].decode() == html_page("Ada Lovelace - Cover Letter", (
+        "<p>Dear Hiring Manager,</p>\n<p>I would like to apply &amp; help.</p>\n"
+        '<p class="signature">Sincerely,</p>\n<p class="signature">Ada Lovelace</p>'))
+
+def test_resume_docx():
+    docx = pytest.importorskip('docx')
+    data = render_formats(RESUME, USER_DATA, formats=['docx'])['docx']
+    paragraphs = [(p.style.name, p.text) for p in docx.Document(io.BytesIO(data)).paragraphs]
+    assert paragraphs == [
+        ('Title', "Ada Lovelace"),
+        ('Normal', "ada@example.com | London"),
+        ('Heading 1', "SUMMARY"),
+        ('Normal', "Engineer who ships analytical engines & <tools>."),
+        ('Heading 1', "WORK EXPERIENCE"),
+        ('Heading 2', "Lead Engineer | Analytical Co"),
+        ('Normal', "1842 - 1843"),
+        ('List Bullet', "Wrote the first program."),
+        ('List Bullet', "Documented the engine."),
+        ('Heading 1', "EDUCATION"),
+        ('Heading 2', "BSc Mathematics"),
+        ('Normal', "University of London"),
+        ('Heading 1', "SKILLS"),
+        ('Normal', "Languages: Python, Ada"),
+    ]
+
+def test_unknown_and_unavailable_formats(monkeypatch):
+    import importlib.util
+
+    with pytest.raises(ValueError, match="Unknown output format: 'rtf'"):
+        get_renderer('rtf')
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name: None)
+    with pytest.raises(ImportError, match=r"resume-generator\[docx\]"):
+        check_formats(['html', 'docx'])
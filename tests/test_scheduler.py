@@ -0,0 +1,186 @@
+"""
+GenerationScheduler against StubGeminiClient: retries, giving up, timeouts, rate limits and streams that
+fail part-way.
+"""
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+
+from resume_generator.cache import ResponseCache
+from resume_generator.llm import AIGenerationError
+from resume_generator.pdf import create_pdf_from_stream
+from resume_generator.scheduler import GenerationScheduler, TokenBucket
+from resume_generator.stub import StubAPIError, StubGeminiClient
+
+class ScriptedClient(StubGeminiClient):
+    """
+    Fails with the HTTP codes in `errors`, one per call, then answers normally. Records the peak number
+    of calls running at once.
+    """
+    def __init__(self, errors=(), **kwargs):
+        kwargs.setdefault('latency', 0)
+        super().__init__(**kwargs)
+        self.errors = list(errors)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, prompt):
+        if self.errors:
+            self.calls += 1
+            self.failures += 1
+            raise StubAPIError(self.errors.pop(0))
+        return super()._respond(prompt)
+
+    def __call__(self, prompt, api_key):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return super().__call__(prompt, api_key)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+class BrokenStreamClient(StubGeminiClient):
+    """
+    Streams a resume whose first attempt fails with a 503 after the first chunk.
+    """
+    def __init__(self):
+        super().__init__(latency=0)
+
+    def generate_stream(self, prompt, api_key, chunk_size=64):
+        self.calls += 1
+        yield "Summary\nPartial text line one\n"
+        if self.calls == 1:
+            raise StubAPIError(503)
+        yield "Skills\nTesting\n"
+
+def make_scheduler(client, **kwargs):
+    kwargs.setdefault('base_delay', 0.001)
+    return GenerationScheduler(client=client, **kwargs)
+
+def run(scheduler, coro):
+    try:
+        return asyncio.run(coro)
+    finally:
+        scheduler.close()
+
+@pytest.mark.parametrize('errors', [(429,), (503,), (429, 500, 503)])
+def test_retries_rate_limits_and_server_errors(errors):
+    client = ScriptedClient(errors, response_text="done")
+    scheduler = make_scheduler(client, max_retries=5)
+    assert run(scheduler, scheduler.generate("prompt", "key")) == "done"
+    assert client.calls == len(errors) + 1
+
+def test_gives_up_after_max_retries():
+    client = ScriptedClient([503] * 10)
+    scheduler = make_scheduler(client, max_retries=2)
+    with pytest.raises(AIGenerationError) as info:
+        run(scheduler, scheduler.generate("prompt", "key"))
+    assert client.calls == 3
+    assert info.value.attempts == 3
+    assert info.value.status_code == 503
+    assert info.value.retryable
+
+def test_does_not_retry_client_errors():
+    client = ScriptedClient([400])
+    scheduler = make_scheduler(client, max_retries=5)
+    with pytest.raises(AIGenerationError) as info:
+        run(scheduler, scheduler.generate("prompt", "key"))
+    assert client.calls == 1
+    assert not info.value.retryable
+
+def test_backoff_is_capped():
+    scheduler = make_scheduler(ScriptedClient(), base_delay=1.0, max_delay=2.0)
+    try:
+        assert all(0 <= scheduler.backoff_delay(attempt) <= 2.0 for attempt in range(10))
+    finally:
+        scheduler.close()
+
+def test_timeouts_keep_the_slot_until_the_call_returns():
+    client = ScriptedClient(latency=0.3)
+    scheduler = make_scheduler(client, max_in_flight=1, timeout=0.05, max_retries=3)
+    with pytest.raises(AIGenerationError, match="timed out"):
+        run(scheduler, scheduler.generate("prompt", "key"))
+    assert client.calls == 4
+    assert client.peak == 1
+
+def test_max_in_flight_is_per_key():
+    client = ScriptedClient(latency=0.1)
+    scheduler = make_scheduler(client, max_in_flight=2)
+
+    async def generate_all():
+        return await asyncio.gather(*(scheduler.generate(f"prompt {i}", key) for i in range(4) for key in "ab"))
+
+    run(scheduler, generate_all())
+    assert client.peak == 4
+
+def test_requests_per_minute_limit_waits_for_budget():
+    client = ScriptedClient()
+    scheduler = make_scheduler(client, requests_per_minute=600)
+
+    async def generate_after_draining():
+        scheduler._limits_for("key").requests.tokens = 0
+        started = time.perf_counter()
+        await scheduler.generate("prompt", "key")
+        return time.perf_counter() - started
+
+    # 600 requests a minute refill one request's budget every 0.1s.
+    assert run(scheduler, generate_after_draining()) >= 0.09
+
+def test_token_bucket_refills_at_its_rate():
+    async def drain_and_wait():
+        bucket = TokenBucket(6000)
+        await bucket.acquire(6000)
+        started = time.perf_counter()
+        await bucket.acquire(5)
+        return time.perf_counter() - started
+
+    # 6000 a minute is 100 a second, so 5 units take about 0.05s.
+    assert asyncio.run(drain_and_wait()) >= 0.04
+
+def test_cache_hit_skips_the_client():
+    client = ScriptedClient(response_text="cached")
+    cache = ResponseCache(':memory:')
+    scheduler = make_scheduler(client, cache=cache)
+
+    async def generate_twice():
+        return [await scheduler.generate("prompt", "key") for _ in range(2)]
+
+    assert run(scheduler, generate_twice()) == ["cached", "cached"]
+    assert client.calls == 1
+
+def test_stream_failing_part_way_is_retried_and_not_cached():
+    client = BrokenStreamClient()
+    cache = ResponseCache(':memory:')
+    scheduler = make_scheduler(client, cache=cache)
+    consume = lambda chunks: create_pdf_from_stream(io.BytesIO(), chunks, {'your_name': "Jane Doe"})
+
+    text, rendered = run(scheduler, scheduler.generate_streaming("prompt", "key", consume))
+    assert client.calls == 2
+    assert rendered
+    assert text == "Summary\nPartial text line one\nSkills\nTesting"
+    assert cache.get(cache.make_key(scheduler.model_name, "prompt")) == text
+
+def test_abandoned_stream_stops_feeding_consume():
+    client = StubGeminiClient(latency=1.0, response_text="x" * 640)
+    scheduler = make_scheduler(client, max_in_flight=1, timeout=0.15, max_retries=1)
+    received = []
+
+    def consume(chunks):
+        received.append(0)
+        attempt = len(received) - 1
+        for _ in chunks:
+            received[attempt] += 1
+
+    with pytest.raises(AIGenerationError, match="timed out"):
+        run(scheduler, scheduler.generate_streaming("prompt", "key", consume))
+    # Ten chunks of 0.1s each: a timed-out attempt is cut off at its next chunk instead of running to the end,
+    # which it would have reached by now.
+    time.sleep(1.2)
+    assert len(received) == 2
+    assert all(count < 10 for count in received)
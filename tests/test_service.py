@@ -0,0 +1,150 @@
+"""
+The HTTP service through its ASGI interface: submitting jobs, status, events, downloads and bad requests.
+"""
+import asyncio
+import json
+
+import pytest
+
+from fake_llm import load_corpus
+from resume_generator.scheduler import GenerationScheduler
+from resume_generator.service import create_app
+from resume_generator.sinks import InMemoryObjectStore, ObjectStoreSink
+from resume_generator.stub import StubGeminiClient
+
+RECORD = {key: value for key, value in load_corpus()[0].items() if key != 'api_key'}
+
+async def request(app, method, path, body=None):
+    """
+    Sends one HTTP request to the ASGI app. Returns (status, headers, body bytes).
+    """
+    messages = [{'type': 'http.request', 'body': body if isinstance(body, bytes) else json.dumps(body).encode(),
+                 'more_body': False}] if body is not None else [{'type': 'http.request', 'body': b''}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app({'type': 'http', 'method': method, 'path': path}, receive, send)
+    headers = dict(sent[0]['headers'])
+    return sent[0]['status'], headers, b''.join(message.get('body', b'') for message in sent[1:])
+
+async def request_json(app, method, path, body=None):
+    status, _, data = await request(app, method, path, body)
+    return status, json.loads(data)
+
+def run_app(test, **options):
+    """
+    Runs `test(app)` against a service backed by the stub client, then stops its workers.
+    """
+    scheduler = GenerationScheduler(client=StubGeminiClient(latency=0), max_retries=0)
+    options.setdefault('sink', ObjectStoreSink(InMemoryObjectStore(), 'service'))
+    app = create_app(scheduler, default_api_keys=['key'], **options)
+
+    async def main():
+        try:
+            return await test(app)
+        finally:
+            await app.service.stop()
+
+    try:
+        return asyncio.run(main())
+    finally:
+        scheduler.close()
+
+async def wait_until_finished(app, job_id):
+    for _ in range(500):
+        status, info = await request_json(app, 'GET', f"/jobs/{job_id}")
+        assert status == 200
+        if info['status'] in ('ok', 'error'):
+            return info
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+def test_submit_status_and_download():
+    async def test(app):
+        status, accepted = await request_json(app, 'POST', '/jobs', RECORD)
+        assert status == 202
+        assert accepted['status'] == 'queued'
+        assert accepted['status_url'] == f"/jobs/{accepted['job_id']}"
+
+        info = await wait_until_finished(app, accepted['job_id'])
+        assert info['status'] == 'ok', info
+        assert info['error'] is None
+        assert 'total' in info['timings']
+
+        status, headers, pdf = await request(app, 'GET', f"/jobs/{accepted['job_id']}/resume.pdf")
+        assert status == 200
+        assert headers[b'content-type'] == b'application/pdf'
+        assert pdf.startswith(b'%PDF')
+
+        status, stats = await request_json(app, 'GET', '/stats')
+        assert (status, stats['submitted'], stats['ok'], stats['queue_depth']) == (200, 1, 1, 0)
+
+    run_app(test)
+
+def test_events_stream_status_changes_until_finished():
+    async def test(app):
+        _, accepted = await request_json(app, 'POST', '/jobs', RECORD)
+        status, headers, body = await request(app, 'GET', f"/jobs/{accepted['job_id']}/events")
+        assert status == 200
+        assert headers[b'content-type'] == b'text/event-stream'
+        events = [block.split("\n") for block in body.decode().strip().split("\n\n")]
+        assert all(lines[0].startswith("event: ") and lines[1].startswith("data: ") for lines in events)
+        statuses = [json.loads(lines[1][len("data: "):])['status'] for lines in events if lines[0] == "event: status"]
+        assert statuses == ['queued', 'running', 'ok']
+
+    run_app(test)
+
+def test_exports_are_published_and_downloadable():
+    async def test(app):
+        _, accepted = await request_json(app, 'POST', '/jobs', RECORD)
+        info = await wait_until_finished(app, accepted['job_id'])
+        assert sorted(info['exports']['resume']) == ['markdown']
+        status, headers, markdown = await request(app, 'GET', f"/jobs/{accepted['job_id']}/resume.md")
+        assert status == 200
+        assert headers[b'content-type'].startswith(b'text/markdown')
+        assert markdown == b"Summary\n\nThis is a stub resume.\n\n## SKILLS\n\nTesting\n"
+
+    run_app(test, exports=['markdown'])
+
+@pytest.mark.parametrize('body,message', [
+    (b'{not json', "Expecting property name"),
+    (["a", "list"], "JSON object"),
+    ({'job_title': "Engineer"}, "your_name"),
+    ({**RECORD, 'experiences': [{'company': "Acme", 'dates': "2020"}]}, "'experiences' entry 1 is missing 'title'"),
+    ({**RECORD, 'education': ["BSc"]}, "'education' entry 1 must be an object"),
+    ({**RECORD, 'skills': [1, 2]}, "'skills' must be a list of strings"),
+])
+def test_invalid_records_are_rejected_up_front(body, message):
+    async def test(app):
+        status, error = await request_json(app, 'POST', '/jobs', body)
+        assert status == 400
+        assert message in error['error']
+        assert app.service.stats()['submitted'] == 0
+
+    run_app(test)
+
+def test_full_queue_answers_503():
+    async def test(app):
+        # No worker runs between the two submissions, so the first job still fills the queue.
+        assert (await request(app, 'POST', '/jobs', RECORD))[0] == 202
+        status, headers, _ = await request(app, 'POST', '/jobs', RECORD)
+        assert status == 503
+        assert headers[b'retry-after'] == b'1'
+        assert app.service.stats()['rejected'] == 1
+
+    run_app(test, max_queue=1)
+
+def test_unknown_paths_methods_and_jobs():
+    async def test(app):
+        assert await request_json(app, 'GET', '/healthz') == (200, {'status': 'ok'})
+        assert (await request(app, 'GET', '/jobs/missing'))[0] == 404
+        assert (await request(app, 'GET', '/nowhere'))[0] == 404
+        assert (await request(app, 'DELETE', '/jobs'))[0] == 405
+        assert (await request(app, 'POST', '/jobs', b'x' * (1024 * 1024 + 1)))[0] == 413
+
+    run_app(test)
@@ -0,0 +1,91 @@
+"""
+Output sinks: ZipArchiveSink keeping earlier documents across reopening and crashes, and contains().
+"""
+import io
+import os
+import subprocess
+import sys
+import zipfile
+
+from resume_generator.sinks import LocalDirectorySink, ZipArchiveSink
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def archive_members(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+def test_reopened_archive_keeps_earlier_documents(tmp_path):
+    target = str(tmp_path / 'out.zip')
+    sink = ZipArchiveSink(target)
+    sink.write('a.pdf', b'first a')
+    sink.write('b.pdf', b'first b')
+    sink.close()
+
+    sink = ZipArchiveSink(target)
+    sink.write('b.pdf', b'second b')
+    sink.write('c.pdf', b'second c')
+    sink.close()
+
+    # Rewritten documents replace the earlier copy instead of adding a duplicate member.
+    with zipfile.ZipFile(target) as archive:
+        assert sorted(archive.namelist()) == ['a.pdf', 'b.pdf', 'c.pdf']
+    assert archive_members(target) == {'a.pdf': b'first a', 'b.pdf': b'second b', 'c.pdf': b'second c'}
+    assert not os.path.exists(f"{target}.partial")
+
+def test_interrupted_write_leaves_the_previous_archive_intact(tmp_path):
+    target = str(tmp_path / 'out.zip')
+    sink = ZipArchiveSink(target)
+    sink.write('a.pdf', b'first a')
+    sink.close()
+
+    # A process killed before close(): the new documents only reached the partial file.
+    crash = ("import os, sys; from resume_generator.sinks import ZipArchiveSink; "
+             "sink = ZipArchiveSink(sys.argv[1]); sink.write('b.pdf', b'lost b'); os._exit(1)")
+    subprocess.run([sys.executable, '-c', crash, target], cwd=ROOT_DIR, check=False)
+    assert os.path.exists(f"{target}.partial")
+    assert archive_members(target) == {'a.pdf': b'first a'}
+
+    sink = ZipArchiveSink(target)
+    assert sink.contains(f"{target}:a.pdf")
+    assert not sink.contains(f"{target}:b.pdf")
+    sink.write('b.pdf', b'second b')
+    sink.close()
+    assert archive_members(target) == {'a.pdf': b'first a', 'b.pdf': b'second b'}
+
+def test_unreadable_archive_is_replaced(tmp_path, capsys):
+    target = tmp_path / 'out.zip'
+    target.write_bytes(b'not a zip archive')
+    sink = ZipArchiveSink(str(target))
+    sink.write('a.pdf', b'a')
+    sink.close()
+    assert "not a readable zip archive" in capsys.readouterr().out
+    assert archive_members(str(target)) == {'a.pdf': b'a'}
+
+def test_zip_contains_reflects_archive_members(tmp_path):
+    target = str(tmp_path / 'out.zip')
+    sink = ZipArchiveSink(target)
+    location = sink.write('a.pdf', b'a')
+    assert sink.contains(location)
+    assert not sink.contains(f"{target}:missing.pdf")
+    assert not sink.contains(str(tmp_path / 'a.pdf'))
+    sink.close()
+
+    reopened = ZipArchiveSink(target)
+    assert reopened.contains(location)
+    reopened.close()
+
+def test_zip_to_a_file_object():
+    buffer = io.BytesIO()
+    sink = ZipArchiveSink(buffer)
+    assert sink.write('a.pdf', b'a') == "archive:a.pdf"
+    sink.close()
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as archive:
+        assert archive.read('a.pdf') == b'a'
+
+def test_local_directory_contains_written_files(tmp_path):
+    sink = LocalDirectorySink(str(tmp_path / 'out'))
+    location = sink.write('a.pdf', b'a')
+    assert sink.contains(location)
+    assert sink.read(location) == b'a'
+    assert not sink.contains(str(tmp_path / 'out' / 'missing.pdf'))
@@ -0,0 +1,109 @@
+"""
+Telemetry exporters: the JSON log lines and the Prometheus text exposition, with a fixed clock.
+"""
+import io
+import itertools
+import json
+
+import pytest
+
+from resume_generator import telemetry
+from resume_generator.telemetry import JSONLogExporter, PrometheusExporter
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    # Each reading is 0.25 ms after the previous one.
+    ticks = itertools.count(1_000_000_000, 250_000)
+    monkeypatch.setattr(telemetry.time, 'time_ns', lambda: next(ticks))
+    yield
+    telemetry.configure()
+
+def record_events():
+    with telemetry.span('generate', kind='resume'):
+        with telemetry.span('ai.request', attempt=1):
+            pass
+    telemetry.count('ai_retries', kind='resume')
+    telemetry.count('ai_retries', kind='resume')
+    telemetry.count('cache_lookups', result='hit')
+    telemetry.observe('pdf_bytes', 1500, kind='resume')
+    telemetry.observe('pdf_bytes', 500, kind='resume')
+    telemetry.observe('service_job_seconds', 0.5)
+
+def test_json_log_lines():
+    stream = io.StringIO()
+    telemetry.configure(JSONLogExporter(stream))
+    record_events()
+    inner, outer, *metrics = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    # Spans are written as they finish, so the inner one comes first.
+    assert inner['trace_id'] == outer['trace_id'] and inner['parent_id'] == outer['span_id']
+    for span in (inner, outer):
+        del span['trace_id'], span['span_id'], span['parent_id']
+    assert inner == {'type': 'span', 'name': 'ai.request', 'start_ns': 1_000_250_000, 'end_ns': 1_000_500_000,
+                     'duration_s': 0.00025, 'attributes': {'attempt': 1}, 'error': None}
+    assert outer == {'type': 'span', 'name': 'generate', 'start_ns': 1_000_000_000, 'end_ns': 1_000_750_000,
+                     'duration_s': 0.00075, 'attributes': {'kind': 'resume'}, 'error': None}
+    assert metrics == [
+        {'type': 'counter', 'name': 'ai_retries', 'value': 1, 'labels': {'kind': 'resume'}, 'time_ns': 1_001_000_000},
+        {'type': 'counter', 'name': 'ai_retries', 'value': 1, 'labels': {'kind': 'resume'}, 'time_ns': 1_001_250_000},
+        {'type': 'counter', 'name': 'cache_lookups', 'value': 1, 'labels': {'result': 'hit'}, 'time_ns': 1_001_500_000},
+        {'type': 'observation', 'name': 'pdf_bytes', 'value': 1500, 'labels': {'kind': 'resume'},
+         'time_ns': 1_001_750_000},
+        {'type': 'observation', 'name': 'pdf_bytes', 'value': 500, 'labels': {'kind': 'resume'},
+         'time_ns': 1_002_000_000},
+        {'type': 'observation', 'name': 'service_job_seconds', 'value': 0.5, 'labels': {}, 'time_ns': 1_002_250_000},
+    ]
+
+def test_json_log_records_span_errors():
+    stream = io.StringIO()
+    telemetry.configure(JSONLogExporter(stream))
+    with pytest.raises(ValueError):
+        with telemetry.span('parse'):
+            raise ValueError("bad text")
+    assert json.loads(stream.getvalue())['error'] == "ValueError: bad text"
+
+def test_json_log_appends_to_a_path(tmp_path):
+    path = tmp_path / 'telemetry.jsonl'
+    path.write_text('{"type": "earlier"}\n', encoding='utf-8')
+    telemetry.configure(JSONLogExporter(str(path)))
+    telemetry.count('batch_records', status='ok')
+    telemetry.configure()
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['type'] for line in lines] == ['earlier', 'counter']
+
+def test_prometheus_exposition():
+    exporter = PrometheusExporter()
+    telemetry.configure(exporter)
+    record_events()
+    assert exporter.render() == """\
+# TYPE resume_generator_ai_retries_total counter
+resume_generator_ai_retries_total{kind="resume"} 2
+# TYPE resume_generator_cache_lookups_total counter
+resume_generator_cache_lookups_total{result="hit"} 1
+# TYPE resume_generator_pdf_bytes summary
+resume_generator_pdf_bytes_count{kind="resume"} 2
+resume_generator_pdf_bytes_sum{kind="resume"} 2000
+# TYPE resume_generator_service_job_seconds summary
+resume_generator_service_job_seconds_count 1
+resume_generator_service_job_seconds_sum 0.5
+# TYPE resume_generator_stage_seconds summary
+resume_generator_stage_seconds_count{stage="ai.request"} 1
+resume_generator_stage_seconds_sum{stage="ai.request"} 0.00025
+resume_generator_stage_seconds_count{stage="generate"} 1
+resume_generator_stage_seconds_sum{stage="generate"} 0.00075
+"""
+
+def test_prometheus_escapes_label_values():
+    exporter = PrometheusExporter(prefix='app')
+    telemetry.configure(exporter)
+    telemetry.count('export_failures', format='a"b\\c\nd')
+    assert exporter.render() == ('# TYPE app_export_failures_total counter\n'
+                                 'app_export_failures_total{format="a\\"b\\\\c\\nd"} 1\n')
+
+def test_nothing_is_recorded_without_exporters():
+    telemetry.configure()
+    assert not telemetry.enabled()
+    with telemetry.span('generate') as span:
+        span.set_attribute('ignored', True)
+    telemetry.count('ai_retries')
+    assert telemetry.get_telemetry() is None